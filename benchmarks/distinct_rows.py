@@ -0,0 +1,93 @@
+""" Distinct rows' latency per data handler, group by over all columns vs the shared distinct rows primitive.
+
+Usage:
+    python -m benchmarks.distinct_rows [--repeat 5] [--scale 10]
+
+"before" is the former idiom df.groupby([*df.columns])[column].unique().keys() which the handlers used just to iterate
+distinct rows, "after" is DataHandler._get_distinct_rows. both get measured on the data frames which every handler's
+method iterates, built of the mocked json fixtures of the data handlers' tests whose records get repeated --scale
+times, & both results get verified to be the same rows by the same order.
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+from benchmarks.factory_latency import FIXTURES, JSON_FILES_DIR
+from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
+from covid19_il.data_handler.enums.resource_id import ResourceId
+
+# handler's method: the resource & the data frame which the method iterates
+CASES = {
+    "AgeGender.statistics_by_gender": (ResourceId.AGE_GENDER_DATA_RESOURCE_ID, lambda handler: handler.df),
+    "Cities.cities_by_date": (ResourceId.CITIES_POPULATION_RESOURCE_ID,
+                              lambda handler: handler._get_df_data_by_date("Date", "2020-10-03")),
+    "LabTests.tests_results_data_by_test_date": (ResourceId.LAB_TESTS_RESOURCE_ID,
+                                                 lambda handler: handler.df),
+    "TestedIndividualsScores.get_statistics_by_date": (ResourceId.TESTED_INDIVIDUALS_SCORES_RESOURCE_ID,
+                                                       lambda handler: handler.df),
+    "Hospitalized.hospitalized_total_stats": (ResourceId.HOSPITALIZED_DATA_RESOURCE_ID, lambda handler: handler.df)
+}
+
+
+def get_distinct_rows_by_group_by(df: pd.DataFrame) -> List:
+    """ Former idiom: group by over all of the columns just for the groups' keys """
+    return list(df.groupby([*df.columns])[df.columns[0]].unique().keys())
+
+
+def measure(get_rows: Callable[[pd.DataFrame], List], df: pd.DataFrame, repeat: int) -> float:
+    """ Returns the median latency in milliseconds of getting the distinct rows """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        get_rows(df)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+
+def create_data_handler(required_resource_id: ResourceId, scale: int) -> DataHandler:
+    """ Returns the data handler of the resource's fixture whose records get repeated scale times """
+    with open(os.path.join(JSON_FILES_DIR, FIXTURES[required_resource_id]), encoding="utf-8") as json_file:
+        json_data = json.load(json_file)
+    json_data["result"]["records"] = json_data["result"]["records"] * scale
+
+    return DataHandlerFactory._create_data_handler(required_resource_id, json_data)
+
+
+def run(repeat: int, scale: int) -> List[Dict]:
+    """ Measures the distinct rows' latency of every handler's method & returns the rows of results """
+    rows = []
+    for method_name, (required_resource_id, get_df) in CASES.items():
+        data_handler = create_data_handler(required_resource_id, scale)
+        df = get_df(data_handler)
+        if get_distinct_rows_by_group_by(df) != data_handler._get_distinct_rows(df):
+            raise AssertionError(f"{method_name}: the distinct rows differ from the group by's keys")
+
+        before = measure(get_distinct_rows_by_group_by, df, repeat)
+        after = measure(data_handler._get_distinct_rows, df, repeat)
+        rows.append({"method": method_name, "rows": len(df), "before_ms": before, "after_ms": after,
+                     "speedup": before / after if after else float("inf")})
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per method, the median is reported")
+    parser.add_argument("--scale", type=int, default=10, help="repetitions of the fixtures' records")
+    args = parser.parse_args()
+
+    print(f"{'method':<50}{'rows':>8}{'before(ms)':>12}{'after(ms)':>12}{'speedup':>10}")
+    for row in run(args.repeat, args.scale):
+        print(f"{row['method']:<50}{row['rows']:>8}{row['before_ms']:>12.2f}{row['after_ms']:>12.2f}"
+              f"{row['speedup']:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+""" Data handlers factory's latency per data resource, eager vs lazy handler construction.
+
+Usage:
+    python -m benchmarks.factory_latency [--repeat 5]
+
+"before" builds the former eager switch case which instantiated all 12 data handlers' classes on the same json data
+just to return one of them, "after" is the factory's lazy class registry which instantiates only the required one.
+both get measured on the mocked json fixtures of the data handlers' tests.
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from covid19_il.logger.logger import Logger
+from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
+from covid19_il.data_handler.enums.resource_id import ResourceId
+
+JSON_FILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "tests", "data_handler",
+                              "json_files")
+
+FIXTURES = {
+    ResourceId.AREA_RESOURCE_ID: "area_mocked_data.json",
+    ResourceId.QUARANTINE_RESOURCE_ID: "quarantine_mocked_data.json",
+    ResourceId.LAB_TESTS_RESOURCE_ID: "lab_tests_mocked_data.json",
+    ResourceId.TESTED_INDIVIDUALS_RESOURCE_ID: "tested_individuals_mocked_data.json",
+    ResourceId.TESTED_INDIVIDUALS_SCORES_RESOURCE_ID: "tested_individuals_scores_mocked_data.json",
+    ResourceId.RECOVERED_RESOURCE_ID: "recovered_mocked_data.json",
+    ResourceId.HOSPITALIZED_DATA_RESOURCE_ID: "hospitalized_mocked_data.json",
+    ResourceId.AGE_GENDER_DATA_RESOURCE_ID: "age_gender_mocked_data.json",
+    ResourceId.MEDICAL_STAFF_MORBIDITY_RESOURCE_ID: "medical_staff_morbidity_mocked_data.json",
+    ResourceId.DEATHS_DATA_RESOURCE_ID: "deaths_mocked_data.json",
+    ResourceId.YOUNG_POPULATION_RESOURCE_ID: "young_population_mocked_data.json",
+    ResourceId.CITIES_POPULATION_RESOURCE_ID: "cities_mocked_data.json"
+}
+
+
+def create_data_handler_eagerly(required_resource_id: ResourceId, json_data: Dict) -> DataHandler or None:
+    """ Former factory's behaviour: instantiates every data handler's class and returns the required one """
+    logger = Logger().logger
+    switch_case = {value: data_handler_class(logger, json_data)
+                   for value, data_handler_class in DataHandlerFactory.data_handlers_classes.items()}
+    return switch_case.get(required_resource_id.value)
+
+
+def measure(create: Callable[[ResourceId, Dict], DataHandler], required_resource_id: ResourceId, json_data: Dict,
+            repeat: int) -> float:
+    """ Returns the median latency in milliseconds of creating the required data handler """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        create(required_resource_id, json_data)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+
+def run(repeat: int) -> List[Dict]:
+    """ Measures the factory's latency of every data resource & returns the rows of results """
+    rows = []
+    for required_resource_id, file_name in FIXTURES.items():
+        with open(os.path.join(JSON_FILES_DIR, file_name), encoding="utf-8") as json_file:
+            json_data = json.load(json_file)
+
+        before = measure(create_data_handler_eagerly, required_resource_id, json_data, repeat)
+        after = measure(DataHandlerFactory._create_data_handler, required_resource_id, json_data, repeat)
+        rows.append({"resource": required_resource_id.name, "before_ms": before, "after_ms": after,
+                     "speedup": before / after if after else float("inf")})
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per resource, the median is reported")
+    args = parser.parse_args()
+
+    print(f"{'resource':<40}{'before(ms)':>12}{'after(ms)':>12}{'speedup':>10}")
+    for row in run(args.repeat):
+        print(f"{row['resource']:<40}{row['before_ms']:>12.2f}{row['after_ms']:>12.2f}{row['speedup']:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+""" Benchmark suite of every data handler's construction & public methods plus the api client, by fixture scale.
+
+Usage:
+    python -m benchmarks.suite [--scales 1 10 100] [--repeat 5] [--history benchmarks/history.json]
+                               [--threshold 1.25] [--no-record]
+
+every data resource's dataset gets synthesized out of the mocked json fixtures of the data handlers' tests, whose
+records get repeated scale times(with new CKAN's _id values). per scale it measures the median latency of:
+    - constructing each of the 12 data handlers.
+    - each data handler's public method, with an empty result cache & its result fully iterated. the methods which
+      change the handler's data(append_records, set_censoring_policy) run on a fresh handler per measurement.
+    - ApiDataIL's requests of a data resource against a local StubCkanServer.
+
+the medians(null for a failed case) get appended with the commit's id to a json history file, & a measurement which
+got slower than the previous run's by more than the threshold ratio is reported as a regression(the exit code is 1).
+"""
+import argparse
+import inspect
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+import pandas as pd
+
+import covid19_il.api_handler.consts as api_consts
+from benchmarks.factory_latency import FIXTURES, JSON_FILES_DIR
+from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
+from covid19_il.data_handler.enums.area_event import AreaEvent
+from covid19_il.data_handler.enums.censoring_policy import CensoringPolicy
+from covid19_il.data_handler.enums.column_type import ColumnType
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+from covid19_il.testing.stub_ckan_server import StubCkanServer
+
+DEFAULT_HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.json")
+
+# methods which change the handler's data, so every measurement gets a fresh handler
+MUTATING_METHODS = ("append_records", "set_censoring_policy")
+
+# a slower measurement is a regression only when it's also slower by at least this amount of milliseconds
+MIN_REGRESSION_MS = 0.5
+
+API_RESOURCE_ID = ResourceId.LAB_TESTS_RESOURCE_ID
+
+
+def load_json_data(required_resource_id: ResourceId, scale: int) -> Dict:
+    """ Returns the resource's fixture json data whose records get repeated scale times, with new _id values """
+    with open(os.path.join(JSON_FILES_DIR, FIXTURES[required_resource_id]), encoding="utf-8") as json_file:
+        json_data = json.load(json_file)
+
+    records = json_data["result"]["records"]
+    json_data["result"]["records"] = [{**record, "_id": _id}
+                                      for _id, record in enumerate(records * scale, start=1)]
+    if "total" in json_data["result"]:
+        json_data["result"]["total"] = len(json_data["result"]["records"])
+
+    return json_data
+
+
+def create_data_handler(logger: Logger.logger, required_resource_id: ResourceId, json_data: Dict) -> DataHandler:
+    """ Returns a new data handler of the resource, the same one which the factory creates """
+    return DataHandlerFactory.data_handlers_classes[required_resource_id.value](logger, json_data)
+
+
+def consume(result: Any) -> Any:
+    """ Iterates a method's generator result to its end, so its whole computation gets measured """
+    return list(result) if inspect.isgenerator(result) else result
+
+
+def measure(name: str, run: Callable[[Any], Any], setup: Callable[[], Any], repeat: int) -> float or None:
+    """ Returns the median latency in milliseconds of run, whose argument is setup's untimed result, or None when
+    the case fails """
+    timings = []
+    for _ in range(repeat):
+        argument = setup()
+        start = time.perf_counter()
+        try:
+            run(argument)
+        except Exception as e:
+            print(f"{name} failed: {e!r}", file=sys.stderr)
+            return None
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+
+def get_public_methods(data_handler_class: type) -> List[str]:
+    """ Returns the names of the data handler class' public methods """
+    return sorted(name for name, _ in inspect.getmembers(data_handler_class, inspect.isfunction)
+                  if not name.startswith("_"))
+
+
+def get_method_arguments(data_handler: DataHandler, method_name: str, json_data: Dict) -> Dict[str, Any]:
+    """ Returns the keyword arguments of a data handler's method by its parameters' names.
+
+    Note:
+        a date parameter gets the middle date of the resource's main date column, the rest of the parameters with a
+        default value keep it.
+    """
+    date = None
+    if data_handler.date_column_name is not None:
+        dates = data_handler._get_typed_column(data_handler.date_column_name, ColumnType.DATE).dropna()
+        date = dates.sort_values().iloc[len(dates) // 2].strftime("%Y-%m-%d") if len(dates) else None
+
+    arguments_by_parameter = {"date": date, "date_string": date, "week_day": date,
+                              "event_type": AreaEvent.NEW_CASES_ON_DATE,
+                              "censoring_policy": CensoringPolicy.MIDPOINT,
+                              "records": json_data["result"]["records"][:100]}
+    parameters = inspect.signature(getattr(data_handler, method_name)).parameters
+    return {name: arguments_by_parameter[name] for name in parameters if name in arguments_by_parameter}
+
+
+def run_data_handlers(logger: Logger.logger, scale: int, repeat: int) -> Dict[str, float or None]:
+    """ Measures every data handler's construction & public methods at given scale """
+    results = {}
+    for required_resource_id in FIXTURES:
+        json_data = load_json_data(required_resource_id, scale)
+        data_handler_class = DataHandlerFactory.data_handlers_classes[required_resource_id.value]
+        class_name = data_handler_class.__name__
+
+        name = f"{scale}x/{class_name}.__init__"
+        results[name] = measure(name, lambda _: create_data_handler(logger, required_resource_id, json_data),
+                                lambda: None, repeat)
+
+        data_handler = create_data_handler(logger, required_resource_id, json_data)
+        for method_name in get_public_methods(data_handler_class):
+            if method_name == "get_data_by_date_range" and data_handler.date_column_name is None:
+                # the data resource has no date column to query by
+                continue
+            arguments = get_method_arguments(data_handler, method_name, json_data)
+            if method_name in MUTATING_METHODS:
+                setup = lambda: create_data_handler(logger, required_resource_id, json_data)
+            else:
+                setup = lambda: data_handler.result_cache.clear() or data_handler
+
+            name = f"{scale}x/{class_name}.{method_name}"
+            results[name] = measure(name, lambda handler: consume(getattr(handler, method_name)(**arguments)),
+                                    setup, repeat)
+
+    return results
+
+
+def run_api_client(logger: Logger.logger, scale: int, repeat: int) -> Dict[str, float or None]:
+    """ Measures ApiDataIL's requests of a data resource at given scale against the stub CKAN server """
+    json_data = load_json_data(API_RESOURCE_ID, scale)
+    page_size = api_consts.DEFAULT_PAGE_SIZE
+    cases = {
+        "fetch": lambda api_data_il: api_data_il.fetch(API_RESOURCE_ID, limit=page_size),
+        "get_data_by_resource_id": lambda api_data_il: api_data_il.get_data_by_resource_id(API_RESOURCE_ID,
+                                                                                           limit=page_size),
+        "stream_data_frame": lambda api_data_il: api_data_il.stream_data_frame(API_RESOURCE_ID, limit=page_size),
+        "get_total_records": lambda api_data_il: api_data_il.get_total_records(API_RESOURCE_ID),
+        "iter_all_records": lambda api_data_il: consume(api_data_il.iter_all_records(API_RESOURCE_ID, page_size)),
+        "iter_all_records(max_workers=4)": lambda api_data_il: consume(
+            api_data_il.iter_all_records(API_RESOURCE_ID, page_size, max_workers=4))
+    }
+
+    results = {}
+    stub_ckan_server = StubCkanServer()
+    stub_ckan_server.add_resource(API_RESOURCE_ID, json_data)
+    with stub_ckan_server:
+        with ApiDataIL(logger, base_url=stub_ckan_server.base_url) as api_data_il:
+            for case_name, run in cases.items():
+                name = f"{scale}x/ApiDataIL.{case_name}"
+                results[name] = measure(name, run, lambda: api_data_il, repeat)
+
+    return results
+
+
+def get_commit() -> str:
+    """ Returns the git commit's id of the working tree, with a -dirty suffix for uncommitted changes """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+        changes = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True,
+                                 text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return f"{commit}-dirty" if changes else commit
+
+
+def load_history(history_path: str) -> List[Dict]:
+    """ Returns the former runs of the json history file, or an empty history """
+    if not os.path.exists(history_path):
+        return []
+    with open(history_path, encoding="utf-8") as history_file:
+        return json.load(history_file)
+
+
+def find_regressions(results: Dict[str, float or None], previous_results: Dict[str, float or None],
+                     threshold: float) -> Dict[str, Tuple[float, float]]:
+    """ Returns the measurements which got slower than the previous ones: name: (previous ms, current ms) """
+    return {name: (previous_results[name], result) for name, result in results.items()
+            if result is not None and previous_results.get(name) is not None
+            and result > previous_results[name] * threshold and result - previous_results[name] >= MIN_REGRESSION_MS}
+
+
+def run(scales: List[int], repeat: int) -> Dict[str, float or None]:
+    """ Measures the data handlers & the api client at every scale & returns the medians by measurement's name """
+    logger = Logger().logger
+    logging_level = logger.level
+    # the console's & log file's I/O of the debug & info records isn't measured
+    logger.setLevel(logging.WARNING)
+    try:
+        results = {}
+        for scale in scales:
+            results.update(run_data_handlers(logger, scale, repeat))
+            results.update(run_api_client(logger, scale, repeat))
+    finally:
+        logger.setLevel(logging_level)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100], help="repetitions of the fixtures")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per case, the median is reported")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_PATH, help="json history file of the former runs")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown ratio from the previous run which is reported as a regression")
+    parser.add_argument("--no-record", action="store_true", help="don't append this run to the history")
+    args = parser.parse_args()
+
+    results = run(args.scales, args.repeat)
+    history = load_history(args.history)
+    previous_commit, previous_results = (history[-1]["commit"], history[-1]["results"]) if history else (None, {})
+    regressions = find_regressions(results, previous_results, args.threshold)
+
+    print(f"{'benchmark':<70}{'previous(ms)':>14}{'current(ms)':>14}")
+    for name, result in results.items():
+        previous, current = (f"{'-':>14}" if value is None else f"{value:>14.2f}"
+                             for value in (previous_results.get(name), result))
+        print(f"{name:<70}{previous}{current}{'  REGRESSION' if name in regressions else ''}")
+
+    if not args.no_record:
+        history.append({"commit": get_commit(), "timestamp": datetime.now().isoformat(timespec="seconds"),
+                        "python": platform.python_version(), "pandas": pd.__version__,
+                        "scales": args.scales, "repeat": args.repeat, "results": results})
+        with open(args.history, "w", encoding="utf-8") as history_file:
+            json.dump(history, history_file, indent=2)
+
+    if regressions:
+        print(f"{len(regressions)} regressions above {args.threshold}x of the previous run({previous_commit})")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,32 +1,97 @@
+import json
+import pandas as pd
 import requests
-from requests.exceptions import (HTTPError, SSLError, InvalidURL, ConnectTimeout, ConnectionError, Timeout,
-                                 RequestException, MissingSchema)
-from typing import Dict
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout, RequestException
+from threading import Lock, RLock
+from typing import Any, Dict, Generator, Iterable, List, Tuple
+from urllib.parse import urlparse, parse_qs, quote
 
+from covid19_il.api_handler.circuit_breaker import CircuitBreaker
+from covid19_il.api_handler.exceptions import (ApiRequestError, ApiHttpError, ApiThrottledError, ApiConnectionError,
+                                               CircuitOpenError)
 from covid19_il.api_handler.iapi_handler import IAPIHandler
+from covid19_il.api_handler.records_stream import RecordsStreamParser, records_to_data_frame
+from covid19_il.api_handler.response_cache import ResponseCache
+from covid19_il.api_handler.retry_policy import RetryPolicy
 from covid19_il.logger.logger import Logger
+from covid19_il.metrics.metrics import Metrics, timed
+from covid19_il.profiling.profiler import profiled_method
 from covid19_il.data_handler.enums.resource_id import ResourceId
 import covid19_il.api_handler.consts as api_consts
+import covid19_il.metrics.consts as metrics_consts
 
 
 class ApiDataIL(IAPIHandler):
     """ API Client for Israeli Government Covid19 Data
 
+    Note:
+        fetch's method is stateless & returns an immutable response, so one shared client can serve concurrent
+        fetches of a thread pool. the legacy get_data_by_resource_id's method keeps the last request's state on the
+        instance, guarded by a lock. failed requests get retried by the retry policy, & every host has a circuit
+        breaker which rejects requests without sending them after consecutive failures. a request which still failed
+        raises a typed ApiRequestError, except for fetch's method which returns it as a response without json data.
+
     Attributes:
         _logger(Logger.logger): Api Data IL instance's actions logger.
-        _base_url(str): base url of Israel Data gov API.
-        _url_query(str): final url query for http get request
-        _json_data(dict): http get request's results dictionary
-        _request_status(int): http get request's results status
+        _base_url(str): base url of Israel Data gov API, or of a stand-in such as a local StubCkanServer.
+        _url_query(str): last url query of the legacy http get request
+        _json_data(dict): last legacy http get request's results dictionary
+        _request_status(int): last legacy http get request's results status
+        _lock(RLock): guards the legacy request's state.
+        _timeout(Tuple[float, float]): (connect, read) timeouts of each http get request in seconds.
+        _session(requests.Session): persistent http session with pooled keep-alive connections.
+        _cache(ResponseCache): optional on-disk cache of http get requests' results.
+        _revalidate_metadata(bool): whether stale cached results get revalidated by CKAN resource's metadata_modified.
+        _retry_policy(RetryPolicy): retries' policy of failed requests.
+        _circuit_failure_threshold(int): consecutive failures which open a host's circuit breaker.
+        _circuit_reset_timeout(float): seconds which a host's circuit breaker stays open before a trial request.
+        _circuit_breakers(Dict[str, CircuitBreaker]): host: its circuit breaker.
+        _circuit_breakers_lock(Lock): guards the circuit breakers' creation only, so concurrent requests never wait
+            for the legacy request's lock.
+        response(namedtuple): class attribute - immutable result of a fetch.
     """
 
-    def __init__(self, logger) -> None:
+    response = namedtuple("ApiResponse", ("url_query", "json_data", "status", "elapsed", "size"))
+
+    def __init__(self,
+                 logger,
+                 pool_size: int = api_consts.DEFAULT_POOL_SIZE,
+                 timeout: Tuple[float, float] = api_consts.DEFAULT_TIMEOUT,
+                 cache: ResponseCache = None,
+                 revalidate_metadata: bool = False,
+                 base_url: str = api_consts.API_DATA_GOV_IL_URL,
+                 retry_policy: RetryPolicy = None,
+                 circuit_failure_threshold: int = api_consts.DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+                 circuit_reset_timeout: float = api_consts.DEFAULT_CIRCUIT_RESET_TIMEOUT) -> None:
         self._logger = logger
         self._logger.info("Created ApiDataIL API Client")
-        self._base_url = api_consts.API_DATA_GOV_IL_URL
+        self._base_url = base_url.rstrip("/")
         self._url_query = None
         self._json_data = None
         self._request_status = None
+        self._lock = RLock()
+        self._timeout = timeout
+        self._session = self._create_session(pool_size)
+        self._cache = cache
+        self._revalidate_metadata = revalidate_metadata
+        self._retry_policy = RetryPolicy() if retry_policy is None else retry_policy
+        self._circuit_failure_threshold = circuit_failure_threshold
+        self._circuit_reset_timeout = circuit_reset_timeout
+        self._circuit_breakers = {urlparse(self._base_url).netloc: CircuitBreaker(circuit_failure_threshold,
+                                                                                  circuit_reset_timeout)}
+        self._circuit_breakers_lock = Lock()
+
+    def __enter__(self) -> 'ApiDataIL':
+        """ Returns the Client itself as a Context Manager """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """ Closes the Client's Session when leaving the Context Manager """
+        self.close()
 
     def __repr__(self) -> str:
         """ Returns Class Representation """
@@ -34,7 +99,7 @@ class ApiDataIL(IAPIHandler):
 
     def __bool__(self) -> bool:
         """ Returns Class Truth Value """
-        return self._base_url is not None and len(self._base_url) == 19
+        return self._base_url.startswith(("http://", "https://"))
 
     @property
     def logger(self) -> Logger.logger:
@@ -46,6 +111,26 @@ class ApiDataIL(IAPIHandler):
         """ str: api's base url """
         return self._base_url
 
+    @property
+    def session(self) -> requests.Session:
+        """ requests.Session: Returns the persistent http session of the client """
+        return self._session
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """ Tuple[float, float]: Returns (connect, read) timeouts of each http get request in seconds """
+        return self._timeout
+
+    @property
+    def cache(self) -> ResponseCache:
+        """ ResponseCache: Returns the on-disk cache of http get requests' results or None """
+        return self._cache
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """ RetryPolicy: Returns the retries' policy of failed requests """
+        return self._retry_policy
+
     @property
     def url_query(self) -> str:
         """ str: Returns a string of the final url query for http get request.
@@ -56,7 +141,7 @@ class ApiDataIL(IAPIHandler):
     def url_query(self, required_url_query: str) -> None:
         if required_url_query is not None and isinstance(required_url_query, str):
             self._url_query = required_url_query
-            self._logger.debug(f"url query is: {self._url_query}")
+            self._logger.debug("url query is: %s", self._url_query)
 
         else:
             self._logger.exception(f"Wrong Type - {type(required_url_query)} is not a string")
@@ -72,7 +157,9 @@ class ApiDataIL(IAPIHandler):
     def json_data(self, fetched_json_data: dict) -> None:
         if fetched_json_data is not None and isinstance(fetched_json_data, dict):
             self._json_data = fetched_json_data
-            self._logger.debug(f"json data is : {self._json_data}")
+            # the payload's size rather than the payload, which formatting would cost as much as its parsing
+            self._logger.debug("json data has %d records",
+                               len((fetched_json_data.get("result") or {}).get("records") or ()))
 
         else:
             self._logger.exception(f"Wrong Type - {type(fetched_json_data)} is not a json data dict")
@@ -83,6 +170,298 @@ class ApiDataIL(IAPIHandler):
         """ int: Returns an integer of http get request's results status. """
         return self._request_status
 
+    def _create_session(self, pool_size: int) -> requests.Session:
+        """ Create a persistent http session which keeps pooled connections alive between requests.
+        Note:
+            private method which get called by the constructor.
+        Args:
+            pool_size(int): max amount of pooled connections per host.
+
+        Returns:
+            session(requests.Session): http session with gzip negotiation & keep-alive headers.
+
+        Raises:
+            ValueError: pool size isn't positive.
+        """
+
+        if pool_size < 1:
+            self._logger.exception(f"Wrong Pool Size - {pool_size} is not a positive integer")
+            raise ValueError("Wrong Pool Size - not a positive integer")
+
+        session = requests.Session()
+        session.headers.update(api_consts.SESSION_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
+    def close(self) -> None:
+        """ Close the client's http session and release its pooled connections. """
+        self._session.close()
+        self._logger.info("Closed ApiDataIL API Client's session")
+
+    def _get_circuit_breaker(self, host: str) -> CircuitBreaker:
+        """ Get the circuit breaker of given host, creating it on the host's first request.
+        Note:
+            private method which get called by _send's method.
+        Args:
+            host(str): requested host(& port).
+
+        Returns:
+            CircuitBreaker: host's circuit breaker.
+        """
+
+        with self._circuit_breakers_lock:
+            if host not in self._circuit_breakers:
+                self._circuit_breakers[host] = CircuitBreaker(self._circuit_failure_threshold,
+                                                              self._circuit_reset_timeout)
+            return self._circuit_breakers[host]
+
+    def _send(self, url_query: str, headers: Dict[str, str] = None, stream: bool = False) -> requests.Response:
+        """ Send http get request of given url query through its host's circuit breaker, retrying transient failures.
+        Note:
+            private method which get called by every http get request of the client. connection errors, timeouts &
+            retryable status codes(e.g. 429 & 503) get retried by the retry policy's backoff or by the response's
+            Retry-After header, & count as the host's failures. a Retry-After which exceeds the policy's max backoff
+            isn't waited for. every attempt's latency(until the response's headers) & a whole body's size get recorded
+            by the package's Metrics, labeled by the CKAN action.
+        Args:
+            url_query(str): final url query for http get request.
+            headers(Dict[str, str]): additional request's headers.
+            stream(bool): whether the response's body gets streamed.
+
+        Returns:
+            requests.Response: last response, which is either not retryable or the retries were exhausted.
+
+        Raises:
+            CircuitOpenError: the host's circuit breaker is open.
+            ApiConnectionError: no response was received after the retries were exhausted.
+        """
+
+        url = urlparse(url_query)
+        host, action = url.netloc, url.path.rsplit("/", 1)[-1]
+        circuit_breaker = self._get_circuit_breaker(host)
+        metrics = Metrics()
+        request_kwargs = {"timeout": self._timeout}
+        if headers:
+            request_kwargs["headers"] = headers
+        if stream:
+            request_kwargs["stream"] = True
+
+        retry = 0
+        while True:
+            retry_after = circuit_breaker.allow_request()
+            if retry_after:
+                self._logger.warning("circuit breaker of %s is open, request %s wasn't sent.", host, url_query)
+                metrics.increment("api_circuit_open_total", host=host)
+                raise CircuitOpenError(f"circuit breaker of {host} is open for {retry_after:.1f} more seconds",
+                                       url_query, retry_after)
+
+            start = time.perf_counter()
+            try:
+                request_result = self._session.get(url_query, **request_kwargs)
+            except (ConnectionError, Timeout) as connection_error:
+                metrics.observe("api_request_seconds", time.perf_counter() - start, action=action, status="error")
+                circuit_breaker.record_failure()
+                if retry >= self._retry_policy.max_retries:
+                    raise ApiConnectionError(f"request {url_query} failed: {connection_error}",
+                                             url_query) from connection_error
+                delay = self._retry_policy.get_delay(retry)
+                self._logger.warning("request %s failed: %s, retrying in %.2f seconds.", url_query, connection_error,
+                                     delay)
+            except RequestException as request_error:
+                circuit_breaker.record_failure()
+                raise ApiConnectionError(f"request {url_query} failed: {request_error}", url_query) from request_error
+            else:
+                if metrics.enabled:
+                    metrics.observe("api_request_seconds", time.perf_counter() - start, action=action,
+                                    status=request_result.status_code)
+                    if not stream:
+                        metrics.observe("api_response_bytes", len(request_result.content),
+                                        metrics_consts.BYTES_BUCKETS, action=action)
+                if not self._retry_policy.is_retryable_status(request_result.status_code):
+                    circuit_breaker.record_success()
+                    return request_result
+
+                circuit_breaker.record_failure()
+                retry_after = RetryPolicy.parse_retry_after(request_result.headers.get("Retry-After"))
+                if retry >= self._retry_policy.max_retries or \
+                        (retry_after is not None and retry_after > self._retry_policy.max_backoff):
+                    return request_result
+                delay = self._retry_policy.get_delay(retry, retry_after)
+                self._logger.warning("request %s failed with %s code, retrying in %.2f seconds.", url_query,
+                                     request_result.status_code, delay)
+                request_result.close()
+
+            metrics.increment("api_retries_total", action=action)
+            time.sleep(delay)
+            retry += 1
+
+    def _raise_for_status(self, url_query: str, request_result: requests.Response) -> None:
+        """ Raise the typed error of a failed response.
+        Note:
+            private method which get called by _get_json & stream_data_frame's methods.
+        Args:
+            url_query(str): final url query of the response.
+            request_result(requests.Response): http get request's response.
+
+        Raises:
+            ApiThrottledError: the response's status code is 429.
+            ApiHttpError: the response's status code is any other error.
+        """
+
+        if request_result.ok:
+            return
+
+        status_code = request_result.status_code
+        if status_code == 429:
+            retry_after = RetryPolicy.parse_retry_after(request_result.headers.get("Retry-After"))
+            raise ApiThrottledError(f"request {url_query} was throttled with 429 code.", url_query,
+                                    retry_after=retry_after)
+        raise ApiHttpError(f"request {url_query} failed with {status_code} code.", url_query, status_code)
+
+    def _get_metadata_modified(self, url_query: str) -> str or None:
+        """ Get the CKAN resource's metadata_modified value of given datastore_search url query.
+        Note:
+            private method which get called by _get_json's method for revalidating stale cached results.
+        Args:
+            url_query(str): datastore_search url query.
+
+        Returns:
+            metadata_modified(str or None): resource's last metadata modification or None when it's unavailable.
+        """
+
+        resource_id = parse_qs(urlparse(url_query).query)["resource_id"][0]
+        try:
+            request_result = self._send(f"{self._base_url}/api/3/action/resource_show?id={resource_id}")
+            if request_result.ok:
+                return request_result.json()["result"].get("metadata_modified")
+        except (ApiRequestError, ValueError, KeyError) as error:
+            self._logger.warning("couldn't get metadata of resource %s: %s", resource_id, error)
+
+        return None
+
+    def _get_json(self, url_query: str) -> Tuple[int, Dict or None, int]:
+        """ Get json data of given url query from the cache when it's fresh or not modified, otherwise from IL Data Gov.
+        Note:
+            private method which get called by _fetch, _get_request & _get_page's methods.
+        Args:
+            url_query(str): final url query for http get request.
+
+        Returns:
+            Tuple[int, Dict, int]: http get request's status code, json data & size of the json body in bytes.
+
+        Raises:
+            ApiRequestError: the http get request failed.
+        """
+
+        if self._cache is None:
+            request_result = self._send(url_query)
+            self._raise_for_status(url_query, request_result)
+            return request_result.status_code, request_result.json(), len(request_result.content)
+
+        metrics = Metrics()
+        entry = self._cache.get_entry(url_query)
+        if entry is not None and self._cache.is_fresh(entry):
+            json_data = self._cache.load(url_query)
+            if json_data is not None:
+                metrics.increment("api_cache_total", result="hit")
+                return 200, json_data, entry.size
+
+        metadata_modified = self._get_metadata_modified(url_query) if self._revalidate_metadata else None
+        headers = {}
+        if entry is not None:
+            if metadata_modified is not None and metadata_modified == entry.metadata_modified:
+                json_data = self._cache.load(url_query)
+                if json_data is not None:
+                    self._cache.touch(url_query)
+                    metrics.increment("api_cache_total", result="revalidated")
+                    return 304, json_data, entry.size
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        request_result = self._send(url_query, headers=headers)
+        if request_result.status_code == 304:
+            json_data = self._cache.load(url_query)
+            if json_data is not None:
+                self._cache.touch(url_query)
+                metrics.increment("api_cache_total", result="revalidated")
+                return 304, json_data, entry.size
+            request_result = self._send(url_query)
+
+        self._raise_for_status(url_query, request_result)
+        metrics.increment("api_cache_total", result="miss")
+        json_data = request_result.json()
+        self._cache.put(url_query,
+                        json_data,
+                        etag=request_result.headers.get("ETag"),
+                        last_modified=request_result.headers.get("Last-Modified"),
+                        metadata_modified=metadata_modified)
+
+        return request_result.status_code, json_data, len(request_result.content)
+
+    def _fetch(self, url_query: str) -> 'ApiDataIL.response':
+        """ Get request of given url query without changing the client's state.
+        Note:
+            private method which get called by fetch's method. request errors get logged & returned as a response
+            without json data.
+        Args:
+            url_query(str): final url query for http get request.
+
+        Returns:
+            ApiDataIL.response: immutable request's result.
+        """
+
+        request_status, json_data, size = None, None, 0
+        start = time.perf_counter()
+        try:
+            request_status, json_data, size = self._get_json(url_query)
+        except ApiRequestError as request_error:
+            request_status = request_error.status_code
+            self._logger.error(request_error)
+        except Exception as general_error:
+            self._logger.exception(general_error)
+
+        elapsed = time.perf_counter() - start
+        self._logger.debug("api data il's get request of %s finished with %s code in %.3f seconds.", url_query,
+                           request_status, elapsed)
+        return ApiDataIL.response(url_query, json_data, request_status, elapsed, size)
+
+    def fetch(self,
+              enum_resource_id: ResourceId,
+              limit: int = 0,
+              offset: int = 0,
+              include_total: bool = False,
+              query: str = None,
+              fields: Iterable[str] = None,
+              filters: Dict[str, Any] = None,
+              sort: str = None,
+              distinct: bool = False) -> 'ApiDataIL.response':
+        """ Get data from specific data resource without changing the client's state, safe for concurrent calls.
+
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+            limit(int): result's limitation.
+            offset(int): result's offset.
+            include_total(bool): include total amount.
+            query(str) = None: additional parameters as query string.
+            fields(Iterable[str]) = None: returned columns, e.g. of a data handler's get_required_fields, all when None.
+            filters(Dict[str, Any]) = None: column: required value or list of values.
+            sort(str) = None: CKAN's sort string, e.g. "date desc, town".
+            distinct(bool): return only distinct rows.
+
+        Returns:
+            ApiDataIL.response: immutable request's result - url query, json data(None for a failed request), status
+                code, elapsed seconds & size of the json body in bytes.
+        """
+
+        return self._fetch(self._format_url_query(enum_resource_id, limit, offset, include_total, query, fields,
+                                                  filters, sort, distinct))
+
+    @timed("api_get_request")
     def _get_request(self) -> int:
         """ Get request implementation - get request from IL Data Gov, save Data and return request's status code.
         Note:
@@ -93,30 +472,89 @@ class ApiDataIL(IAPIHandler):
         Returns:
             self._request_status(int): http get request's status code.
 
+        Raises:
+            ApiRequestError: the http get request failed, the last request's json data gets cleared.
          """
 
         self._logger.info("starting api data il's get request.")
-        try:
-            request_result = requests.get(self._url_query)
-            self._request_status = request_result.status_code
-            if request_result.ok:
-                self._json_data = request_result.json()
-        except (HTTPError, SSLError, InvalidURL, ConnectTimeout, ConnectionError, Timeout, RequestException,
-                MissingSchema) as concrete_error:
-            self._logger.exception(concrete_error)
-        except Exception as general_error:
-            self._logger.exception(general_error)
-        finally:
-            self._logger.debug(f"api data il's get requests succeeded with {self._request_status} code.")
-            self._logger.info("finished api data il's get request.")
-            return self._request_status
+        with self._lock:
+            self._json_data = None
+            try:
+                self._request_status, self._json_data, _ = self._get_json(self._url_query)
+            except ApiRequestError as request_error:
+                self._request_status = request_error.status_code
+                self._logger.error(request_error)
+                raise
+        self._logger.info("finished api data il's get request.")
+        return self._request_status
+
+    def _format_url_query(self,
+                          enum_resource_id: ResourceId,
+                          limit: int,
+                          offset: int,
+                          include_total: bool = False,
+                          query: str = None,
+                          fields: Iterable[str] = None,
+                          filters: Dict[str, Any] = None,
+                          sort: str = None,
+                          distinct: bool = False) -> str:
+        """ Format URL Query for future http get request via Rest API without changing the client's state.
+        Note:
+            private method which get called by _build_url_query_by_parameters & iter_all_records's methods. the
+            filters get formatted as json with sorted keys, so equal filters share the response cache's entries.
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+            limit(int): result's limitation.
+            offset(int): result's offset.
+            include_total(bool): include total amount.
+            query(str) = None: additional parameters as query string.
+            fields(Iterable[str]) = None: returned columns, all when None.
+            filters(Dict[str, Any]) = None: column: required value or list of values.
+            sort(str) = None: CKAN's sort string, e.g. "date desc, town".
+            distinct(bool): return only distinct rows.
+
+        Returns:
+            url_query(str): formatted url query.
+
+        Raises:
+            TypeError: filters isn't a dictionary.
+        """
+
+        url_query = f"{self._base_url}/api/3/action/datastore_search?" \
+                    f"resource_id={api_consts.db[enum_resource_id.name]}"
+        if limit:
+            url_query += f"&limit={limit}"
+        if offset:
+            url_query += f"&offset={offset}"
+        if include_total:
+            url_query += f"&include_total={include_total}"
+        if query:
+            url_query += f"&q={query}"
+        if fields:
+            fields = fields if isinstance(fields, str) else ",".join(fields)
+            url_query += f"&fields={quote(fields, safe=',')}"
+        if filters:
+            if not isinstance(filters, dict):
+                self._logger.exception(f"Wrong Type - {type(filters)} is not a dictionary")
+                raise TypeError("Wrong Type - not a dictionary for filters")
+            url_query += f"&filters={quote(json.dumps(filters, ensure_ascii=False, sort_keys=True))}"
+        if sort:
+            url_query += f"&sort={quote(sort, safe=',')}"
+        if distinct:
+            url_query += "&distinct=true"
+
+        return url_query
 
     def _build_url_query_by_parameters(self,
                                        enum_resource_id: ResourceId,
                                        limit: int,
                                        offset: int,
                                        include_total: bool = False,
-                                       query: str = None) -> None:
+                                       query: str = None,
+                                       fields: Iterable[str] = None,
+                                       filters: Dict[str, Any] = None,
+                                       sort: str = None,
+                                       distinct: bool = False) -> None:
         """ Helper Method of Building URL Query for future http get request via Rest API
         Note:
             private method which get called by get_data_by_resource_id's method.
@@ -126,32 +564,55 @@ class ApiDataIL(IAPIHandler):
             offset(int): result's offset.
             include_total(bool): include total amount.
             query(str) = None: additional parameters as query string.
+            fields(Iterable[str]) = None: returned columns, all when None.
+            filters(Dict[str, Any]) = None: column: required value or list of values.
+            sort(str) = None: CKAN's sort string.
+            distinct(bool): return only distinct rows.
 
         Returns:
             None.
         """
 
         self._logger.info("trying to build api data il's url query.")
-        self._url_query = f"{self._base_url}/api/3/action/datastore_search?" \
-                          f"resource_id={api_consts.db[enum_resource_id.name]}"
-        if limit:
-            self._url_query += f"&limit={limit}"
-        if offset:
-            self._url_query += f"&offset={offset}"
-        if include_total:
-            self._url_query += f"&include_total={include_total}"
-        if query:
-            self._url_query += f"&q={query}"
+        self._url_query = self._format_url_query(enum_resource_id, limit, offset, include_total, query, fields, filters,
+                                                 sort, distinct)
 
-        self._logger.debug(f"api client's url_query = {self._url_query}")
+        self._logger.debug("api client's url_query = %s", self._url_query)
         self._logger.info("finished building api data il's url query.")
 
+    def _get_page(self, url_query: str) -> Dict:
+        """ Get a single page of records from IL Data Gov without changing the client's state.
+        Note:
+            private method which get called by iter_all_records's method.
+        Args:
+            url_query(str): final url query of the page.
+
+        Returns:
+            json_data(dict): page's json data.
+
+        Raises:
+            ApiRequestError: the page couldn't be fetched.
+        """
+
+        try:
+            _, json_data, _ = self._get_json(url_query)
+        except ApiRequestError as request_error:
+            self._logger.error("page request failed: %s", request_error)
+            raise
+
+        return json_data
+
+    @profiled_method
     def get_data_by_resource_id(self,
                                 enum_resource_id: ResourceId,
                                 limit: int = 0,
                                 offset: int = 0,
                                 include_total: bool = False,
-                                query: str = None) -> Dict:
+                                query: str = None,
+                                fields: Iterable[str] = None,
+                                filters: Dict[str, Any] = None,
+                                sort: str = None,
+                                distinct: bool = False) -> Dict:
         """ Get data from specific data resource.
         Note:
             private method which get called by get_data_by_resource_id's method.
@@ -161,12 +622,158 @@ class ApiDataIL(IAPIHandler):
             offset(int): result's offset.
             include_total(bool): include total amount.
             query(str) = None: additional parameters as query string.
+            fields(Iterable[str]) = None: returned columns, e.g. of a data handler's get_required_fields, all when None.
+            filters(Dict[str, Any]) = None: column: required value or list of values.
+            sort(str) = None: CKAN's sort string, e.g. "date desc, town".
+            distinct(bool): return only distinct rows.
 
         Returns:
             self._json_data(dict): returns a dictionary of get request's result.
+
+        Raises:
+            ApiRequestError: the http get request failed.
         """
 
-        self._build_url_query_by_parameters(enum_resource_id, limit, offset, include_total, query)
-        _ = self._get_request()
+        with self._lock:
+            self._build_url_query_by_parameters(enum_resource_id, limit, offset, include_total, query, fields, filters,
+                                                sort, distinct)
+            _ = self._get_request()
 
-        return self._json_data
+            return self._json_data
+
+    def stream_data_frame(self,
+                          enum_resource_id: ResourceId,
+                          limit: int = 0,
+                          offset: int = 0,
+                          include_total: bool = False,
+                          query: str = None,
+                          chunk_size: int = api_consts.DEFAULT_STREAM_CHUNK_SIZE,
+                          rows_per_chunk: int = api_consts.DEFAULT_ROWS_PER_CHUNK,
+                          fields: Iterable[str] = None,
+                          filters: Dict[str, Any] = None,
+                          sort: str = None,
+                          distinct: bool = False) -> Tuple[pd.DataFrame, Dict]:
+        """ Get data from specific data resource straight into a data frame, parsing the response while it arrives.
+        Note:
+            the records get parsed incrementally out of the streamed body into column buffers, so neither the whole
+            body nor the whole records' object graph get held in memory. the response cache isn't used.
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+            limit(int): result's limitation.
+            offset(int): result's offset.
+            include_total(bool): include total amount.
+            query(str) = None: additional parameters as query string.
+            chunk_size(int): bytes read from the response per chunk.
+            rows_per_chunk(int): amount of records per column buffers' chunk.
+            fields(Iterable[str]) = None: returned columns, all when None.
+            filters(Dict[str, Any]) = None: column: required value or list of values.
+            sort(str) = None: CKAN's sort string.
+            distinct(bool): return only distinct rows.
+
+        Returns:
+            Tuple[pd.DataFrame, Dict]: records' data frame & the rest of the response's json data(e.g. total).
+
+        Raises:
+            ApiRequestError: the request failed.
+            ValueError: the response isn't a complete datastore_search json data.
+        """
+
+        url_query = self._format_url_query(enum_resource_id, limit, offset, include_total, query, fields, filters,
+                                           sort, distinct)
+        self._logger.info("starting streaming %s.", url_query)
+        request_result = self._send(url_query, stream=True)
+        try:
+            self._raise_for_status(url_query, request_result)
+
+            parser = RecordsStreamParser()
+            with Metrics().timer("api_stream_parse_seconds"):
+                df = records_to_data_frame(parser.parse_chunks(request_result.iter_content(chunk_size)),
+                                           rows_per_chunk)
+        finally:
+            request_result.close()
+
+        Metrics().observe("api_stream_rows", len(df), metrics_consts.ROWS_BUCKETS)
+
+        self._logger.info("finished streaming %d records of %s.", len(df), enum_resource_id.name)
+        return df, parser.metadata
+
+    def get_total_records(self, enum_resource_id: ResourceId, query: str = None, filters: Dict[str, Any] = None) -> int:
+        """ Get the total amount of records of specific data resource by requesting a single record.
+
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+            query(str) = None: additional parameters as query string.
+            filters(Dict[str, Any]) = None: column: required value or list of values.
+
+        Returns:
+            total(int): total amount of the data resource's records.
+
+        Raises:
+            ApiRequestError: the request couldn't be fetched.
+        """
+
+        url_query = self._format_url_query(enum_resource_id, 1, 0, True, query, filters=filters)
+        return self._get_page(url_query)["result"].get("total", 0)
+
+    def iter_all_records(self,
+                         enum_resource_id: ResourceId,
+                         page_size: int = api_consts.DEFAULT_PAGE_SIZE,
+                         max_workers: int = 1,
+                         query: str = None,
+                         offset: int = 0,
+                         fields: Iterable[str] = None,
+                         filters: Dict[str, Any] = None,
+                         sort: str = None) -> Generator[List[Dict], None, None]:
+        """ Yields every record of specific data resource as batches of records, page by page.
+        Note:
+            the first page is requested with include_total for planning the rest of the pages, which get fetched
+            sequentially or concurrently(max_workers > 1) and yielded by their order as soon as they arrive.
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+            page_size(int): amount of records per page.
+            max_workers(int): amount of pages which get fetched concurrently.
+            query(str) = None: additional parameters as query string.
+            offset(int): amount of leading records to skip, e.g. the records which are already stored locally.
+            fields(Iterable[str]) = None: returned columns, all when None.
+            filters(Dict[str, Any]) = None: column: required value or list of values.
+            sort(str) = None: CKAN's sort string, which keeps the pages' order stable.
+
+        Yields:
+            List[Dict]: page's records.
+
+        Raises:
+            ValueError: page size or max workers aren't positive.
+            ApiRequestError: one of the pages couldn't be fetched.
+        """
+
+        if page_size < 1 or max_workers < 1:
+            raise ValueError("page size and max workers must be positive integers")
+
+        self._logger.info("starting fetching all records of %s.", enum_resource_id.name)
+        first_page = self._get_page(self._format_url_query(enum_resource_id, page_size, offset, True, query, fields,
+                                                           filters, sort))
+        total = first_page["result"].get("total", 0)
+        yield first_page["result"]["records"]
+
+        urls_queries = (self._format_url_query(enum_resource_id, page_size, page_offset, False, query, fields, filters,
+                                               sort)
+                        for page_offset in range(offset + page_size, total, page_size))
+        if max_workers == 1:
+            for url_query in urls_queries:
+                yield self._get_page(url_query)["result"]["records"]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # bounded window of pending pages, so a slow consumer doesn't pile up the whole resource in memory
+                pending_pages = deque()
+                try:
+                    for url_query in urls_queries:
+                        pending_pages.append(executor.submit(self._get_page, url_query))
+                        if len(pending_pages) >= max_workers * 2:
+                            yield pending_pages.popleft().result()["result"]["records"]
+                    while pending_pages:
+                        yield pending_pages.popleft().result()["result"]["records"]
+                finally:
+                    for pending_page in pending_pages:
+                        pending_page.cancel()
+
+        self._logger.info("finished fetching all %d records of %s.", total, enum_resource_id.name)
@@ -0,0 +1,180 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Tuple
+
+from covid19_il.api_handler.iapi_handler import IAPIHandler
+from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.api_handler.retry_policy import RetryPolicy
+from covid19_il.logger.logger import Logger
+from covid19_il.data_handler.enums.resource_id import ResourceId
+import covid19_il.api_handler.consts as api_consts
+
+
+class ApiDataILAsync(IAPIHandler):
+    """ Asyncio API Client for Israeli Government Covid19 Data.
+
+    Note:
+        http get requests are made by a synchronous ApiDataIL client(sharing its pooled session) on a dedicated
+        thread pool, while a semaphore bounds the amount of concurrent requests.
+
+    Attributes:
+        _logger(Logger.logger): Api Data IL Async instance's actions logger.
+        _api_client(ApiDataIL): synchronous api client which builds url queries & makes the http get requests.
+        _max_concurrency(int): max amount of concurrent http get requests.
+        _url_query(str): the last url query for http get request.
+        _executor(ThreadPoolExecutor): thread pool of the blocking http get requests.
+        _semaphore(asyncio.Semaphore): bounds the amount of concurrent http get requests.
+        _semaphore_loop(asyncio.AbstractEventLoop): the event loop which the semaphore belongs to.
+    """
+
+    def __init__(self,
+                 logger,
+                 max_concurrency: int = api_consts.DEFAULT_MAX_CONCURRENCY,
+                 pool_size: int = api_consts.DEFAULT_POOL_SIZE,
+                 timeout: Tuple[float, float] = api_consts.DEFAULT_TIMEOUT,
+                 base_url: str = api_consts.API_DATA_GOV_IL_URL,
+                 retry_policy: RetryPolicy = None) -> None:
+        if max_concurrency < 1:
+            logger.exception(f"Wrong Max Concurrency - {max_concurrency} is not a positive integer")
+            raise ValueError("Wrong Max Concurrency - not a positive integer")
+
+        self._logger = logger
+        self._api_client = ApiDataIL(logger, pool_size=max(pool_size, max_concurrency), timeout=timeout,
+                                     base_url=base_url, retry_policy=retry_policy)
+        self._logger.info("Created ApiDataILAsync API Client")
+        self._max_concurrency = max_concurrency
+        self._url_query = None
+        self._executor = None
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}({self._logger}, {self._max_concurrency})"
+
+    async def __aenter__(self) -> 'ApiDataILAsync':
+        """ Returns the Client itself as an Asynchronous Context Manager """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """ Closes the Client's Resources when leaving the Asynchronous Context Manager """
+        self.close()
+
+    @property
+    def logger(self) -> Logger.logger:
+        """ Logger.logger: Returns an instance of a logger """
+        return self._logger
+
+    @property
+    def base_url(self) -> str:
+        """ str: api's base url """
+        return self._api_client.base_url
+
+    @property
+    def max_concurrency(self) -> int:
+        """ int: Returns the max amount of concurrent http get requests """
+        return self._max_concurrency
+
+    @property
+    def url_query(self) -> str:
+        """ str: Returns a string of the last url query for http get request. """
+        return self._url_query
+
+    def close(self) -> None:
+        """ Shut down the client's thread pool and close its http session. """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._semaphore = None
+        self._semaphore_loop = None
+        self._api_client.close()
+
+    async def _get_request(self, url_query: str) -> Dict:
+        """ Get request implementation - awaits a bounded http get request from IL Data Gov on the thread pool.
+        Note:
+            private method which get called by fetch's method.
+        Args:
+            url_query(str): final url query for http get request.
+
+        Returns:
+            json_data(dict): http get request's results dictionary.
+
+        Raises:
+            ApiRequestError: the http get request failed.
+        """
+
+        loop = asyncio.get_running_loop()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency,
+                                                thread_name_prefix=self.__class__.__name__)
+        # a semaphore is bound to a single event loop, so each new loop(e.g. asyncio.run) gets its own one
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_loop = loop
+
+        async with self._semaphore:
+            self._logger.debug("awaiting api data il's get request: %s", url_query)
+            return await loop.run_in_executor(self._executor, self._api_client._get_page, url_query)
+
+    async def fetch(self,
+                    enum_resource_id: ResourceId,
+                    limit: int = 0,
+                    offset: int = 0,
+                    include_total: bool = False,
+                    query: str = None,
+                    fields: Iterable[str] = None,
+                    filters: Dict[str, Any] = None,
+                    sort: str = None,
+                    distinct: bool = False) -> Dict:
+        """ Get data from specific data resource.
+
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+            limit(int): result's limitation.
+            offset(int): result's offset.
+            include_total(bool): include total amount.
+            query(str) = None: additional parameters as query string.
+            fields(Iterable[str]) = None: returned columns, all when None.
+            filters(Dict[str, Any]) = None: column: required value or list of values.
+            sort(str) = None: CKAN's sort string.
+            distinct(bool): return only distinct rows.
+
+        Returns:
+            json_data(dict): returns a dictionary of get request's result.
+
+        Raises:
+            ApiRequestError: the http get request failed.
+        """
+
+        self._url_query = self._api_client._format_url_query(enum_resource_id, limit, offset, include_total, query,
+                                                             fields, filters, sort, distinct)
+        return await self._get_request(self._url_query)
+
+    async def fetch_many(self,
+                         enums_resources_ids: Iterable[ResourceId],
+                         limit: int = 0,
+                         include_total: bool = False,
+                         return_exceptions: bool = False) -> Dict[ResourceId, Dict or Exception]:
+        """ Get data from several data resources concurrently, bounded by the client's max concurrency.
+
+        Args:
+            enums_resources_ids(Iterable[ResourceId]): data resources' ids.
+            limit(int): result's limitation of each data resource.
+            include_total(bool): include total amount.
+            return_exceptions(bool): returns a failed request's exception as its result instead of raising it.
+
+        Returns:
+            Dict[ResourceId, Dict or Exception]: each data resource's id with its get request's result.
+
+        Raises:
+            ApiRequestError: one of the http get requests failed and return_exceptions is False.
+        """
+
+        enums_resources_ids = list(enums_resources_ids)
+        self._logger.info("starting fetching %d data resources concurrently.", len(enums_resources_ids))
+        results = await asyncio.gather(*(self.fetch(enum_resource_id, limit=limit, include_total=include_total)
+                                         for enum_resource_id in enums_resources_ids),
+                                       return_exceptions=return_exceptions)
+        self._logger.info("finished fetching %d data resources concurrently.", len(enums_resources_ids))
+
+        return dict(zip(enums_resources_ids, results))
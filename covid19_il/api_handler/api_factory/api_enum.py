@@ -5,3 +5,4 @@ class ApiEnum(Enum):
     """ API Types using Enum """
     api_data_il = 1
     api_data_global = 2
+    api_data_il_async = 3
@@ -3,6 +3,7 @@ from functools import lru_cache
 from covid19_il.logger.logger import Logger
 from covid19_il.api_handler.api.api_data_global import ApiDataGlobal
 from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.api_handler.api.api_data_il_async import ApiDataILAsync
 from covid19_il.api_handler.iapi_handler import IAPIHandler
 from covid19_il.api_handler.api_factory.api_enum import ApiEnum
 
@@ -19,14 +20,14 @@ class ApiFactory:
     """
 
     @staticmethod
-    @lru_cache(maxsize=2)
+    @lru_cache(maxsize=3)
     def create_api_client(required_api: ApiEnum) -> IAPIHandler or None:
         """ Create Required API Client to fetch future Data
 
         Args:
             required_api(ApiEnum): enum type of desired api.
         Local:
-            switch_case(dict): The button with all the properties set.
+            switch_case(dict): api client's class of each api type, only the required one gets instantiated.
         Returns:
             IAPIHandler or None: api's class instance or None object.
 
@@ -36,9 +37,10 @@ class ApiFactory:
 
         logger = Logger().logger
         switch_case = {
-            1: ApiDataIL(logger),
-            2: ApiDataGlobal(logger),
-            "default": None
+            1: ApiDataIL,
+            2: ApiDataGlobal,
+            3: ApiDataILAsync
         }
+        api_client_class = switch_case.get(required_api.value)
 
-        return switch_case.get(required_api.value, switch_case['default'])
+        return api_client_class(logger) if api_client_class else None
@@ -0,0 +1,109 @@
+import time
+from threading import Lock
+
+import covid19_il.api_handler.consts as api_consts
+
+
+class CircuitBreaker:
+    """ Circuit Breaker of a single host, which stops sending requests to it after consecutive failures.
+
+    Note:
+        closed: requests get sent & consecutive failures get counted. reaching the failure threshold opens the
+        circuit. open: requests get rejected without being sent until the reset timeout passes. half open: a single
+        trial request gets sent, its success closes the circuit & its failure opens it again.
+
+    Attributes:
+        CLOSED(str): class attribute - closed state.
+        OPEN(str): class attribute - open state.
+        HALF_OPEN(str): class attribute - half open state.
+        _failure_threshold(int): consecutive failures which open the circuit.
+        _reset_timeout(float): seconds which the circuit stays open before a trial request.
+        _state(str): current state.
+        _failures(int): consecutive failures count.
+        _opened_at(float): monotonic time of the circuit's opening.
+        _trial_in_flight(bool): whether the half open circuit's trial request was sent.
+        _lock(Lock): guards the state between the client's threads.
+
+    Methods:
+        allow_request(self): Returns 0 when a request may be sent, otherwise the seconds until the trial request.
+        record_success(self): closes the circuit.
+        record_failure(self): counts a failure & opens the circuit on the threshold or a failed trial request.
+
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self,
+                 failure_threshold: int = api_consts.DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = api_consts.DEFAULT_CIRCUIT_RESET_TIMEOUT) -> None:
+        """ Class Initialization
+
+        Args:
+            failure_threshold(int): consecutive failures which open the circuit.
+            reset_timeout(float): seconds which the circuit stays open before a trial request.
+
+        Raises:
+            ValueError: failure threshold isn't positive or reset timeout is negative.
+        """
+        if failure_threshold < 1 or reset_timeout < 0:
+            raise ValueError("failure threshold must be positive and reset timeout must not be negative")
+
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._state = CircuitBreaker.CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}({self._failure_threshold}, {self._reset_timeout})"
+
+    @property
+    def state(self) -> str:
+        """ str: Returns the circuit's current state """
+        with self._lock:
+            if self._state == CircuitBreaker.OPEN and time.monotonic() - self._opened_at >= self._reset_timeout:
+                return CircuitBreaker.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> float:
+        """ Returns 0 when a request may be sent, otherwise the seconds until the circuit lets a trial request through.
+
+        Returns:
+            float: 0 for an allowed request, otherwise seconds to wait.
+
+        """
+
+        with self._lock:
+            if self._state == CircuitBreaker.CLOSED:
+                return 0
+            if self._state == CircuitBreaker.OPEN:
+                remaining = self._reset_timeout - (time.monotonic() - self._opened_at)
+                if remaining > 0:
+                    return remaining
+                self._state = CircuitBreaker.HALF_OPEN
+                self._trial_in_flight = False
+            if self._trial_in_flight:
+                return self._reset_timeout
+            self._trial_in_flight = True
+            return 0
+
+    def record_success(self) -> None:
+        """ Closes the circuit & resets the consecutive failures count. """
+        with self._lock:
+            self._state = CircuitBreaker.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """ Counts a failure, opens the circuit when reaching the threshold or when the trial request failed. """
+        with self._lock:
+            self._failures += 1
+            if self._state == CircuitBreaker.HALF_OPEN or self._failures >= self._failure_threshold:
+                self._state = CircuitBreaker.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
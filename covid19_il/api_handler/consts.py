@@ -1,3 +1,5 @@
+import os
+
 API_DATA_GOV_IL_URL = "https://data.gov.il"
 
 db = {"AREA_RESOURCE_ID": "d07c0771-01a8-43b2-96cc-c6154e7fa9bd",
@@ -12,3 +14,44 @@ db = {"AREA_RESOURCE_ID": "d07c0771-01a8-43b2-96cc-c6154e7fa9bd",
       "DEATHS_DATA_RESOURCE_ID": "a2b2fceb-3334-44eb-b7b5-9327a573ea2c",
       "YOUNG_POPULATION_RESOURCE_ID": "767ffb4e-a473-490d-be80-faac0d83cae7",
       "CITIES_POPULATION_RESOURCE_ID": "8a21d39d-91e3-40db-aca1-f73f7ab1df69"}
+
+DEFAULT_PAGE_SIZE = 10000
+
+# one pooled keep-alive connection per data resource
+DEFAULT_POOL_SIZE = 12
+
+# (connect timeout, read timeout) in seconds
+DEFAULT_TIMEOUT = (5, 60)
+
+SESSION_HEADERS = {"Accept-Encoding": "gzip, deflate",
+                   "Connection": "keep-alive"}
+
+# max amount of concurrent requests of the asyncio api client
+DEFAULT_MAX_CONCURRENCY = 6
+
+# on-disk http responses cache defaults: directory, time to live in seconds & max total size in bytes
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".covid19_il", "cache")
+DEFAULT_CACHE_TTL = 60 * 60
+DEFAULT_CACHE_MAX_SIZE = 512 * 1024 * 1024
+
+# local datasets & high-water marks directory of the incremental delta sync
+DEFAULT_SYNC_DIR = os.path.join(os.path.expanduser("~"), ".covid19_il", "datasets")
+
+# streaming ingest: bytes read from the http response per chunk & rows per column buffers' chunk
+DEFAULT_STREAM_CHUNK_SIZE = 1024 * 1024
+DEFAULT_ROWS_PER_CHUNK = 50000
+
+# failed requests' retries: max retries, first retry's backoff ceiling & max backoff in seconds, retried status codes
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_MAX_BACKOFF = 30
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# per host circuit breaker: consecutive failures which open it & seconds which it stays open before a trial request
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_RESET_TIMEOUT = 30
+
+# query planner's sources of a call's rows: the local instance, the api's filtered rows or the whole data resource
+QUERY_PLAN_LOCAL = "local"
+QUERY_PLAN_PUSHDOWN = "pushdown"
+QUERY_PLAN_FULL = "full"
@@ -0,0 +1,193 @@
+import json
+import os
+from threading import Lock
+from typing import Dict, List
+
+from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+import covid19_il.api_handler.consts as api_consts
+
+
+class DeltaSync:
+    """ Incremental Delta Sync of data resources by the CKAN's _id high-water mark.
+
+    Note:
+        every data resource is stored locally as an append-only json lines file of its records, while a state file
+        keeps the highest _id & the row count of each stored data resource. a sync fetches only the new tail of the
+        data resource sorted by _id, from the stored row count as offset.
+
+    Attributes:
+        _logger(Logger.logger): delta sync's actions logger.
+        _api_client(ApiDataIL): api client which fetches the new records.
+        _data_dir(str): directory of the local datasets & the state file.
+        _page_size(int): amount of records per fetched page.
+        _lock(Lock): guards the state file.
+
+    Methods:
+        get_state(self, enum_resource_id: ResourceId): Returns the stored high-water mark of given data resource.
+        load_dataset(self, enum_resource_id: ResourceId): Returns the local dataset as the api's json data.
+        sync(self, enum_resource_id: ResourceId, data_handler: DataHandler = None): fetches & stores the new
+            records, and appends them to the live data handler.
+        reset(self, enum_resource_id: ResourceId): removes the local dataset & its high-water mark.
+
+    """
+
+    state_file_name = "sync_state.json"
+
+    def __init__(self,
+                 logger: Logger.logger,
+                 api_client: ApiDataIL,
+                 data_dir: str = api_consts.DEFAULT_SYNC_DIR,
+                 page_size: int = api_consts.DEFAULT_PAGE_SIZE) -> None:
+        """ Class Initialization """
+        self._logger = logger
+        self._api_client = api_client
+        self._data_dir = data_dir
+        self._page_size = page_size
+        self._lock = Lock()
+        os.makedirs(self._data_dir, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}({self._logger}, {self._api_client}, {self._data_dir})"
+
+    @property
+    def data_dir(self) -> str:
+        """ str: Returns the directory of the local datasets """
+        return self._data_dir
+
+    def _get_dataset_path(self, enum_resource_id: ResourceId) -> str:
+        """ Returns the json lines file path of given data resource's local dataset """
+        return os.path.join(self._data_dir, f"{enum_resource_id.name}.jsonl")
+
+    def _read_states(self) -> Dict[str, Dict[str, int]]:
+        """ Returns the high-water marks of all the stored data resources """
+        try:
+            with open(os.path.join(self._data_dir, DeltaSync.state_file_name), encoding="utf-8") as state_file:
+                return json.load(state_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_state(self, enum_resource_id: ResourceId, state: Dict[str, int] or None) -> None:
+        """ Stores(or removes for None) the high-water mark of given data resource atomically """
+        with self._lock:
+            states = self._read_states()
+            if state is None:
+                states.pop(enum_resource_id.name, None)
+            else:
+                states[enum_resource_id.name] = state
+            state_path = os.path.join(self._data_dir, DeltaSync.state_file_name)
+            with open(f"{state_path}.tmp", "w", encoding="utf-8") as state_file:
+                json.dump(states, state_file)
+            os.replace(f"{state_path}.tmp", state_path)
+
+    def get_state(self, enum_resource_id: ResourceId) -> Dict[str, int]:
+        """ Returns the stored high-water mark of given data resource.
+
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+
+        Returns:
+            Dict[str, int]: highest stored _id as "max_id" & amount of read records(the next sync's offset) as
+                "row_count".
+
+        """
+
+        return self._read_states().get(enum_resource_id.name, {"max_id": 0, "row_count": 0})
+
+    def load_dataset(self, enum_resource_id: ResourceId) -> Dict or None:
+        """ Returns the local dataset of given data resource in the same structure as the api's json data.
+
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+
+        Returns:
+            Dict or None: the local dataset's json data or None when the data resource isn't stored.
+
+        """
+
+        try:
+            with open(self._get_dataset_path(enum_resource_id), encoding="utf-8") as dataset_file:
+                records = [json.loads(line) for line in dataset_file if line.strip()]
+        except OSError:
+            return None
+
+        return {"result": {"records": records, "total": len(records)}}
+
+    def reset(self, enum_resource_id: ResourceId) -> None:
+        """ Removes the local dataset & the high-water mark of given data resource.
+
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+
+        Returns:
+            None.
+
+        """
+
+        if os.path.exists(self._get_dataset_path(enum_resource_id)):
+            os.remove(self._get_dataset_path(enum_resource_id))
+        self._write_state(enum_resource_id, None)
+        self._logger.info("reset the local dataset of %s", enum_resource_id.name)
+
+    def sync(self, enum_resource_id: ResourceId, data_handler: DataHandler = None) -> List[Dict]:
+        """ Fetches the records beyond the stored high-water mark, appends them to the local dataset and to the live
+            data handler.
+
+        Note:
+            when the data resource has fewer records than the stored ones(e.g. it got republished), the local dataset
+            gets reset and fully synced again, and the live data handler's data gets replaced by the new records.
+
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+            data_handler(DataHandler): live data handler of the data resource which the new records get appended to.
+
+        Returns:
+            List[Dict]: the new records.
+
+        Raises:
+            ApiRequestError: one of the pages couldn't be fetched.
+
+        """
+
+        state = self.get_state(enum_resource_id)
+        total = self._api_client.get_total_records(enum_resource_id)
+        republished = total < state["row_count"]
+        if republished:
+            self._logger.warning("%s has %d records but %d are stored, starting a full sync", enum_resource_id.name,
+                                 total, state['row_count'])
+            self.reset(enum_resource_id)
+            state = self.get_state(enum_resource_id)
+
+        new_records = []
+        read_count = 0
+        if total > state["row_count"]:
+            # the pages are sorted by _id, so the offset of the read rows is stable between syncs
+            for page in self._api_client.iter_all_records(enum_resource_id,
+                                                          page_size=self._page_size,
+                                                          offset=state["row_count"],
+                                                          sort="_id"):
+                read_count += len(page)
+                new_records.extend(record for record in page if record.get("_id", 0) > state["max_id"])
+
+        if new_records:
+            with open(self._get_dataset_path(enum_resource_id), "a", encoding="utf-8") as dataset_file:
+                dataset_file.writelines(f"{json.dumps(record, ensure_ascii=False)}\n" for record in new_records)
+        if read_count:
+            # the row count advances by every read row, also by the old ones, so the next offset doesn't fall behind
+            self._write_state(enum_resource_id,
+                              {"max_id": max([state["max_id"], *(record.get("_id", 0) for record in new_records)]),
+                               "row_count": state["row_count"] + read_count})
+        if new_records and data_handler is not None and not republished:
+            # the live data handler may already hold part of the tail, e.g. when it was built by a full fetch
+            data_handler.append_records([record for record in new_records
+                                         if record.get("_id", 0) > data_handler.max_id])
+
+        if data_handler is not None and republished:
+            # the live data handler holds the former publication, whose _ids don't mark the new one's records
+            data_handler.replace_records(new_records)
+
+        self._logger.info("synced %d new records of %s", len(new_records), enum_resource_id.name)
+        return new_records
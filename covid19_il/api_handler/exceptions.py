@@ -0,0 +1,53 @@
+class ApiRequestError(RuntimeError):
+    """ Base Error of a failed http get request of the api clients.
+
+    Note:
+        a RuntimeError's subclass, as the api clients raised RuntimeError for failed requests before the typed errors.
+
+    Attributes:
+        url_query(str): url query of the failed request.
+        status_code(int or None): http status code of the failed request, None when no response was received.
+
+    """
+
+    def __init__(self, message: str, url_query: str, status_code: int = None) -> None:
+        """ Class Initialization """
+        super().__init__(message)
+        self.url_query = url_query
+        self.status_code = status_code
+
+
+class ApiHttpError(ApiRequestError):
+    """ The server responded the request with an error status code, after the retries were exhausted """
+
+
+class ApiThrottledError(ApiHttpError):
+    """ The server kept throttling the request(429) after the retries were exhausted.
+
+    Attributes:
+        retry_after(float or None): seconds which the server asked to wait by the last Retry-After header.
+
+    """
+
+    def __init__(self, message: str, url_query: str, status_code: int = 429, retry_after: float = None) -> None:
+        """ Class Initialization """
+        super().__init__(message, url_query, status_code)
+        self.retry_after = retry_after
+
+
+class ApiConnectionError(ApiRequestError):
+    """ No response was received(connection error, timeout, invalid url...) after the retries were exhausted """
+
+
+class CircuitOpenError(ApiRequestError):
+    """ The request wasn't sent since the host's circuit breaker is open after consecutive failures.
+
+    Attributes:
+        retry_after(float): seconds until the circuit breaker lets a trial request through.
+
+    """
+
+    def __init__(self, message: str, url_query: str, retry_after: float) -> None:
+        """ Class Initialization """
+        super().__init__(message, url_query)
+        self.retry_after = retry_after
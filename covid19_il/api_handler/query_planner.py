@@ -0,0 +1,160 @@
+from collections import namedtuple
+from typing import Any, Dict, List
+
+from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+from covid19_il.metrics.metrics import Metrics
+import covid19_il.api_handler.consts as api_consts
+
+
+class QueryPlanner:
+    """ Query Planner of the data handlers' methods' calls, which pushes their rows' filters down to the api.
+
+    Note:
+        a call runs on the data resource's local instance when the data handlers factory holds one. otherwise a
+        method which is listed in its handler's filters manifest(e.g. Cities.cities_by_date) gets only its rows from
+        the api's datastore_search by CKAN's filters, projected to the columns of its handler's fields manifest, and
+        runs on a transient data handler of these rows, so the factory's instance never holds a partial data. any
+        other method's call fetches the whole data resource once & registers it as the factory's instance.
+
+    Attributes:
+        query_plan(namedtuple): class attribute - a call's plan: data resource's id, method's name, source of the
+            rows, pushed down filters & requested columns.
+        _logger(Logger.logger): query planner's actions logger.
+        _api_client(ApiDataIL): api client which fetches the rows.
+        _page_size(int): amount of records per fetched page.
+        _max_workers(int): amount of pages which get fetched concurrently.
+
+    Methods:
+        plan(self, enum_resource_id: ResourceId, method_name: str, *args, filters: Dict[str, Any] = None,
+            **kwargs): returns the plan of given method's call.
+        execute(self, enum_resource_id: ResourceId, method_name: str, *args, filters: Dict[str, Any] = None,
+            **kwargs): plans given method's call, fetches the rows which it requires & returns its result.
+        _fetch_json_data(self, query_plan: QueryPlanner.query_plan): fetches the planned rows as the api's json data.
+
+    """
+
+    query_plan = namedtuple("QueryPlan", ("resource_id", "method_name", "source", "filters", "fields"))
+
+    def __init__(self,
+                 logger: Logger.logger,
+                 api_client: ApiDataIL,
+                 page_size: int = api_consts.DEFAULT_PAGE_SIZE,
+                 max_workers: int = 1) -> None:
+        """ Class Initialization """
+        self._logger = logger
+        self._api_client = api_client
+        self._page_size = page_size
+        self._max_workers = max_workers
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}({self._logger}, {self._api_client}, {self._page_size})"
+
+    def plan(self, enum_resource_id: ResourceId, method_name: str, *args, filters: Dict[str, Any] = None,
+             **kwargs) -> 'QueryPlanner.query_plan':
+        """ Returns the plan of given method's call.
+
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+            method_name(str): name of the data handler's public method.
+            *args: method's positional arguments.
+            filters(Dict[str, Any]) = None: additional column: required value or list of values of the rows which
+                the method reads, e.g. a region. they get pushed down to the api even when there is a local instance.
+            **kwargs: method's keyword arguments.
+
+        Returns:
+            QueryPlanner.query_plan: the call's plan.
+
+        Raises:
+            KeyError: the data resource has no data handler.
+            ValueError: the name isn't a public method of the data handler.
+            TypeError: the arguments don't match the method's parameters.
+
+        """
+
+        data_handler_class = DataHandlerFactory.data_handlers_classes[enum_resource_id.value]
+        pushed_down_filters = {**(data_handler_class.get_filters(method_name, *args, **kwargs) or {}),
+                               **(filters or {})}
+        local_data_handler = DataHandlerFactory.data_resources.get(enum_resource_id.value)
+
+        if not filters and local_data_handler is not None and local_data_handler.df is not None:
+            query_plan = QueryPlanner.query_plan(enum_resource_id, method_name, api_consts.QUERY_PLAN_LOCAL, None,
+                                                 None)
+        elif pushed_down_filters:
+            query_plan = QueryPlanner.query_plan(enum_resource_id, method_name, api_consts.QUERY_PLAN_PUSHDOWN,
+                                                 pushed_down_filters,
+                                                 data_handler_class.get_required_fields(method_name))
+        else:
+            query_plan = QueryPlanner.query_plan(enum_resource_id, method_name, api_consts.QUERY_PLAN_FULL, None,
+                                                 None)
+
+        self._logger.debug("planned %s.%s: %s", enum_resource_id.name, method_name, query_plan)
+        Metrics().increment("query_plans_total", resource=enum_resource_id.name, source=query_plan.source)
+        return query_plan
+
+    def execute(self, enum_resource_id: ResourceId, method_name: str, *args, filters: Dict[str, Any] = None,
+                **kwargs) -> Any:
+        """ Plans given method's call, fetches the rows which it requires & returns its result.
+
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+            method_name(str): name of the data handler's public method.
+            *args: method's positional arguments.
+            filters(Dict[str, Any]) = None: additional column: required value or list of values of the rows which
+                the method reads, e.g. a region.
+            **kwargs: method's keyword arguments.
+
+        Returns:
+            Any: the method's result, e.g. a generator.
+
+        Raises:
+            KeyError: the data resource has no data handler.
+            ValueError: the name isn't a public method of the data handler.
+            TypeError: the arguments don't match the method's parameters.
+            ApiRequestError: one of the pages couldn't be fetched.
+
+        """
+
+        query_plan = self.plan(enum_resource_id, method_name, *args, filters=filters, **kwargs)
+
+        if query_plan.source == api_consts.QUERY_PLAN_LOCAL:
+            data_handler = DataHandlerFactory.get_instance(enum_resource_id)
+        elif query_plan.source == api_consts.QUERY_PLAN_PUSHDOWN:
+            data_handler_class = DataHandlerFactory.data_handlers_classes[enum_resource_id.value]
+            data_handler = data_handler_class(self._logger, self._fetch_json_data(query_plan))
+        else:
+            data_handler = DataHandlerFactory.get_instance(enum_resource_id, self._fetch_json_data(query_plan))
+
+        return getattr(data_handler, method_name)(*args, **kwargs)
+
+    def _fetch_json_data(self, query_plan: 'QueryPlanner.query_plan') -> Dict[str, Dict[str, List or int]]:
+        """ Fetches the planned rows as the api's json data.
+
+        Note:
+            private method which get called by execute's method.
+
+        Args:
+            query_plan(QueryPlanner.query_plan): the call's plan.
+
+        Returns:
+            Dict[str, Dict[str, List or int]]: the planned rows in the same structure as the api's json data.
+
+        Raises:
+            ApiRequestError: one of the pages couldn't be fetched.
+
+        """
+
+        records = []
+        for page in self._api_client.iter_all_records(query_plan.resource_id,
+                                                      page_size=self._page_size,
+                                                      max_workers=self._max_workers,
+                                                      fields=query_plan.fields,
+                                                      filters=query_plan.filters):
+            records.extend(page)
+
+        self._logger.info("fetched %d records of %s for %s", len(records), query_plan.resource_id.name,
+                          query_plan.method_name)
+        return {"result": {"records": records, "total": len(records)}}
@@ -0,0 +1,190 @@
+import codecs
+import json
+import re
+from typing import Dict, Generator, Iterable, List
+
+import pandas as pd
+
+import covid19_il.api_handler.consts as api_consts
+
+
+class RecordsStreamParser:
+    """ Incremental Parser of a datastore_search json body's records, chunk by chunk.
+
+    Note:
+        only one record at a time gets decoded out of the buffered text, so the whole body & the whole records' object
+        graph never exist in memory at once. the rest of the body(help, fields, total etc.) is kept aside & parsed on
+        close.
+
+    Attributes:
+        _decoder(codecs.IncrementalDecoder): utf-8 decoder of chunks which may split multi-byte characters.
+        _json_decoder(json.JSONDecoder): decoder of a single record.
+        _buffer(str): decoded text which hasn't been parsed yet.
+        _state(int): position in the body - before, inside or after the records' array.
+        _prefix(str): body's text before the records' array.
+        _tail(str): body's text after the records' array.
+        _metadata(Dict): body's json data without the records, available after close.
+
+    Methods:
+        feed(self, chunk: bytes): parses the next chunk of the body & returns its complete records.
+        close(self): parses the rest of the body & validates it's complete.
+        parse_chunks(self, chunks: Iterable[bytes]): yields the records of the whole body, chunk by chunk.
+
+    """
+
+    _records_pattern = re.compile(r'"records"\s*:\s*\[')
+    _separator_pattern = re.compile(r'[\s,]*')
+    _before_records, _inside_records, _after_records = range(3)
+
+    def __init__(self) -> None:
+        """ Class Initialization """
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state = RecordsStreamParser._before_records
+        self._prefix = ""
+        self._tail = ""
+        self._metadata = None
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}()"
+
+    @property
+    def metadata(self) -> Dict or None:
+        """ Dict or None: Returns the body's json data without the records, or None before close """
+        return self._metadata
+
+    def feed(self, chunk: bytes) -> List[Dict]:
+        """ Parses the next chunk of the body & returns the records which got completed by it.
+
+        Args:
+            chunk(bytes): next chunk of the http response's body.
+
+        Returns:
+            List[Dict]: complete records, in the body's order.
+
+        """
+
+        self._buffer += self._decoder.decode(chunk)
+        return self._parse()
+
+    def _parse(self) -> List[Dict]:
+        """ Parses the buffered text as far as it's complete.
+
+        Note:
+            private method which get called by feed & close's methods. an incomplete record stays buffered until the
+            next chunk arrives.
+
+        Returns:
+            List[Dict]: complete records.
+
+        """
+
+        records = []
+        if self._state == RecordsStreamParser._before_records:
+            match = RecordsStreamParser._records_pattern.search(self._buffer)
+            if match is None:
+                return records
+            self._prefix = self._buffer[:match.end() - 1]
+            self._buffer = self._buffer[match.end():]
+            self._state = RecordsStreamParser._inside_records
+
+        if self._state == RecordsStreamParser._inside_records:
+            position = 0
+            while True:
+                position = RecordsStreamParser._separator_pattern.match(self._buffer, position).end()
+                if position >= len(self._buffer):
+                    break
+                if self._buffer[position] == "]":
+                    self._tail = self._buffer[position + 1:]
+                    position = len(self._buffer)
+                    self._state = RecordsStreamParser._after_records
+                    break
+                try:
+                    record, position = self._json_decoder.raw_decode(self._buffer, position)
+                except json.JSONDecodeError:
+                    break
+                records.append(record)
+            self._buffer = self._buffer[position:]
+
+        elif self._state == RecordsStreamParser._after_records:
+            self._tail += self._buffer
+            self._buffer = ""
+
+        return records
+
+    def close(self) -> List[Dict]:
+        """ Parses the rest of the body & validates the body was complete.
+
+        Returns:
+            List[Dict]: the last complete records.
+
+        Raises:
+            ValueError: the body isn't a complete datastore_search json data.
+
+        """
+
+        self._buffer += self._decoder.decode(b"", final=True)
+        records = self._parse()
+        if self._state != RecordsStreamParser._after_records or self._buffer.strip():
+            raise ValueError("incomplete datastore_search json data, the records' array isn't closed")
+
+        self._metadata = json.loads(f"{self._prefix}[]{self._tail}")
+        return records
+
+    def parse_chunks(self, chunks: Iterable[bytes]) -> Generator[Dict, None, None]:
+        """ Yields the records of the whole body while its chunks arrive, then closes the parser.
+
+        Args:
+            chunks(Iterable[bytes]): the http response's body, chunk by chunk.
+
+        Yields:
+            Dict: record.
+
+        Raises:
+            ValueError: the body isn't a complete datastore_search json data.
+
+        """
+
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        yield from self.close()
+
+
+def records_to_data_frame(records: Iterable[Dict], rows_per_chunk: int = api_consts.DEFAULT_ROWS_PER_CHUNK) \
+        -> pd.DataFrame:
+    """ Converts a stream of records to a data frame via column buffers, chunk by chunk.
+
+    Note:
+        at most one chunk of records gets buffered as python objects at a time, every full chunk gets converted to a
+        data frame straight away. a column which is missing in some records gets missing values.
+
+    Args:
+        records(Iterable[Dict]): flat records, e.g. of RecordsStreamParser.
+        rows_per_chunk(int): amount of records per column buffers' chunk.
+
+    Returns:
+        pd.DataFrame: records' data frame.
+
+    """
+
+    frames = []
+    columns = {}
+    rows = 0
+    for record in records:
+        for column_name in record:
+            if column_name not in columns:
+                columns[column_name] = [None] * rows
+        for column_name, column in columns.items():
+            column.append(record.get(column_name))
+        rows += 1
+        if rows == rows_per_chunk:
+            frames.append(pd.DataFrame(columns))
+            columns = {column_name: [] for column_name in columns}
+            rows = 0
+
+    if rows or not frames:
+        frames.append(pd.DataFrame(columns))
+
+    return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
@@ -0,0 +1,275 @@
+import hashlib
+import json
+import os
+import time
+from collections import namedtuple
+from threading import Lock
+from typing import Dict, List, Tuple
+
+from covid19_il.logger.logger import Logger
+import covid19_il.api_handler.consts as api_consts
+
+
+class ResponseCache:
+    """ On-Disk Cache of http get requests' json results keyed by their url query.
+
+    Note:
+        every entry is stored as a raw json body file & a small metadata file, so freshness & revalidation checks
+        never parse the body. entries are evicted by least recent use once the total bodies' size exceeds the bound.
+        the total size is kept as a running sum, so only a put which crosses the bound scans the cache's directory.
+
+    Attributes:
+        _logger(Logger.logger): response cache's actions logger.
+        _cache_dir(str): directory of the cached entries.
+        _ttl(float): seconds which an entry is fresh for, before it must be revalidated.
+        _max_size(int): max total size of the cached bodies in bytes.
+        _lock(Lock): guards writes & evictions.
+        _total_size(int or None): running total size of the cached bodies in bytes, None until the first put.
+
+    Methods:
+        get_entry(self, url_query: str): Returns the cached entry's metadata of given url query or None.
+        is_fresh(self, entry: ResponseCache.entry): Returns whether the entry is younger than the ttl.
+        load(self, url_query: str): Returns the cached json data of given url query or None.
+        put(self, url_query: str, json_data: Dict, etag: str, last_modified: str, metadata_modified: str): stores
+            the json data of given url query and evicts least recently used entries.
+        touch(self, url_query: str): marks a revalidated entry as fresh again.
+        clear(self): removes all cached entries.
+
+    """
+
+    entry = namedtuple("CacheEntry", ("url_query", "etag", "last_modified", "metadata_modified", "stored_at", "size"))
+
+    def __init__(self,
+                 logger: Logger.logger,
+                 cache_dir: str = api_consts.DEFAULT_CACHE_DIR,
+                 ttl: float = api_consts.DEFAULT_CACHE_TTL,
+                 max_size: int = api_consts.DEFAULT_CACHE_MAX_SIZE) -> None:
+        """ Class Initialization """
+        self._logger = logger
+        self._cache_dir = cache_dir
+        self._ttl = ttl
+        self._max_size = max_size
+        self._lock = Lock()
+        self._total_size = None
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}({self._logger}, {self._cache_dir}, {self._ttl}, {self._max_size})"
+
+    @property
+    def cache_dir(self) -> str:
+        """ str: Returns the directory of the cached entries """
+        return self._cache_dir
+
+    @property
+    def ttl(self) -> float:
+        """ float: Returns the seconds which an entry is fresh for """
+        return self._ttl
+
+    def _get_paths(self, url_query: str) -> Tuple[str, str]:
+        """ Returns the body's & metadata's file paths of given url query.
+
+        Note:
+            private method which get called by other methods for locating an entry.
+
+        Args:
+            url_query(str): url query of http get request.
+
+        Returns:
+            Tuple[str, str]: body's file path & metadata's file path.
+
+        """
+
+        key = hashlib.sha256(url_query.encode("utf-8")).hexdigest()
+        return os.path.join(self._cache_dir, f"{key}.json"), os.path.join(self._cache_dir, f"{key}.meta.json")
+
+    def _write_atomically(self, path: str, content: bytes) -> None:
+        """ Writes a file via a temporary file, so readers never see a partially written file.
+
+        Note:
+            private method which get called by put's method.
+
+        Args:
+            path(str): destination file path.
+            content(bytes): file's content.
+
+        Returns:
+            None.
+
+        """
+
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as temp_file:
+            temp_file.write(content)
+        os.replace(temp_path, path)
+
+    def get_entry(self, url_query: str) -> 'ResponseCache.entry' or None:
+        """ Returns the cached entry's metadata of given url query or None when it isn't cached.
+
+        Args:
+            url_query(str): url query of http get request.
+
+        Returns:
+            ResponseCache.entry or None: entry's metadata.
+
+        """
+
+        body_path, meta_path = self._get_paths(url_query)
+        try:
+            with open(meta_path, encoding="utf-8") as meta_file:
+                entry = ResponseCache.entry(**json.load(meta_file))
+        except (OSError, ValueError, TypeError):
+            return None
+
+        return entry if os.path.exists(body_path) else None
+
+    def is_fresh(self, entry: 'ResponseCache.entry') -> bool:
+        """ Returns whether the entry is younger than the cache's ttl """
+        return time.time() - entry.stored_at < self._ttl
+
+    def load(self, url_query: str) -> Dict or None:
+        """ Returns the cached json data of given url query and marks it as recently used.
+
+        Args:
+            url_query(str): url query of http get request.
+
+        Returns:
+            Dict or None: cached json data or None when it isn't cached.
+
+        """
+
+        body_path, _ = self._get_paths(url_query)
+        try:
+            with open(body_path, "rb") as body_file:
+                json_data = json.loads(body_file.read())
+            os.utime(body_path)
+        except (OSError, ValueError) as error:
+            self._logger.warning("couldn't load cached response of %s: %s", url_query, error)
+            return None
+
+        self._logger.debug("loaded cached response of %s", url_query)
+        return json_data
+
+    def put(self,
+            url_query: str,
+            json_data: Dict,
+            etag: str = None,
+            last_modified: str = None,
+            metadata_modified: str = None) -> None:
+        """ Stores the json data of given url query & its validators, then evicts least recently used entries.
+
+        Args:
+            url_query(str): url query of http get request.
+            json_data(Dict): http get request's results dictionary.
+            etag(str): response's ETag header.
+            last_modified(str): response's Last-Modified header.
+            metadata_modified(str): CKAN resource's metadata_modified value.
+
+        Returns:
+            None.
+
+        """
+
+        body = json.dumps(json_data, ensure_ascii=False).encode("utf-8")
+        entry = ResponseCache.entry(url_query, etag, last_modified, metadata_modified, time.time(), len(body))
+        body_path, meta_path = self._get_paths(url_query)
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = sum(size for _, size, _ in self._scan_bodies())
+            try:
+                # a replaced body's size is no longer part of the total
+                self._total_size -= os.stat(body_path).st_size
+            except FileNotFoundError:
+                pass
+            self._write_atomically(body_path, body)
+            self._write_atomically(meta_path, json.dumps(entry._asdict()).encode("utf-8"))
+            self._total_size += len(body)
+            if self._total_size > self._max_size:
+                self._evict()
+
+        self._logger.debug("cached response of %s (%d bytes)", url_query, len(body))
+
+    def touch(self, url_query: str) -> None:
+        """ Marks a revalidated entry as fresh again.
+
+        Args:
+            url_query(str): url query of http get request.
+
+        Returns:
+            None.
+
+        """
+
+        entry = self.get_entry(url_query)
+        if entry is not None:
+            _, meta_path = self._get_paths(url_query)
+            with self._lock:
+                self._write_atomically(meta_path, json.dumps(entry._replace(stored_at=time.time())._asdict())
+                                       .encode("utf-8"))
+
+    def _scan_bodies(self) -> List[Tuple[float, int, str]]:
+        """ Returns the last use time, size & file name of every cached body.
+
+        Note:
+            private method which get called by put's & _evict's methods while holding the lock. a body which gets
+            removed during the scan(e.g. by another process's eviction) is skipped.
+
+        Args:
+            None.
+
+        Returns:
+            List[Tuple[float, int, str]]: bodies' last use time, size & file name.
+
+        """
+
+        bodies = []
+        for file_name in os.listdir(self._cache_dir):
+            if file_name.endswith(".json") and not file_name.endswith(".meta.json"):
+                try:
+                    stat = os.stat(os.path.join(self._cache_dir, file_name))
+                except FileNotFoundError:
+                    continue
+                bodies.append((stat.st_mtime, stat.st_size, file_name))
+
+        return bodies
+
+    def _evict(self) -> None:
+        """ Removes least recently used entries until the bodies' total size is within the cache's bound.
+
+        Note:
+            private method which get called by put's method while holding the lock, once the running total size
+            exceeds the bound. the total size gets recounted from the cache's directory, since other processes may
+            share it.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        """
+
+        bodies = self._scan_bodies()
+        total_size = sum(size for _, size, _ in bodies)
+        for _, size, file_name in sorted(bodies):
+            if total_size <= self._max_size:
+                break
+            body_path = os.path.join(self._cache_dir, file_name)
+            for path in (body_path, body_path.replace(".json", ".meta.json")):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            total_size -= size
+            self._logger.debug("evicted cached response %s", file_name)
+
+        self._total_size = total_size
+
+    def clear(self) -> None:
+        """ Removes all cached entries """
+        with self._lock:
+            for file_name in os.listdir(self._cache_dir):
+                if file_name.endswith(".json"):
+                    os.remove(os.path.join(self._cache_dir, file_name))
+            self._total_size = 0
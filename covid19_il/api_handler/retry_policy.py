@@ -0,0 +1,126 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable
+
+import covid19_il.api_handler.consts as api_consts
+
+
+class RetryPolicy:
+    """ Retries' Policy of the api client's failed http get requests: exponential backoff with full jitter.
+
+    Note:
+        the n-th retry waits a random delay between 0 and min(max_backoff, backoff_factor * 2 ** n) seconds, so
+        concurrent clients which failed together don't retry together. a server's Retry-After header overrides the
+        delay, unless it asks to wait more than max_backoff, which gives up instead.
+
+    Attributes:
+        _max_retries(int): max amount of retries of a failed request.
+        _backoff_factor(float): seconds of the first retry's backoff ceiling.
+        _max_backoff(float): max seconds to wait before a retry.
+        _retry_statuses(frozenset): http status codes of the responses which get retried.
+        _random(random.Random): jitter's random generator.
+
+    Methods:
+        is_retryable_status(self, status_code: int): Returns whether a response of given status code gets retried.
+        get_delay(self, retry: int, retry_after: float = None): Returns the seconds to wait before given retry.
+        parse_retry_after(value: str): Returns the seconds of a Retry-After header's value.
+
+    """
+
+    def __init__(self,
+                 max_retries: int = api_consts.DEFAULT_MAX_RETRIES,
+                 backoff_factor: float = api_consts.DEFAULT_BACKOFF_FACTOR,
+                 max_backoff: float = api_consts.DEFAULT_MAX_BACKOFF,
+                 retry_statuses: Iterable[int] = api_consts.RETRY_STATUSES,
+                 seed: int = None) -> None:
+        """ Class Initialization
+
+        Args:
+            max_retries(int): max amount of retries of a failed request, 0 disables retrying.
+            backoff_factor(float): seconds of the first retry's backoff ceiling.
+            max_backoff(float): max seconds to wait before a retry.
+            retry_statuses(Iterable[int]): http status codes of the responses which get retried.
+            seed(int): seed of the jitter's random generator.
+
+        Raises:
+            ValueError: max retries, backoff factor or max backoff is negative.
+        """
+        if max_retries < 0 or backoff_factor < 0 or max_backoff < 0:
+            raise ValueError("max retries, backoff factor and max backoff must not be negative")
+
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._max_backoff = max_backoff
+        self._retry_statuses = frozenset(retry_statuses)
+        self._random = random.Random(seed)
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}({self._max_retries}, {self._backoff_factor}, {self._max_backoff}, " \
+               f"{sorted(self._retry_statuses)})"
+
+    @property
+    def max_retries(self) -> int:
+        """ int: Returns the max amount of retries of a failed request """
+        return self._max_retries
+
+    @property
+    def max_backoff(self) -> float:
+        """ float: Returns the max seconds to wait before a retry """
+        return self._max_backoff
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """ Returns whether a response of given status code gets retried.
+
+        Args:
+            status_code(int): response's http status code.
+
+        Returns:
+            bool: True for a retryable status code.
+
+        """
+
+        return status_code in self._retry_statuses
+
+    def get_delay(self, retry: int, retry_after: float = None) -> float:
+        """ Returns the seconds to wait before given retry.
+
+        Args:
+            retry(int): 0 based number of the retry.
+            retry_after(float): seconds which the server asked to wait, None when it didn't.
+
+        Returns:
+            float: seconds to wait.
+
+        """
+
+        if retry_after is not None:
+            return retry_after
+
+        return self._random.uniform(0, min(self._max_backoff, self._backoff_factor * 2 ** retry))
+
+    @staticmethod
+    def parse_retry_after(value: str) -> float or None:
+        """ Returns the seconds of a Retry-After header's value, which is either seconds or an http date.
+
+        Args:
+            value(str): Retry-After header's value or None.
+
+        Returns:
+            float or None: seconds to wait, None for a missing or malformed value.
+
+        """
+
+        if not isinstance(value, str):
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,8 @@
+import os
+
+# columnar snapshots directory of the data resources' data frames
+DEFAULT_SNAPSHOT_DIR = os.path.join(os.path.expanduser("~"), ".covid19_il", "snapshots")
+
+# in-memory cache bounds of the data handlers' methods' results
+DEFAULT_RESULT_CACHE_MAX_SIZE = 128
+DEFAULT_RESULT_CACHE_TTL = None
@@ -1,9 +1,10 @@
 from collections import defaultdict
-from functools import lru_cache
 from typing import Dict, DefaultDict, Tuple, Generator
 
 from covid19_il.logger.logger import Logger
 from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.result_cache import cached_result
+from covid19_il.data_handler.enums.column_type import ColumnType
 
 
 class AgeGender(DataHandler):
@@ -24,12 +25,17 @@ class AgeGender(DataHandler):
     """
 
     calculated_fields = ('weekly_tests_num', 'weekly_newly_tested', 'weekly_cases', 'weekly_deceased')
+    schema = {'first_week_day': ColumnType.DATE, 'last_week_day': ColumnType.DATE, 'age_group': ColumnType.CATEGORY,
+              'gender': ColumnType.CATEGORY, **dict.fromkeys(calculated_fields, ColumnType.INT)}
+    date_column_name = 'first_week_day'
+    fields_manifest = {'statistics_by_age_group': ('age_group', *calculated_fields)}
+    filters_manifest = {'statistics_by_given_first_week_day': {'week_day': 'first_week_day'}}
 
     def __init__(self, logger: Logger.logger, json_data: Dict) -> None:
         """ Initialize Base Class & Instance Attributes """
         super().__init__(logger, json_data)
 
-    @lru_cache
+    @cached_result
     def statistics_by_gender(self) -> \
             Generator[DefaultDict[str, DefaultDict[str, Dict[str, Dict[str, int or str]]]], None, None] or \
             Generator[str, None, None]:
@@ -65,14 +71,9 @@ class AgeGender(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            ser = df.groupby([*df.columns])['gender']
-            data = ser.unique()
-            data_dict = defaultdict(lambda: defaultdict(lambda: dict()))
-            for key in data.keys():
-                # key[0]: first week day, key[2]: age_group, key[3]: gender, key[4:]: the actual values
-                data_dict[key[3]][key[0]][key[2]] = {key: value for key, value in zip(columns_names, key[4:])}
-                # data_dict[key[0]][key[3]][key[2]] = {key: value for key, value in zip(columns_names[1:], key[4:])}
+            # row[0]: first week day, row[2]: age_group, row[3]: gender, row[4:]: the actual values
+            data_dict = self._distinct_rows_to_dict(self._get_df_data(), (3, 0, 2),
+                                                    lambda row: dict(zip(columns_names, row[4:])))
         except KeyError as ke:
             self._logger.exception(ke, "No DataFrame's key exists according to the api client's query results")
         finally:
@@ -81,7 +82,7 @@ class AgeGender(DataHandler):
             else:
                 yield "No Data"
 
-    @lru_cache
+    @cached_result
     def statistics_by_given_first_week_day(self, week_day: str) ->\
             Generator[DefaultDict[str, Dict[str, Dict[str, str]]], None, None] or Generator[str, None, None]:
         """ Yields statistic data by given first week day grouped by gender.
@@ -96,14 +97,10 @@ class AgeGender(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            df = df[df['first_week_day'] == week_day]
-            ser = df.groupby([*df.columns])['gender']
-            data = ser.unique()
-            data_dict = defaultdict(lambda: dict())
-            for key in data.keys():
-                # key[0]: first week day, key[2]: age_group, key[3]: gender, key[4:]: the actual values
-                data_dict[key[3]][key[2]] = {key: value for key, value in zip(AgeGender.calculated_fields, key[4:])}
+            df = self._get_df_data_by_date('first_week_day', week_day)
+            # row[0]: first week day, row[2]: age_group, row[3]: gender, row[4:]: the actual values
+            data_dict = self._distinct_rows_to_dict(df, (3, 2),
+                                                    lambda row: dict(zip(AgeGender.calculated_fields, row[4:])))
         except KeyError as ke:
             self._logger.exception(ke, "No DataFrame's key exists according to the api client's query results")
         finally:
@@ -112,7 +109,7 @@ class AgeGender(DataHandler):
             else:
                 yield "No Data"
 
-    @lru_cache
+    @cached_result
     def statistics_by_age_group(self) ->\
             Generator[DefaultDict[str, DefaultDict[str, Dict[str, int or float]]], None, None] or\
             Generator[str, None, None]:
@@ -127,9 +124,7 @@ class AgeGender(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            for column_name in AgeGender.calculated_fields:
-                df[column_name] = [self._convert_string_to_int(item) for item in df[column_name]]
+            df = self._get_df_data(('age_group', *AgeGender.calculated_fields), AgeGender.calculated_fields)
             age_groups = df['age_group'].unique()
             data_dict = defaultdict(lambda: dict())
 
@@ -1,8 +1,9 @@
 import json
-from functools import lru_cache
 from typing import Dict, List, Generator, Tuple
 
 from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.result_cache import cached_result
+from covid19_il.data_handler.enums.column_type import ColumnType
 from covid19_il.logger.logger import Logger
 from covid19_il.data_handler.enums.area_event import AreaEvent
 
@@ -27,6 +28,13 @@ class Area(DataHandler):
 
     """
 
+    schema = {'date': ColumnType.DATE, 'town': ColumnType.CATEGORY, 'agas_code': ColumnType.INT}
+    date_column_name = 'date'
+    censoring_value = 0
+    fields_manifest = {'get_accumulated_tested_by_town': ('town', 'accumulated_tested'),
+                       'get_hospitalized_amount': ('town', 'accumulated_hospitalized'),
+                       'get_accumulated_recoveries_amount': ('town', 'accumulated_recoveries')}
+
     def __init__(self, logger: Logger.logger, json_data: dict) -> None:
         """ Initialize Base Class & Instance Attributes """
         super().__init__(logger, json_data)
@@ -45,9 +53,8 @@ class Area(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            df['agas_code'] = [self._convert_string_to_int(item) for item in df['agas_code']]
-            df = df[['town', 'agas_code', event_type.name.lower()]]
+            # an unknown agas code gets replaced by the censoring value(0)
+            df = self._get_df_data(('town', 'agas_code', event_type.name.lower()), ('agas_code',))
             ser_group_by = df.groupby(['town', 'agas_code'])[event_type.name.lower()]
             data_dict = json.loads(ser_group_by.unique().to_json())
             data_dict = {tuple(self._string_parser(key)): value[0] for key, value in data_dict.items()}
@@ -59,22 +66,6 @@ class Area(DataHandler):
             else:
                 yield "No Data"
 
-    def _convert_string_to_int(self, input_string: str) -> int:
-        """ Parsing string to int.
-
-        Note:
-            private method which get called other methods when a string need to be converted to int before computation.
-
-        Args:
-            input_string(str): given string for conversion.
-
-        Returns:
-            _(int): 0 to flag it as unknown area.
-
-        """
-
-        return 0 if input_string is None else input_string
-
     def _string_parser(self, str_key: str) -> List[str]:
         """ Parse & Clean string from unnecessary chars for better presentation.
 
@@ -112,11 +103,8 @@ class Area(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            # data which is under 15, replace it with a random number
-            df[group_by_column] = df[group_by_column].apply(
-                lambda input_string: int(input_string) if input_string != '<15' else 0)
-            df = df[['town', group_by_column]]
+            # data which is under 15 gets replaced by the censoring value
+            df = self._get_df_data(('town', group_by_column), (group_by_column,))
             ser_group_by = df.groupby('town')[group_by_column].unique()
             ser = ser_group_by.apply(lambda item: sum(item))
             ser = ser.sort_values(ascending=ascending_order)
@@ -129,7 +117,7 @@ class Area(DataHandler):
             else:
                 yield "No Data"
 
-    @lru_cache
+    @cached_result
     def get_accumulated_tested_by_town(self, ascending_order: bool = True) \
             -> Generator[Dict[str, int], None, None] or Generator[str, None, None]:
         """ Yields data of accumulated tested amount by town.
@@ -144,7 +132,7 @@ class Area(DataHandler):
 
         return self._get_data_by_column('accumulated_tested', ascending_order)
 
-    @lru_cache
+    @cached_result
     def get_hospitalized_amount(self, ascending_order: bool = True) \
             -> Generator[Dict[str, int], None, None] or Generator[str, None, None]:
         """ Yields data of hospitalized amount.
@@ -159,7 +147,7 @@ class Area(DataHandler):
 
         return self._get_data_by_column('accumulated_hospitalized', ascending_order)
 
-    @lru_cache
+    @cached_result
     def get_accumulated_recoveries_amount(self, ascending_order: bool = True) \
             -> Generator[Dict[str, int], None, None] or Generator[str, None, None]:
         """ Yields accumulated recoveries amount data.
@@ -1,10 +1,11 @@
 from collections import namedtuple, defaultdict
 from datetime import datetime as dt
-from functools import lru_cache
 from typing import Dict, NamedTuple, Tuple, DefaultDict, AnyStr, Generator
 
 from covid19_il.logger.logger import Logger
 from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.result_cache import cached_result
+from covid19_il.data_handler.enums.column_type import ColumnType
 
 
 class Cities(DataHandler):
@@ -27,12 +28,17 @@ class Cities(DataHandler):
     fields = ("City_name", "City_code", "Date", "Cumulative_verified_cases", "Cumulated_recovered",
               "Cumulated_deaths", "Cumulated_number_of_tests", "Cumulated_number_of_diagnostic_tests")
     city = namedtuple("City", fields, defaults=(None,) * len(fields))
+    schema = {'Date': ColumnType.DATE, 'City_Name': ColumnType.CATEGORY, **dict.fromkeys(fields[3:], ColumnType.INT)}
+    date_column_name = 'Date'
+    fields_manifest = {'top_cases_in_cities': ('Date', 'City_Name', *fields[3:]),
+                       'cases_statistics': fields[3:]}
+    filters_manifest = {'cities_by_date': {'date': 'Date'}}
 
     def __init__(self, logger: Logger.logger, json_data: dict) -> None:
         """ Initialize Base Class & Instance Attributes """
         super().__init__(logger, json_data)
 
-    @lru_cache(maxsize=None)
+    @cached_result
     def cities_by_date(self, date: str = dt.strftime(dt.now(), format="%Y-%m-%d")) \
             -> Generator[NamedTuple, None, None] or Generator[str, None, None]:
         """ Yields calculated cities of namedtuple with city's data props via given date in format
@@ -48,13 +54,8 @@ class Cities(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            df = df[df["Date"] == date]
-            data = df.groupby([*df.columns])["Date"].unique()
-            data_dict = defaultdict(NamedTuple)
-
-            for key in data.keys():
-                data_dict[key[0]] = Cities.city(*key)
+            df = self._get_df_data_by_date("Date", date)
+            data_dict = self._distinct_rows_to_dict(df, (0,), lambda row: Cities.city(*row))
         except KeyError as ke:
             self._logger.exception(ke, "No DataFrame's key exists according to the api client's query results")
         finally:
@@ -79,9 +80,7 @@ class Cities(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            for column_name in cities_fields:
-                df[column_name] = [self._convert_string_to_int(item) for item in df[column_name]]
+            df = self._get_df_data(("Date", "City_Name", *cities_fields), cities_fields)
 
             data_dict = defaultdict(lambda: defaultdict(int))
             for field in cities_fields:
@@ -100,7 +99,7 @@ class Cities(DataHandler):
             else:
                 yield "No Data"
 
-    @lru_cache
+    @cached_result
     def top_cases_in_cities(self)\
             -> Generator[DefaultDict[str, DefaultDict[str, int]], None, None] or Generator[str, None, None]:
         """ Yields top cities with 5 calculated properties or "No Data" as bad result.
@@ -115,7 +114,7 @@ class Cities(DataHandler):
 
         return self._get_top_cases_statistics(Cities.fields[3:])
 
-    @lru_cache
+    @cached_result
     def cases_statistics(self) \
             -> Generator[Dict[str, Dict[str, int or float]], None, None] or Generator[str, None, None]:
         """ Yields cases statistics.
@@ -1,31 +1,85 @@
 from abc import ABC
-from random import randint, seed
-import math
+import inspect
 from collections import defaultdict
+import numpy as np
 import pandas as pd
 import re
 
-from typing import Dict, DefaultDict, Tuple, AnyStr, Generator
+from typing import Any, Callable, Dict, DefaultDict, Tuple, AnyStr, Generator, List
 
 from covid19_il.logger.logger import Logger
+from covid19_il.metrics.metrics import Metrics, instrumented_method
+from covid19_il.profiling.profiler import profiled_method
+from covid19_il.data_handler.enums.column_type import ColumnType
+from covid19_il.data_handler.enums.censoring_policy import CensoringPolicy
+from covid19_il.data_handler.result_cache import ResultCache
+from covid19_il.data_handler.date_index import DateIndex
+import covid19_il.data_handler.consts as data_handler_consts
+import covid19_il.metrics.consts as metrics_consts
 
 
 class DataHandler(ABC):
     """ Covid19_IL Data Handler Abstract Base Class.
 
+    Note:
+        every public method of the handlers gets instrumented by instrumented_method's decorator(see
+        __init_subclass__), which records its latency & result's size once the package's Metrics are enabled, & by
+        profiled_method's decorator, which profiles its calls once the package's Profiler targets it.
+
     Attributes:
         _logger(Logger.logger): package's logger.
         _main_data(Dict): received data from api.
-        _df(DataFrame): converted data's json to pandas data frame.
+        _df(DataFrame): converted data's json to pandas data frame, without the CKAN's _id column.
+        _ids(Series or None): CKAN's _id column which gets dropped once from the data frame at load.
+        _typed_df(DataFrame): schema's columns of the data frame, converted once to their compact types.
         _total_number = total amount from api.
+        _result_cache(ResultCache): materialized results of the handler's methods, invalidated on data changes.
+        _date_indexes(Dict[str, DateIndex]): date column name: sorted index of the column, built on first use.
+        schema(Dict[str, ColumnType]): class attribute - column name: column type of the data resource's columns
+            which get converted once at load time.
+        date_column_name(str or None): class attribute - main date column of the data resource's date queries.
+        fields_manifest(Dict[str, Tuple[str]]): class attribute - public method's name: the only columns which it
+            reads, for requesting just these columns from the api. a method which isn't listed reads every column.
+        filters_manifest(Dict[str, Dict[str, str or Tuple[str, str]]]): class attribute - public method's name:
+            {parameter's name: column name or (column name, value's format)}, the method reads only the rows whose
+            column equals its parameter's (formatted) value, for requesting just these rows from the api.
+        censoring_policy(CensoringPolicy): class attribute - replacement policy of censored int values.
+        censoring_value(int): class attribute - replacement of censored int values by the fixed policy.
+        censoring_range(Tuple[int, int]): class attribute - inclusive range of censored int values' replacements by
+            the midpoint & seeded fill policies.
+        censoring_seed(int): class attribute - random seed of the seeded fill policy.
+        result_cache_max_size(int): class attribute - max amount of cached methods' results per instance.
+        result_cache_ttl(float or None): class attribute - seconds which a cached result is valid for.
 
     Methods:
+        __init_subclass__(cls, **kwargs): instruments the public methods of a data handler's class.
+        get_required_fields(cls, *methods_names: str): returns the columns which given methods read.
+        get_filters(cls, method_name: str, *args, **kwargs): returns the rows' filters of given method's call.
         _convert_json_to_data_frame(self): try returning the data frame's data as json, otherwise returns None.
-        _get_clean_copy_df_data(self): return a clean copy of class's data frame attribute.
+        _apply_schema(self, df: pd.DataFrame): returns the schema's columns of given data frame converted to their
+            types.
+        _refresh_typed_data(self): converts the schema's columns again & drops everything derived from the data.
+        append_records(self, records: List[Dict]): appends new records to the handler's data.
+        replace_records(self, records: List[Dict]): replaces the handler's data by given records.
+        _detach_ids(self, df: pd.DataFrame): keeps the CKAN's _id column aside & drops it from given data frame.
+        _get_df_data(self, columns_names: Tuple = None, typed_columns_names: Tuple = ()): returns a projection of
+            class's data frame attribute without copying the whole data.
         _string_parser(self, string: str): returns clean & non null string.
-        _convert_string_to_int(self, input_string: str): parsing string to int.
+        _convert_column_to_int(self, column: pd.Series): parsing a whole column of strings to ints in one pass.
+        set_censoring_policy(self, censoring_policy: CensoringPolicy, censoring_value: int = None,
+            censoring_seed: int = None): changes the replacement policy of censored int values.
+        _get_typed_column(self, column_name: str, column_type: ColumnType = ColumnType.INT): returns the pre-typed
+            column of given column name.
+        _get_date_index(self, column_name: str): returns the sorted index of given date column.
+        _get_df_data_by_date(self, column_name: str, date: str, columns_names: Tuple = None): returns the rows of
+            given date via the date index.
+        get_data_by_date_range(self, start_date: str = None, end_date: str = None, column_name: str = None): returns
+            the rows of the dates within given inclusive range.
         _get_data_by_column(self, column_name: str): Returns a generator of dictionary which include top total amount
             of given column name via data frame.
+        _get_distinct_rows(self, df: pd.DataFrame): returns the distinct complete rows of given data frame, sorted.
+        _distinct_rows_to_dict(self, df: pd.DataFrame, keys_positions: Tuple[int, ...],
+            get_value: Callable[[Tuple], Any]): returns the distinct rows of given data frame as a nested dictionary.
         _get_data_by_columns(self, columns_names: Tuple[AnyStr], grouped_by_column: str): Returns data as a generator
             by given amount of columns from a data frame.
         _get_statistics_by_columns_names(self, columns_names: Tuple[AnyStr]): Returns a generator which includes
@@ -33,11 +87,97 @@ class DataHandler(ABC):
 
     """
 
+    schema = {}
+    date_column_name = None
+    fields_manifest = {}
+    filters_manifest = {}
+    censoring_policy = CensoringPolicy.FIXED
+    # the value which the former per cell seed(0) & randint(1, 15) always produced for a censored value
+    censoring_value = 14
+    censoring_range = (1, 15)
+    censoring_seed = 0
+    result_cache_max_size = data_handler_consts.DEFAULT_RESULT_CACHE_MAX_SIZE
+    result_cache_ttl = data_handler_consts.DEFAULT_RESULT_CACHE_TTL
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """ Instruments & profiles the public methods which the data handler's class defines """
+        super().__init_subclass__(**kwargs)
+        for name, attribute in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(attribute) and \
+                    not getattr(attribute, "__instrumented__", False):
+                setattr(cls, name, instrumented_method(profiled_method(attribute)))
+
+    @classmethod
+    def get_required_fields(cls, *methods_names: str) -> Tuple[str, ...] or None:
+        """ Returns the columns which given methods read by the fields manifest, for the api's fields parameter.
+
+        Note:
+            the CKAN's _id column is always included, so the data keeps its max id for the incremental sync.
+
+        Args:
+            *methods_names(str): names of the handler's public methods.
+
+        Returns:
+            Tuple[str, ...] or None: union of the methods' columns by their order, or None when one of the methods
+                reads every column.
+
+        Raises:
+            ValueError: one of the names isn't a public method of the handler.
+
+        """
+
+        required_fields = {'_id': None}
+        for method_name in methods_names:
+            if method_name.startswith("_") or not callable(getattr(cls, method_name, None)):
+                raise ValueError(f"{method_name} isn't a public method of {cls.__name__}")
+            if method_name not in cls.fields_manifest:
+                return None
+            required_fields.update(dict.fromkeys(cls.fields_manifest[method_name]))
+
+        return tuple(required_fields)
+
+    @classmethod
+    def get_filters(cls, method_name: str, *args, **kwargs) -> Dict[str, str] or None:
+        """ Returns the rows which given method's call reads by the filters manifest, for the api's filters parameter.
+
+        Args:
+            method_name(str): name of the handler's public method.
+            *args: method's positional arguments.
+            **kwargs: method's keyword arguments.
+
+        Returns:
+            Dict[str, str] or None: column: required value, or None when the method reads every row.
+
+        Raises:
+            ValueError: the name isn't a public method of the handler.
+            TypeError: the arguments don't match the method's parameters.
+
+        """
+
+        if method_name.startswith("_") or not callable(getattr(cls, method_name, None)):
+            raise ValueError(f"{method_name} isn't a public method of {cls.__name__}")
+        if method_name not in cls.filters_manifest:
+            return None
+
+        # the signature is of the undecorated method, since the decorators keep it by functools.wraps
+        arguments = inspect.signature(getattr(cls, method_name)).bind(None, *args, **kwargs)
+        arguments.apply_defaults()
+        filters = {}
+        for parameter_name, column in cls.filters_manifest[method_name].items():
+            column_name, value_format = (column, "{}") if isinstance(column, str) else column
+            if arguments.arguments[parameter_name] is not None:
+                filters[column_name] = value_format.format(arguments.arguments[parameter_name])
+
+        return filters or None
+
     def __init__(self, logger: Logger.logger, json_data: Dict) -> None:
         """ Class Initialization """
         self._logger = logger
         self._main_data = json_data
-        self._df = self._convert_json_to_data_frame()
+        self._result_cache = ResultCache(self.result_cache_max_size, self.result_cache_ttl)
+        self._ids = None
+        self._df = self._detach_ids(self._convert_json_to_data_frame())
+        self._refresh_typed_data()
         self._total_number = None
 
     def __repr__(self) -> str:
@@ -63,6 +203,11 @@ class DataHandler(ABC):
     def logger(self, new_logger) -> None:
         self._logger = new_logger
 
+    @property
+    def result_cache(self) -> ResultCache:
+        """ ResultCache: Returns the cache of the handler's methods' materialized results """
+        return self._result_cache
+
     @property
     def main_data(self) -> dict:
         """ dict: Returns the original data as is """
@@ -76,7 +221,9 @@ class DataHandler(ABC):
     @df.setter
     def df(self, input_df) -> None:
         if isinstance(input_df, pd.DataFrame):
-            self._df = input_df
+            self._df = self._detach_ids(input_df.drop(columns='_id') if '_id' in input_df else input_df,
+                                        input_df.get('_id'))
+            self._refresh_typed_data()
         else:
             self._logger.exception(f"the input value: {input_df} isn't pandas data frame")
             raise TypeError(f"the input value: {input_df} isn't pandas data frame")
@@ -117,31 +264,311 @@ class DataHandler(ABC):
         """
 
         df_data = None
+        metrics = Metrics()
         try:
-            df_data = pd.json_normalize(data=self._main_data["result"]["records"])
+            with metrics.timer("handler_json_normalize_seconds", handler=self.__class__.__name__):
+                df_data = pd.json_normalize(data=self._main_data["result"]["records"])
+            metrics.observe("handler_json_normalize_rows", len(df_data), metrics_consts.ROWS_BUCKETS,
+                            handler=self.__class__.__name__)
         except TypeError as te:
             self.logger.exception(te)
         finally:
             return df_data
 
-    def _get_clean_copy_df_data(self) -> pd.DataFrame:
-        """ Return a clean copy of class's data frame attribute.
+    def _detach_ids(self, df: pd.DataFrame or None, ids: pd.Series or None = None) -> pd.DataFrame or None:
+        """ Keeps the CKAN's _id column aside & drops it from given data frame.
 
         Note:
-            private method which get called other methods at the beginning before computation.
+            private method which get called once whenever the handler's data frame gets loaded or changed, so the
+            other methods can read the data frame as is instead of copying it for dropping the _id column.
 
         Args:
-            None.
+            df(DataFrame or None): freshly converted data frame, which gets changed in place.
+            ids(Series or None): _id column which was already taken out of the data frame.
 
         Returns:
-            df(DataFrame): cleaned copy pandas data frame
+            df(DataFrame or None): data frame without the _id column.
 
         """
 
-        df = self._df.copy()
-        del df['_id']
+        if df is not None and '_id' in df:
+            ids = df.pop('_id')
+        self._ids = None if ids is None else pd.to_numeric(ids, errors="coerce")
         return df
 
+    @property
+    def ids(self) -> pd.Series or None:
+        """ Series or None: Returns the CKAN records' _id column which got dropped from the data frame """
+        return self._ids
+
+    @property
+    def max_id(self) -> int:
+        """ int: Returns the highest CKAN record's _id of the data, or 0 when there is no data """
+        if self._ids is None or self._ids.empty:
+            return 0
+        return int(self._ids.max())
+
+    @instrumented_method
+    @profiled_method
+    def append_records(self, records: List[Dict]) -> None:
+        """ Appends new records to the handler's data, e.g. the new tail of an incremental sync.
+
+        Args:
+            records(List[Dict]): new records as returned by the api.
+
+        Returns:
+            None.
+
+        """
+
+        if not records:
+            return
+
+        self._main_data["result"]["records"].extend(records)
+        ids = self._ids
+        new_df = self._detach_ids(pd.json_normalize(data=records))
+        if ids is not None and self._ids is not None:
+            self._ids = pd.concat([ids, self._ids], ignore_index=True)
+        self._df = new_df if self._df is None or self._df.empty else pd.concat([self._df, new_df], ignore_index=True)
+        self._refresh_typed_data()
+        if "total" in self._main_data["result"]:
+            self._main_data["result"]["total"] = len(self._df)
+        self._total_number = None
+        self._logger.info("appended %d records to %s's data", len(records), self.__class__.__name__)
+
+    @instrumented_method
+    @profiled_method
+    def replace_records(self, records: List[Dict]) -> None:
+        """ Replaces the handler's data by given records, e.g. the full resync of a republished data resource.
+
+        Args:
+            records(List[Dict]): every record of the data resource as returned by the api.
+
+        Returns:
+            None.
+
+        """
+
+        self._main_data["result"]["records"] = list(records)
+        self._main_data["result"]["total"] = len(records)
+        self.df = pd.json_normalize(data=records)
+        self._total_number = None
+        self._logger.info("replaced %s's data by %d records", self.__class__.__name__, len(records))
+
+    def _convert_column(self, column: pd.Series, column_type: ColumnType) -> pd.Series:
+        """ Converts a column of strings to given column type.
+
+        Note:
+            private method which get called by _apply_schema's method.
+
+        Args:
+            column(Series): column of strings.
+            column_type(ColumnType): required column's type.
+
+        Returns:
+            column(Series): converted column.
+
+        """
+
+        if column_type is ColumnType.INT:
+            return self._convert_column_to_int(column)
+        if column_type is ColumnType.FLOAT:
+            return pd.to_numeric(column, errors="coerce")
+        if column_type is ColumnType.DATE:
+            return pd.to_datetime(column.mask(column == "NULL"), errors="coerce")
+
+        return column.astype("category")
+
+    def _apply_schema(self, df: pd.DataFrame or None) -> pd.DataFrame or None:
+        """ Returns the schema's columns of given data frame converted to their compact types.
+
+        Note:
+            private method which get called once whenever the handler's data frame gets loaded or changed, so the
+            other methods aggregate pre-typed columns instead of parsing strings on every call.
+
+        Args:
+            df(DataFrame or None): data frame of strings as converted from the api's json data.
+
+        Returns:
+            typed_df(DataFrame or None): converted schema's columns which exist in the data frame.
+
+        """
+
+        if df is None:
+            return None
+
+        typed_columns = {}
+        for column_name, column_type in self.schema.items():
+            if column_name in df:
+                try:
+                    typed_columns[column_name] = self._convert_column(df[column_name], column_type)
+                except (TypeError, ValueError) as error:
+                    self._logger.exception(f"couldn't convert column {column_name} to {column_type.name}: {error}")
+
+        return pd.DataFrame(typed_columns, index=df.index)
+
+    def _refresh_typed_data(self) -> None:
+        """ Converts the schema's columns again & drops everything which was derived from the former data.
+
+        Note:
+            private method which get called whenever the handler's data frame gets loaded or changed.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        """
+
+        self._typed_df = self._apply_schema(self._df)
+        self._date_indexes = {}
+        self._result_cache.clear()
+
+    def _get_typed_column(self, column_name: str, column_type: ColumnType = ColumnType.INT) -> pd.Series:
+        """ Returns the pre-typed column of given column name.
+
+        Note:
+            private method which get called other methods before computation. a column which isn't part of the
+            schema gets converted to given column type on the fly.
+
+        Args:
+            column_name(str): given column name.
+            column_type(ColumnType): column's type when it isn't part of the schema.
+
+        Returns:
+            column(Series): typed column.
+
+        Raises:
+            KeyError: column name doesn't exist in the data frame.
+
+        """
+
+        if self._typed_df is not None and column_name in self._typed_df:
+            return self._typed_df[column_name]
+
+        return self._convert_column(self._df[column_name], column_type)
+
+    def _get_date_index(self, column_name: str) -> DateIndex:
+        """ Returns the sorted index of given date column, which gets built on first use.
+
+        Note:
+            private method which get called by the methods which query the data by dates.
+
+        Args:
+            column_name(str): date column name.
+
+        Returns:
+            DateIndex: sorted index of the column's dates.
+
+        Raises:
+            KeyError: column name doesn't exist in the data frame.
+
+        """
+
+        date_index = self._date_indexes.get(column_name)
+        if date_index is None:
+            date_index = DateIndex(self._get_typed_column(column_name, ColumnType.DATE))
+            self._date_indexes[column_name] = date_index
+
+        return date_index
+
+    def _get_df_data_by_date(self, column_name: str, date: str, columns_names: Tuple = None) -> pd.DataFrame:
+        """ Returns the rows whose date column equals given date string, via the date index.
+
+        Note:
+            private method which get called by other methods at the beginning before computation. the index narrows
+            the rows by a binary search, then only those rows & the unindexed ones get compared to the exact date
+            string, as the former full scan did.
+
+        Args:
+            column_name(str): date column name.
+            date(str): required date string as it appears in the data, e.g. "2020-10-03".
+            columns_names(Tuple): required columns names including the date column, all of the columns when None.
+
+        Returns:
+            df(DataFrame): rows of the date, in the data frame's order.
+
+        Raises:
+            KeyError: column name doesn't exist in the data frame.
+
+        """
+
+        df = self._get_df_data(columns_names)
+        date_index = self._get_date_index(column_name)
+        try:
+            positions = date_index.get_positions(date)
+        except (TypeError, ValueError):
+            positions = date_index.unindexed_positions
+        else:
+            positions = np.union1d(positions, date_index.unindexed_positions)
+
+        df = df.iloc[positions]
+        return df[df[column_name] == date]
+
+    @instrumented_method
+    @profiled_method
+    def get_data_by_date_range(self, start_date: str = None, end_date: str = None, column_name: str = None) \
+            -> pd.DataFrame:
+        """ Returns the rows whose dates are within given inclusive range, via the date index.
+
+        Args:
+            start_date(str): first date of the range, e.g. "2020-10-01", unbounded when None.
+            end_date(str): last date of the range, e.g. "2020-10-31", unbounded when None.
+            column_name(str): date column name, by default the data resource's main date column.
+
+        Returns:
+            df(DataFrame): rows of the range, in the data frame's order.
+
+        Raises:
+            ValueError: a date isn't a valid date string or the data resource has no date column.
+            KeyError: column name doesn't exist in the data frame.
+
+        """
+
+        column_name = column_name or self.date_column_name
+        if column_name is None:
+            self._logger.exception(f"{self.__class__.__name__} has no date column")
+            raise ValueError(f"{self.__class__.__name__} has no date column")
+
+        try:
+            positions = self._get_date_index(column_name).get_range_positions(start_date, end_date)
+        except ValueError as ve:
+            self._logger.exception(f"Wrong Date Format, the format should be like: '2020-10-03'. {ve}")
+            raise
+
+        return self._get_df_data().iloc[positions]
+
+    def _get_df_data(self, columns_names: Tuple = None, typed_columns_names: Tuple = ()) -> pd.DataFrame:
+        """ Returns a projection of class's data frame attribute without copying the whole data.
+
+        Note:
+            private method which get called other methods at the beginning before computation. the returned data
+            frame may share its data with class's data frame attribute, so callers must not change it in place.
+
+        Args:
+            columns_names(Tuple): required columns names, all of the columns when None.
+            typed_columns_names(Tuple): columns names out of the required ones which get returned pre-typed.
+
+        Returns:
+            df(DataFrame): projected pandas data frame.
+
+        Raises:
+            KeyError: column name doesn't exist in the data frame.
+
+        """
+
+        if columns_names is None:
+            if not typed_columns_names:
+                return self._df
+            columns_names = tuple(self._df.columns)
+
+        if not typed_columns_names:
+            return self._df[[*columns_names]]
+
+        return pd.DataFrame({column_name: self._get_typed_column(column_name) if column_name in typed_columns_names
+                             else self._df[column_name] for column_name in columns_names}, index=self._df.index)
+
     def _string_parser(self, string: str) -> str:
         """ Returns clean & non null string.
 
@@ -158,25 +585,68 @@ class DataHandler(ABC):
 
         return string.strip() if (string != "NULL" and string) else "Unknown"
 
-    def _convert_string_to_int(self, input_string: str) -> int:
-        """ Parsing string to int.
+    def _convert_column_to_int(self, column: pd.Series) -> pd.Series:
+        """ Parsing a whole column of strings to ints in one vectorized pass.
 
         Note:
-            private method which get called other methods when a string need to be converted to int before computation.
+            private method which get called other methods when a column need to be converted to ints before
+            computation. decimals get truncated, while censored or missing values("<15", "NULL", "N", None) get
+            replaced by the handler's censoring policy.
+
+        Args:
+            column(Series): given column of strings for conversion.
+
+        Returns:
+            column(Series): column of int64 values.
+
+        """
+
+        numeric = pd.to_numeric(column, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        censored = np.isnan(numeric)
+        values = np.trunc(numeric)
+        if censored.any():
+            low, high = self.censoring_range
+            if self.censoring_policy is CensoringPolicy.MIDPOINT:
+                values[censored] = (low + high) // 2
+            elif self.censoring_policy is CensoringPolicy.SEEDED_FILL:
+                values[censored] = np.random.default_rng(self.censoring_seed).integers(low, high, size=censored.sum(),
+                                                                                       endpoint=True)
+            else:
+                values[censored] = self.censoring_value
+
+        return pd.Series(values.astype("int64"), index=column.index, name=column.name)
+
+    @instrumented_method
+    @profiled_method
+    def set_censoring_policy(self,
+                             censoring_policy: CensoringPolicy,
+                             censoring_value: int = None,
+                             censoring_seed: int = None) -> None:
+        """ Changes the replacement policy of censored int values and converts the typed columns again.
 
         Args:
-            input_string(str): given string for conversion.
+            censoring_policy(CensoringPolicy): replacement policy of censored int values.
+            censoring_value(int): replacement of censored int values by the fixed policy.
+            censoring_seed(int): random seed of the seeded fill policy.
 
         Returns:
-            _(int): integer value.
+            None.
+
+        Raises:
+            TypeError: censoring policy isn't CensoringPolicy enum.
 
         """
-        seed(0)
-        return randint(1, 15) if (input_string == "<15" or
-                                  input_string == "NULL" or
-                                  input_string == "N" or
-                                  input_string == math.isnan(float(input_string))) \
-            else int(input_string.split('.')[0])
+
+        if not isinstance(censoring_policy, CensoringPolicy):
+            self._logger.exception(f"the input value: {censoring_policy} isn't CensoringPolicy")
+            raise TypeError(f"the input value: {censoring_policy} isn't CensoringPolicy")
+
+        self.censoring_policy = censoring_policy
+        if censoring_value is not None:
+            self.censoring_value = censoring_value
+        if censoring_seed is not None:
+            self.censoring_seed = censoring_seed
+        self._refresh_typed_data()
 
     def _date_validation(self, pattern: str, date: str):
         """ Validate date as input regular expression.
@@ -220,8 +690,7 @@ class DataHandler(ABC):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            df = df[['date', group_by_column]]
+            df = self._get_df_data(('date', group_by_column))
             ser = df.groupby('date')[group_by_column].unique()
             data_dict = {key: value[0] for (key, value) in
                          sorted(ser.items(), key=lambda item: item[0], reverse=ascending_order)}
@@ -233,6 +702,78 @@ class DataHandler(ABC):
             else:
                 yield "No Data", ""
 
+    def _get_distinct_rows(self, df: pd.DataFrame) -> List[Tuple]:
+        """ Returns the distinct rows of given data frame which have no missing values, sorted by all of its columns.
+
+        Note:
+            private method which get called by other methods for iterating a data frame's distinct rows. it's the same
+            rows by the same order as the keys of df.groupby([*df.columns]), without the hash group by over every
+            column: every column gets factorized once to its sorted codes, the codes get combined into a single int
+            key per row & the first row of every distinct key gets taken by the keys' order.
+
+        Args:
+            df(DataFrame): data frame or a projection of it.
+
+        Returns:
+            List[Tuple]: distinct rows as tuples of the columns' values.
+
+        """
+
+        if df.empty or df.columns.empty:
+            return []
+
+        columns_codes = []
+        for position in range(len(df.columns)):
+            # missing values get the code -1
+            codes, uniques = pd.factorize(df.iloc[:, position], sort=True)
+            columns_codes.append((codes, max(len(uniques), 1)))
+
+        rows_positions = np.flatnonzero(np.logical_and.reduce([codes >= 0 for codes, _ in columns_codes]))
+        keys = np.zeros(len(rows_positions), dtype=np.int64)
+        keys_size = 1
+        for codes, size in columns_codes:
+            if keys_size * size > np.iinfo(np.int64).max:
+                # compressing the keys to their sorted distinct codes keeps their order
+                uniques, keys = np.unique(keys, return_inverse=True)
+                keys_size = len(uniques)
+            keys = keys * size + codes[rows_positions]
+            keys_size *= size
+
+        # the distinct keys' codes are numbered by their first rows' order, so a new maximum marks a first row
+        keys_codes, distinct_keys = pd.factorize(keys)
+        first_rows = np.flatnonzero(np.diff(np.maximum.accumulate(keys_codes), prepend=-1) > 0)
+        rows_positions = rows_positions[first_rows[np.argsort(distinct_keys)]]
+        distinct_df = df.iloc[rows_positions]
+        return list(zip(*(distinct_df.iloc[:, position].tolist() for position in range(len(df.columns)))))
+
+    def _distinct_rows_to_dict(self, df: pd.DataFrame, keys_positions: Tuple[int, ...],
+                               get_value: Callable[[Tuple], Any]) -> DefaultDict[Any, Any]:
+        """ Returns the distinct rows of given data frame as a nested dictionary by given columns' positions.
+
+        Note:
+            private method which get called by other methods for arranging distinct rows' data. every row is set at
+            data_dict[row[keys_positions[0]]][row[keys_positions[1]]]..., a later row overrides an earlier one with
+            the same keys.
+
+        Args:
+            df(DataFrame): data frame or a projection of it.
+            keys_positions(Tuple[int, ...]): positions of the columns which are the nested dictionary's keys by depth.
+            get_value(Callable[[Tuple], Any]): returns the value of a distinct row.
+
+        Returns:
+            DefaultDict[Any, Any]: nested dictionary of the rows' values.
+
+        """
+
+        data_dict = defaultdict(dict)
+        for row in self._get_distinct_rows(df):
+            nested_dict = data_dict
+            for position in keys_positions[:-1]:
+                nested_dict = nested_dict.setdefault(row[position], {})
+            nested_dict[row[keys_positions[-1]]] = get_value(row)
+
+        return data_dict
+
     def _get_data_by_columns(self, columns_names: Tuple, grouped_by_column: str) -> \
             Generator[DefaultDict[str, DefaultDict[str, DefaultDict[str, int]]], None, None] or \
             Generator[Tuple[str, str], None, None]:
@@ -286,20 +827,19 @@ class DataHandler(ABC):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
+            # assigned only once every column succeeded, so a missing column yields "No Data" rather than a part
+            columns_statistics = {}
             for column_name in columns_names:
-                df[column_name] = [self._convert_string_to_int(item) for item in df[column_name]]
-
-            data_dict = {}
-            for column_name in columns_names:
-                data_dict[column_name] = {"min": df[column_name].min(),
-                                          "max": df[column_name].max(),
-                                          "mean": df[column_name].mean(),
-                                          "sum": df[column_name].sum()
-                                          }
+                column = self._get_typed_column(column_name)
+                columns_statistics[column_name] = {"min": column.min(),
+                                                   "max": column.max(),
+                                                   "mean": column.mean(),
+                                                   "sum": column.sum()
+                                                   }
+            data_dict = columns_statistics
 
         except KeyError as ke:
-            self._logger.exception(ke, "No DataFrame's key exists according to the api client's query results")
+            self._logger.exception("No DataFrame's key exists according to the api client's query results: %s", ke)
         finally:
             if bool(data_dict):
                 yield from data_dict.items()
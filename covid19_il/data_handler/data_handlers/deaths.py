@@ -1,9 +1,10 @@
 from collections import defaultdict
-from functools import lru_cache
 from typing import Dict, DefaultDict, Generator
 
 from covid19_il.logger.logger import Logger
 from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.result_cache import cached_result
+from covid19_il.data_handler.enums.column_type import ColumnType
 
 
 class Deaths(DataHandler):
@@ -24,11 +25,19 @@ class Deaths(DataHandler):
 
     """
 
+    schema = {'gender': ColumnType.CATEGORY, 'age_group': ColumnType.CATEGORY}
+    fields_manifest = {'amount_of_deaths': ('gender', 'age_group'),
+                       'amount_of_ventilated': ('gender', 'age_group', 'Ventilated'),
+                       'time_between_positive_and_hospitalization': ('age_group',
+                                                                     'Time_between_positive_and_hospitalization'),
+                       'length_of_hospitalization': ('age_group', 'Length_of_hospitalization'),
+                       'time_between_positive_and_death': ('age_group', 'Time_between_positive_and_death')}
+
     def __init__(self, logger: Logger.logger, json_data: Dict) -> None:
         """ Initialize Base Class & Instance Attributes """
         super().__init__(logger, json_data)
 
-    @lru_cache
+    @cached_result
     def amount_of_deaths(self) \
             -> Generator[DefaultDict[str, DefaultDict[str, int]], None, None] or Generator[str, None, None]:
         """ Yields amount of deaths data.
@@ -43,8 +52,7 @@ class Deaths(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            df = df[['gender', 'age_group']]
+            df = self._get_df_data(('gender', 'age_group'))
             data = df.value_counts()
             data_dict = defaultdict(lambda: defaultdict(int))
 
@@ -59,7 +67,7 @@ class Deaths(DataHandler):
             else:
                 yield "No Data"
 
-    @lru_cache
+    @cached_result
     def amount_of_ventilated(self) -> \
             Generator[DefaultDict[str, DefaultDict[str, DefaultDict[str, int]]], None, None] or \
             Generator[str, None, None]:
@@ -93,8 +101,7 @@ class Deaths(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            df = df[['age_group', group_by_column]]
+            df = self._get_df_data(('age_group', group_by_column))
             ser_group_by = df.groupby(['age_group'])[group_by_column]
             data_from_series = ser_group_by.value_counts().to_dict()
             data_dict = defaultdict(lambda: defaultdict(int))
@@ -109,7 +116,7 @@ class Deaths(DataHandler):
             else:
                 yield "No Data"
 
-    @lru_cache
+    @cached_result
     def time_between_positive_and_hospitalization(self) \
             -> Generator[DefaultDict[str, DefaultDict[str, int]], None, None] or Generator[str, None, None]:
         """ Yields amount of time between positive and hospitalization by age group & gender data.
@@ -124,7 +131,7 @@ class Deaths(DataHandler):
 
         return self._get_data_by_column('Time_between_positive_and_hospitalization')
 
-    @lru_cache
+    @cached_result
     def length_of_hospitalization(self) \
             -> Generator[DefaultDict[str, DefaultDict[str, int]], None, None] or Generator[str, None, None]:
         """ Yields length of hospitalization's amount by age group & gender data.
@@ -139,7 +146,7 @@ class Deaths(DataHandler):
 
         return self._get_data_by_column('Length_of_hospitalization')
 
-    @lru_cache
+    @cached_result
     def time_between_positive_and_death(self) \
             -> Generator[DefaultDict[str, DefaultDict[str, int]], None, None] or Generator[str, None, None]:
         """ Yields time between positive and death amount by age group & gender data.
@@ -1,12 +1,12 @@
 import inspect
 from collections import defaultdict
-from functools import lru_cache
-from pandas.core.series import Series
 from pandas import DataFrame
-from typing import Tuple, Dict, DefaultDict, Generator
+from typing import Tuple, Dict, DefaultDict, Generator, List
 
 from covid19_il.logger.logger import Logger
 from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.result_cache import cached_result
+from covid19_il.data_handler.enums.column_type import ColumnType
 
 
 class Hospitalized(DataHandler):
@@ -16,38 +16,42 @@ class Hospitalized(DataHandler):
         None.
 
     Methods:
-        _arrange_data_before_processing(self, df, method_name: str): Get df columns name list for group by then return
-            a series with unique items
+        _arrange_data_before_processing(self, df, method_name: str): Get df columns name list without the date then
+            return the distinct rows
         hospitalized_total_stats(self): Yields Hospitalized Total Stats data.
         hospitalized_stats_by_date(self, date: str): Yields Hospitalized statistics by given date.
 
     """
 
+    schema = {'תאריך': ColumnType.DATE}
+    date_column_name = 'תאריך'
+    filters_manifest = {'hospitalized_stats_by_date': {'date': ('תאריך', '{}T00:00:00')}}
+
     def __init__(self, logger: Logger.logger, json_data: dict) -> None:
         """ Initialize Base Class & Instance Attributes """
         super().__init__(logger, json_data)
 
-    def _arrange_data_before_processing(self, df: DataFrame, method_name: str) -> Tuple[Series, list]:
-        """ Get df columns name list for group by then return a series with unique items.
+    def _arrange_data_before_processing(self, df: DataFrame, method_name: str) -> Tuple[List[Tuple], list]:
+        """ Get df columns name list without the date then return the distinct rows.
 
         Args:
             df(DataFrame): the data frame itself.
             method_name(str): the name of the method which called this helper method.
 
         Returns:
-            _(Tuple[Series, list]): unique values of series grouped by & data frame's columns.
+            _(Tuple[List[Tuple], list]): distinct rows, with the date only for hospitalized_total_stats, & data
+                frame's columns without the date.
 
         """
 
         df_columns = df.columns.tolist()
+        df_columns.remove('תאריך')
         if method_name == "hospitalized_total_stats":
-            ser = df.groupby([*df_columns])['תאריך']
-            df_columns.remove('תאריך')
+            rows = self._get_distinct_rows(df)
         else:
-            df_columns.remove('תאריך')
-            ser = df.groupby([*df_columns])['תאריך']
+            rows = self._get_distinct_rows(df[df_columns])
 
-        return ser.unique(), df_columns
+        return rows, df_columns
 
     def hospitalized_total_stats(self) -> Generator[DefaultDict[str, Dict[str, float or int]], None, None] or \
                                           Generator[Tuple[str, str], None, None]:
@@ -64,16 +68,16 @@ class Hospitalized(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
+            df = self._get_df_data()
             data, df_columns = \
                 self._arrange_data_before_processing(df, method_name=inspect.currentframe().f_code.co_name)
             data_dict = defaultdict(lambda: dict())
 
-            for key, _ in data.items():
-                # key[0] - date, key[1:] - data/values
-                date_as_clean_key = key[0].split('T')[0]
+            for row in data:
+                # row[0] - date, row[1:] - data/values
+                date_as_clean_key = row[0].split('T')[0]
                 data_dict[date_as_clean_key] =\
-                    {column_name: data for (column_name, data) in zip(df_columns, key[1:])}
+                    {column_name: data for (column_name, data) in zip(df_columns, row[1:])}
 
         except KeyError as ke:
             self._logger.exception(ke, "No DataFrame's key exists according to the api client's query results")
@@ -83,7 +87,7 @@ class Hospitalized(DataHandler):
             else:
                 yield "No Data", ""
 
-    @lru_cache
+    @cached_result
     def hospitalized_stats_by_date(self, date: str) \
             -> Generator[Dict[str, float or int or str], None, None] or Generator[Tuple[str, str], None, None]:
         """ Yields Hospitalized statistics by given date.
@@ -106,11 +110,10 @@ class Hospitalized(DataHandler):
         data_dict = None
         try:
             date += "T00:00:00"
-            df = self._get_clean_copy_df_data()
-            df = df[df['תאריך'] == date]
+            df = self._get_df_data_by_date('תאריך', date)
             data, df_columns = \
                 self._arrange_data_before_processing(df, method_name=inspect.currentframe().f_code.co_name)
-            data_dict = {column_name: data for (column_name, data) in zip(df_columns, *data.keys())}
+            data_dict = {column_name: data for (column_name, data) in zip(df_columns, *data)}
         except KeyError as ke:
             self._logger.exception(ke, "No DataFrame's key exists according to the api client's query results")
         finally:
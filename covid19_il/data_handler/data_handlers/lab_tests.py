@@ -1,9 +1,10 @@
 from collections import namedtuple
-from functools import lru_cache
 from typing import Dict, Generator, NamedTuple, Tuple
 
 from covid19_il.logger.logger import Logger
 from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.result_cache import cached_result
+from covid19_il.data_handler.enums.column_type import ColumnType
 
 
 class LabTests(DataHandler):
@@ -26,6 +27,13 @@ class LabTests(DataHandler):
 
     fields = ('corona_result', 'lab_id', 'test_for_corona_diagnosis', 'is_first_Test')
     test = namedtuple("CoronaTest", fields, defaults=(None,) * len(fields))
+    schema = {'test_date': ColumnType.DATE, 'result_date': ColumnType.DATE}
+    date_column_name = 'test_date'
+    fields_manifest = {'corona_results': ('corona_result',),
+                       'lab_tests_statistics': ('lab_id',),
+                       'is_first_test_statistics': ('is_first_Test',),
+                       'test_for_corona_statistics': ('test_for_corona_diagnosis',)}
+    filters_manifest = {'tests_results_data_by_test_date': {'date': 'test_date'}}
 
     def __init__(self, logger: Logger.logger, json_data: Dict) -> None:
         """ Initialize Base Class & Instance Attributes """
@@ -50,8 +58,7 @@ class LabTests(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            df = df[column_name]
+            df = self._get_df_data()[column_name]
             ser = df.value_counts()
             if is_sorted:
                 data_dict = {key: value for key, value in sorted(ser.items(), key=lambda item: item[1], reverse=True)}
@@ -66,7 +73,7 @@ class LabTests(DataHandler):
             else:
                 yield "No Data", ""
 
-    @lru_cache
+    @cached_result
     def corona_results(self) -> Generator[Dict[str, int], None, None] or Generator[Tuple[str, str], None, None]:
         """ Yields value counts of corona results.
 
@@ -80,7 +87,7 @@ class LabTests(DataHandler):
 
         return self._get_statistics_by_column('corona_result', True)
 
-    @lru_cache
+    @cached_result
     def lab_tests_statistics(self) -> Generator[Dict[str, int], None, None] or Generator[Tuple[str, str], None, None]:
         """ Yields value counts of lab tests.
 
@@ -94,7 +101,7 @@ class LabTests(DataHandler):
 
         return self._get_statistics_by_column('lab_id', True)
 
-    @lru_cache
+    @cached_result
     def is_first_test_statistics(self) \
             -> Generator[Dict[str, int], None, None] or Generator[Tuple[str, str], None, None]:
         """ Yields value counts of if is it the first test for tested persons.
@@ -109,7 +116,7 @@ class LabTests(DataHandler):
 
         return self._get_statistics_by_column('is_first_Test')
 
-    @lru_cache
+    @cached_result
     def test_for_corona_statistics(self) \
             -> Generator[Dict[str, int], None, None] or Generator[Tuple[str, str], None, None]:
         """ Yields value counts of test_for_corona_statistics.
@@ -125,7 +132,7 @@ class LabTests(DataHandler):
 
         return self._get_statistics_by_column('test_for_corona_diagnosis')
 
-    @lru_cache
+    @cached_result
     def tests_results_data_by_test_date(self, date: str) \
             -> Generator[NamedTuple, None, None] or Generator[str, None, None]:
         """ Yields test results data by given test date as a namedtuple.
@@ -140,15 +147,12 @@ class LabTests(DataHandler):
 
         data = None
         try:
-            df = self._get_clean_copy_df_data()
-            df = df[df['test_date'] == date]
-            ser_group_by = df.groupby([*df.columns])['test_date'].unique()
-            data = ser_group_by.keys()
+            data = self._get_distinct_rows(self._get_df_data_by_date('test_date', date))
         except KeyError as ke:
             self._logger.exception(ke, "No DataFrame's key exists according to the api client's query results")
         finally:
-            if not data.empty:
-                for key in data:
-                    yield LabTests.test(*key[2:])
+            if data:
+                for row in data:
+                    yield LabTests.test(*row[2:])
             else:
                 yield "No Data"
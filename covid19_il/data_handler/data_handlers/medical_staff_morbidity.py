@@ -1,9 +1,10 @@
 from collections import defaultdict
-from functools import lru_cache
 from typing import Dict, Tuple, Any, Generator
 
 from covid19_il.logger.logger import Logger
 from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.result_cache import cached_result
+from covid19_il.data_handler.enums.column_type import ColumnType
 
 
 class MedicalStaffMorbidity(DataHandler):
@@ -29,6 +30,17 @@ class MedicalStaffMorbidity(DataHandler):
     confirmed_columns_names = ('confirmed_cases_physicians', 'confirmed_cases_nurses',
                                'confirmed_cases_other_healthcare_workers')
     isolated_columns_names = ('isolated_physicians', 'isolated_nurses', 'isolated_other_healthcare_workers')
+    schema = {'Date': ColumnType.DATE,
+              **dict.fromkeys(confirmed_columns_names + isolated_columns_names, ColumnType.INT)}
+    date_column_name = 'Date'
+    fields_manifest = {'confirmed_cases': ('Date', *confirmed_columns_names),
+                       'isolated_cases': ('Date', *isolated_columns_names),
+                       'confirmed_cases_by_date': ('Date', *confirmed_columns_names),
+                       'isolated_cases_by_date': ('Date', *isolated_columns_names),
+                       'confirmed_cases_statistics': confirmed_columns_names,
+                       'isolated_cases_statistics': isolated_columns_names}
+    filters_manifest = {'confirmed_cases_by_date': {'date': 'Date'},
+                        'isolated_cases_by_date': {'date': 'Date'}}
 
     def __init__(self, logger: Logger.logger, json_data: dict) -> None:
         """ Initialize Base Class & Instance Attributes """
@@ -52,7 +64,7 @@ class MedicalStaffMorbidity(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
+            df = self._get_df_data(('Date', *required_columns_names))
             ser = df.groupby(['Date', *required_columns_names])['Date']
             data = ser.unique()
             data_dict = defaultdict(lambda: dict())
@@ -69,7 +81,7 @@ class MedicalStaffMorbidity(DataHandler):
             else:
                 yield "No Data", ""
 
-    @lru_cache
+    @cached_result
     def confirmed_cases(self) \
             -> Generator[Dict[str, Dict[str, int or str]], None, None] or Generator[Tuple[str, str], None, None]:
         """ Yields total confirmed cases data.
@@ -84,7 +96,7 @@ class MedicalStaffMorbidity(DataHandler):
 
         return self._get_data_by_columns(MedicalStaffMorbidity.confirmed_columns_names)
 
-    @lru_cache
+    @cached_result
     def isolated_cases(self) \
             -> Generator[Dict[str, Dict[str, int or str]], None, None] or Generator[Tuple[str, str], None, None]:
         """ Yields total isolated cases.
@@ -123,11 +135,9 @@ class MedicalStaffMorbidity(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            df = df[df['Date'] == date]
-            ser = df.groupby([*required_columns_names])['Date']
-            data = ser.unique()
-            data_dict = {column_name: data for (column_name, data) in zip(required_columns_names, *data.keys())}
+            df = self._get_df_data_by_date('Date', date, ('Date', *required_columns_names))
+            data = self._get_distinct_rows(df[[*required_columns_names]])
+            data_dict = {column_name: data for (column_name, data) in zip(required_columns_names, *data)}
         except KeyError as ke:
             self._logger.exception(ke, "No DataFrame's key exists according to the api client's query results")
         finally:
@@ -136,7 +146,7 @@ class MedicalStaffMorbidity(DataHandler):
             else:
                 yield "No Data", ""
 
-    @lru_cache
+    @cached_result
     def confirmed_cases_by_date(self, date: str) \
             -> Generator[Dict[str, Any], None, None] or Generator[Tuple[str, str], None, None]:
         """ Yields confirmed cases statistics by given date.
@@ -151,7 +161,7 @@ class MedicalStaffMorbidity(DataHandler):
 
         return self._get_data_by_date(date, MedicalStaffMorbidity.confirmed_columns_names)
 
-    @lru_cache
+    @cached_result
     def isolated_cases_by_date(self, date: str) \
             -> Generator[Dict[str, str], None, None] or Generator[Tuple[str, str], None, None]:
         """ Yields isolated cases statistics by given date.
@@ -166,7 +176,7 @@ class MedicalStaffMorbidity(DataHandler):
 
         return self._get_data_by_date(date, MedicalStaffMorbidity.isolated_columns_names)
 
-    @lru_cache
+    @cached_result
     def confirmed_cases_statistics(self) \
             -> Generator[Dict[str, Dict[str, int or float]], None, None] or Generator[Tuple[str, str], None, None]:
         """ Yields Confirmed cases statistics: min, max, mean, total(sum).
@@ -181,7 +191,7 @@ class MedicalStaffMorbidity(DataHandler):
 
         return self._get_statistics_by_columns_names(MedicalStaffMorbidity.confirmed_columns_names)
 
-    @lru_cache
+    @cached_result
     def isolated_cases_statistics(self) \
             -> Generator[Dict[str, Dict[str, int or float]], None, None] or Generator[Tuple[str, str], None, None]:
         """ Yields Isolated cases statistics: min, max, mean, total(sum).
@@ -1,8 +1,9 @@
-from functools import lru_cache
 from typing import Dict, Generator
 
 from covid19_il.logger.logger import Logger
 from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.result_cache import cached_result
+from covid19_il.data_handler.enums.column_type import ColumnType
 from covid19_il.data_handler.enums.quarantine_amount import QuarantineAmount
 
 
@@ -21,11 +22,16 @@ class Quarantine(DataHandler):
 
     """
 
+    schema = {'date': ColumnType.DATE}
+    date_column_name = 'date'
+    fields_manifest = {quarantine_amount.name: ('date', quarantine_amount.name)
+                       for quarantine_amount in QuarantineAmount}
+
     def __init__(self, logger: Logger.logger, json_data: dict) -> None:
         """ Initialize Base Class & Instance Attributes """
         super().__init__(logger, json_data)
 
-    @lru_cache
+    @cached_result
     def isolated_today_contact_with_confirmed(self) \
             -> Generator[Dict[str, str], None, None] or Generator[str, None, None]:
         """ Yields date: amount of isolated today_contact with confirmed .
@@ -41,7 +47,7 @@ class Quarantine(DataHandler):
         return self._get_data_by_column(QuarantineAmount.isolated_today_contact_with_confirmed.name,
                                         ascending_order=True)
 
-    @lru_cache
+    @cached_result
     def isolated_today_abroad(self) -> Generator[Dict[str, str], None, None] or Generator[str, None, None]:
         """ Yields date: amount of isolated today abroad.
 
@@ -55,7 +61,7 @@ class Quarantine(DataHandler):
 
         return self._get_data_by_column(QuarantineAmount.isolated_today_abroad.name, ascending_order=True)
 
-    @lru_cache
+    @cached_result
     def new_contact_with_confirmed(self) -> Generator[Dict[str, str], None, None] or Generator[str, None, None]:
         """ Yields date: amount of new contact with confirmed.
 
@@ -69,7 +75,7 @@ class Quarantine(DataHandler):
 
         return self._get_data_by_column(QuarantineAmount.new_contact_with_confirmed.name, ascending_order=True)
 
-    @lru_cache
+    @cached_result
     def new_from_abroad(self) -> Generator[Dict[str, str], None, None] or Generator[str, None, None]:
         """ Yields date: amount of new from abroad.
 
@@ -1,10 +1,11 @@
 from collections import defaultdict
-from functools import lru_cache
 from numpy import int64 as numpy_int64, float64 as numpy_float64
 from typing import Dict, DefaultDict, Generator, Tuple
 
 from covid19_il.logger.logger import Logger
 from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.result_cache import cached_result
+from covid19_il.data_handler.enums.column_type import ColumnType
 
 
 class Recovered(DataHandler):
@@ -20,11 +21,17 @@ class Recovered(DataHandler):
 
     """
 
+    schema = {'days_between_pos_and_recovery': ColumnType.INT, 'age_group': ColumnType.CATEGORY,
+              'gender': ColumnType.CATEGORY}
+    fields_manifest = {'test_indication': ('test_indication', 'gender', 'age_group'),
+                       'days_from_pos_to_recovery_stats': ('days_between_pos_and_recovery',),
+                       'total_tests_count': ('total_tests_count', 'gender', 'age_group')}
+
     def __init__(self, logger: Logger.logger, json_data: Dict) -> None:
         """ Initialize Base Class & Instance Attributes """
         super().__init__(logger, json_data)
 
-    @lru_cache
+    @cached_result
     def test_indication(self) -> Generator[DefaultDict[str, DefaultDict[str, DefaultDict[str, int]]], None, None] or \
                                  Generator[Tuple[str, str], None, None]:
 
@@ -41,7 +48,7 @@ class Recovered(DataHandler):
 
         return self._get_data_by_columns(('test_indication', 'gender', 'age_group'), 'age_group')
 
-    @lru_cache
+    @cached_result
     def days_from_pos_to_recovery_stats(self) \
             -> Generator[Dict[str, numpy_int64 or numpy_float64], None, None] or \
                Generator[Tuple[str, str], None, None]:
@@ -57,13 +64,10 @@ class Recovered(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            df = df[['days_between_pos_and_recovery']]
-            df['days_between_pos_and_recovery'] = [self._convert_string_to_int(item[0]) for item
-                                                   in df['days_between_pos_and_recovery']]
-            data_dict = {"min": int(df.min().values[0]),
-                         "max": int(df.max().values[0]),
-                         "mean": float(df.mean().values[0])}
+            days = self._get_typed_column('days_between_pos_and_recovery')
+            data_dict = {"min": int(days.min()),
+                         "max": int(days.max()),
+                         "mean": float(days.mean())}
 
         except KeyError as ke:
             self._logger.exception(ke, "No DataFrame's key exists according to the api client's query results")
@@ -73,7 +77,7 @@ class Recovered(DataHandler):
             else:
                 yield "No Data", ""
 
-    @lru_cache
+    @cached_result
     def total_tests_count(self) -> Generator[DefaultDict[str, DefaultDict[str, Dict[str, int]]], None, None] or \
                                    Generator[Tuple[str, str], None, None]:
         """ Returns total tests count by gender & age groups.
@@ -89,8 +93,7 @@ class Recovered(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            df = df[['total_tests_count', 'gender', 'age_group']]
+            df = self._get_df_data(('total_tests_count', 'gender', 'age_group'))
             ser_group_by = df.groupby(['total_tests_count', 'gender'])['age_group'].value_counts()
             data_dict = defaultdict(lambda: defaultdict(int))
 
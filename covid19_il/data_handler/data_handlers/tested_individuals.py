@@ -1,9 +1,10 @@
 from collections import defaultdict
-from functools import lru_cache
 from typing import Dict, DefaultDict, Generator, Tuple
 
 from covid19_il.logger.logger import Logger
 from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.result_cache import cached_result
+from covid19_il.data_handler.enums.column_type import ColumnType
 
 
 class TestedIndividuals(DataHandler):
@@ -22,6 +23,15 @@ class TestedIndividuals(DataHandler):
 
     """
 
+    schema = {'test_date': ColumnType.DATE, 'gender': ColumnType.CATEGORY}
+    date_column_name = 'test_date'
+    fields_manifest = {'tests_results_by_date': ('test_date', 'corona_result', 'gender'),
+                       'amount_of_test_indication': ('test_indication',),
+                       'amount_of_subjects_ages_60_and_above': ('age_60_and_above',),
+                       'effects_amount_of_subjects': ('cough', 'fever', 'sore_throat', 'shortness_of_breath',
+                                                      'head_ache')}
+    filters_manifest = {'tests_results_by_date': {'date_string': 'test_date'}}
+
     def __init__(self, logger: Logger.logger, json_data: Dict) -> None:
         """ Initialize Base Class & Instance Attributes """
         super().__init__(logger, json_data)
@@ -42,8 +52,7 @@ class TestedIndividuals(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            df = df[df['test_date'] == date_string]
+            df = self._get_df_data_by_date('test_date', date_string, ('test_date', 'corona_result', 'gender'))
             df = df[['corona_result', 'gender']]
             ser_group_by = df.groupby('corona_result')['gender'].value_counts()
             data_dict = defaultdict(lambda: defaultdict(int))
@@ -84,7 +93,7 @@ class TestedIndividuals(DataHandler):
             else:
                 yield "No Data", ""
 
-    @lru_cache
+    @cached_result
     def amount_of_test_indication(self) -> Generator[Dict[str, int], None, None] or \
                                            Generator[Tuple[str, str], None, None]:
         """ Yields data of test_indication: amount of test indication's properties via the subjects.
@@ -99,7 +108,7 @@ class TestedIndividuals(DataHandler):
 
         return self._get_value_counts_by_column('test_indication')
 
-    @lru_cache
+    @cached_result
     def amount_of_subjects_ages_60_and_above(self) -> Generator[Dict[str, int], None, None] or \
                                                       Generator[Tuple[str, str], None, None]:
         """ Yields data of age group 60+ test status: amount via the subjects.
@@ -114,7 +123,7 @@ class TestedIndividuals(DataHandler):
 
         return self._get_value_counts_by_column('age_60_and_above')
 
-    @lru_cache
+    @cached_result
     def effects_amount_of_subjects(self) -> Generator[Dict[str, Dict[str, int]], None, None] or \
                                             Generator[Tuple[str, str], None, None]:
         """ Yields data of top total amount of symptoms before test date via data frame.
@@ -129,8 +138,7 @@ class TestedIndividuals(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            df = df[['cough', 'fever', 'sore_throat', 'shortness_of_breath', 'head_ache']]
+            df = self._get_df_data(('cough', 'fever', 'sore_throat', 'shortness_of_breath', 'head_ache'))
             data_dict = {}
             for column in df:
                 data_dict[column] = {self._string_parser(key): value for key, value
@@ -1,9 +1,9 @@
 from collections import defaultdict
-from functools import lru_cache
 from typing import Dict, DefaultDict, Generator, Tuple
 
 from covid19_il.logger.logger import Logger
 from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.enums.column_type import ColumnType
 
 
 class TestedIndividualsScores(DataHandler):
@@ -18,6 +18,10 @@ class TestedIndividualsScores(DataHandler):
 
     """
 
+    schema = {'test_date': ColumnType.DATE}
+    date_column_name = 'test_date'
+    filters_manifest = {'get_statistics_by_date': {'date_string': 'test_date'}}
+
     def __init__(self, logger: Logger.logger, json_data: Dict) -> None:
         """ Initialize Base Class & Instance Attributes """
         super().__init__(logger, json_data)
@@ -36,7 +40,7 @@ class TestedIndividualsScores(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
+            df = self._get_df_data()
             data_dict = defaultdict(lambda: defaultdict(int))
 
             for column in df.columns[2:]:
@@ -68,13 +72,10 @@ class TestedIndividualsScores(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            df = df[df['test_date'] == date_string]
-            ser_group_by = df.groupby([*df.columns])['age_60_and_above'].unique()
-            data_dict = defaultdict(lambda: dict())
-            for key in ser_group_by.keys():
-                # key[0]: age_60_and_above, key[1]: value amount
-                data_dict[key[1]] = {gender: int(value) for gender, value in zip(df.columns[2:], key[2:])}
+            df = self._get_df_data_by_date('test_date', date_string)
+            # row[0]: test date, row[1]: age_60_and_above, row[2:]: value amounts
+            data_dict = self._distinct_rows_to_dict(
+                df, (1,), lambda row: {gender: int(value) for gender, value in zip(df.columns[2:], row[2:])})
 
         except KeyError as ke:
             self._logger.exception(ke, "No DataFrame's key exists according to the api client's query results")
@@ -1,9 +1,10 @@
 from collections import defaultdict
-from functools import lru_cache
 from typing import Dict, DefaultDict, Tuple, Any, Generator
 
 from covid19_il.logger.logger import Logger
 from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.result_cache import cached_result
+from covid19_il.data_handler.enums.column_type import ColumnType
 
 
 class YoungPopulation(DataHandler):
@@ -25,6 +26,13 @@ class YoungPopulation(DataHandler):
     """
 
     required_columns_names = ('weekly_tests_num', 'weekly_newly_tested', 'weekly_cases')
+    schema = {'first_week_day': ColumnType.DATE, 'last_week_day': ColumnType.DATE, 'age_group': ColumnType.CATEGORY,
+              'region': ColumnType.CATEGORY, **dict.fromkeys(required_columns_names, ColumnType.INT)}
+    date_column_name = 'first_week_day'
+    fields_manifest = {'total_cases_statistics': ('first_week_day', 'region', 'age_group', *required_columns_names),
+                       'cases_statistics_by_region': ('region', *required_columns_names),
+                       'cases_statistics_by_age_group': ('age_group', *required_columns_names),
+                       'cases_statistics_by_first_week_day': ('first_week_day', *required_columns_names)}
 
     def __init__(self, logger: Logger.logger, json_data: dict) -> None:
         """ Initialize Base Class & Instance Attributes """
@@ -54,9 +62,7 @@ class YoungPopulation(DataHandler):
         data_dict = None
 
         try:
-            df = self._get_clean_copy_df_data()
-            for column_name in columns_names:
-                df[column_name] = [self._convert_string_to_int(item) for item in df[column_name]]
+            df = self._get_df_data(('first_week_day', 'region', 'age_group', *columns_names), columns_names)
             ser = df.groupby(['first_week_day', 'region', 'age_group', *columns_names])['first_week_day']
             data = ser.unique()
 
@@ -75,7 +81,7 @@ class YoungPopulation(DataHandler):
             else:
                 yield "No Data", ""
 
-    @lru_cache
+    @cached_result
     def total_cases_statistics(self) \
             -> Generator[DefaultDict[str, DefaultDict[str, DefaultDict[str, Dict[str, int]]]], None, None] or \
                Generator[Tuple[str, str], None, None]:
@@ -110,10 +116,8 @@ class YoungPopulation(DataHandler):
 
         data_dict = None
         try:
-            df = self._get_clean_copy_df_data()
-            # parsing string values to integers for future calculations
-            for column_name in required_columns_names:
-                df[column_name] = [self._convert_string_to_int(item) for item in df[column_name]]
+            # pre-typed integers for future calculations
+            df = self._get_df_data((key_column_name, *required_columns_names), required_columns_names)
             key_column_items_names = df[key_column_name].unique()
             data_dict = defaultdict(lambda: dict())
             # build the main default dict with data by key_column_items_names(region, age_group,first_week_day)
@@ -139,7 +143,7 @@ class YoungPopulation(DataHandler):
                        }
                 }
 
-    @lru_cache
+    @cached_result
     def cases_statistics_by_region(self) -> Dict[str, Dict[str, int or float]]:
         """ Yields data of cases statistics(min, max, mean, sum) by region.
 
@@ -153,7 +157,7 @@ class YoungPopulation(DataHandler):
 
         return self._get_data_by_columns(YoungPopulation.required_columns_names, key_column_name='region')
 
-    @lru_cache
+    @cached_result
     def cases_statistics_by_age_group(self) -> Dict[str, Dict[str, int or float]]:
         """ Yields data of cases statistics(min, max, mean, sum) by age group.
 
@@ -167,7 +171,7 @@ class YoungPopulation(DataHandler):
 
         return self._get_data_by_columns(YoungPopulation.required_columns_names, key_column_name='age_group')
 
-    @lru_cache
+    @cached_result
     def cases_statistics_by_first_week_day(self) -> Dict[str, Dict[str, int or float]]:
         """ Yields data of cases statistics(min, max, mean, sum) by first week day.
 
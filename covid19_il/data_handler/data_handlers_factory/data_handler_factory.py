@@ -1,6 +1,15 @@
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from threading import RLock
+from typing import Generator, Tuple
+
+import pandas as pd
+
 from covid19_il.logger.logger import Logger
 from covid19_il.data_handler.data_handlers.data_handler import DataHandler
 from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.data_handler.snapshot_store import SnapshotStore
 
 from covid19_il.data_handler.data_handlers.area import Area
 from covid19_il.data_handler.data_handlers.quarantine import Quarantine
@@ -19,17 +28,64 @@ from covid19_il.data_handler.data_handlers.cities import Cities
 class DataHandlerFactory:
     """ Data Handlers Factory for creating Types of data handlers of different data resources.
 
+    Note:
+        every data resource's current instance is registered with a version number. a refresh builds a new instance
+        in the background and swaps it in atomically, while readers which pinned an older version keep reading it
+        until they release it.
+
     Attributes:
-        None
+        data_handlers_classes(Dict[int, type]): resource id's value: data handler's class of the data resource.
+        data_resources(Dict[int, DataHandler]): resource id's value: current data handler's instance.
+        data_versions(Dict[int, int]): resource id's value: version number of the current instance.
+        _pinned_versions(Dict[Tuple[int, int], List]): (resource id's value, version number): [data handler's
+            instance, amount of readers] of the pinned versions.
+        _lock(RLock): guards the swaps of instances & the readers' counts.
+        _executor(ThreadPoolExecutor): background builder of refreshed instances, created on first refresh.
 
     Methods:
         def get_instance(cls, required_resource_id: ResourceId, json_data: dict = None): get data handler's instance.
+        def get_version(cls, required_resource_id: ResourceId): get the version number of the current instance.
+        def get_required_fields(cls, required_resource_id: ResourceId, *methods_names: str): get the columns which
+            given methods of the data resource's handler read.
+        def refresh(cls, required_resource_id: ResourceId, json_data: dict): builds a new data handler's instance
+            in the background & swaps it in atomically.
+        def pin(cls, required_resource_id: ResourceId): pins the current instance's version for consistent reads.
+        def release(cls, pinned_version: DataHandlerFactory.version): releases a pinned version.
+        def pinned_instance(cls, required_resource_id: ResourceId): context manager of a pinned instance.
         def _create_data_handler(cls, required_resource_id: ResourceId, json_data: dict = None): creates the class
             instance of required data handler.
+        def _create_data_handler_from_data_frame(cls, required_resource_id: ResourceId, df: pd.DataFrame,
+            total: int = None): creates the class instance of required data handler by a ready data frame.
+        def get_instance_from_data_frame(cls, required_resource_id: ResourceId, df: pd.DataFrame,
+            total: int = None): get data handler's instance whose data is given as a data frame.
+        def get_instance_from_snapshot(cls, required_resource_id: ResourceId, snapshot_store: SnapshotStore): get
+            data handler's instance which is loaded from a columnar snapshot.
+        def save_snapshot(cls, required_resource_id: ResourceId, snapshot_store: SnapshotStore): stores the data of
+            exist data handler's instance as a columnar snapshot.
 
     """
 
+    version = namedtuple("HandlerVersion", ("resource_id", "number", "data_handler"))
+
+    data_handlers_classes = {
+        1: Area,
+        2: Quarantine,
+        3: LabTests,
+        4: TestedIndividuals,
+        5: TestedIndividualsScores,
+        6: Recovered,
+        7: Hospitalized,
+        8: AgeGender,
+        9: MedicalStaffMorbidity,
+        10: Deaths,
+        11: YoungPopulation,
+        12: Cities
+    }
     data_resources = {}
+    data_versions = {}
+    _pinned_versions = {}
+    _lock = RLock()
+    _executor = None
 
     @classmethod
     def get_instance(cls, required_resource_id: ResourceId, json_data: dict = None) -> DataHandler or None:
@@ -49,43 +105,291 @@ class DataHandlerFactory:
         try:
             _ = cls.data_resources[required_resource_id.value]
         except KeyError:
-            cls.data_resources[required_resource_id.value] = cls._create_data_handler(required_resource_id, json_data)
+            with cls._lock:
+                if required_resource_id.value not in cls.data_resources:
+                    cls._swap(required_resource_id, cls._create_data_handler(required_resource_id, json_data))
         finally:
             return cls.data_resources[required_resource_id.value]
 
     @classmethod
-    def _create_data_handler(cls, required_resource_id: ResourceId, json_data: dict = None) -> DataHandler or None:
-        """ Create Required Data Handler for each Data Resource with its unique/special methods.
+    def _swap(cls, required_resource_id: ResourceId, data_handler: DataHandler or None) -> int:
+        """ Registers given instance as the current version of the data resource.
 
         Note:
-            private method which get called by get_instance's method.
+            private method which get called by the instances' creating methods. the former instance stays reachable
+            only by the readers which pinned it.
 
         Args:
             required_resource_id(ResourceId): enum type of desired data resource id.
-            json_data(dict): json data as dictionary for data handler.
+            data_handler(DataHandler or None): new data handler's instance.
+
+        Returns:
+            int: version number of the new instance.
+
+        """
+
+        with cls._lock:
+            number = cls.data_versions.get(required_resource_id.value, 0) + 1
+            cls.data_resources[required_resource_id.value] = data_handler
+            cls.data_versions[required_resource_id.value] = number
+
+        return number
+
+    @classmethod
+    def get_version(cls, required_resource_id: ResourceId) -> int:
+        """ Returns the version number of the data resource's current instance, or 0 when there is no instance """
+        with cls._lock:
+            if required_resource_id.value not in cls.data_resources:
+                return 0
+            return cls.data_versions.get(required_resource_id.value, 0)
+
+    @classmethod
+    def refresh(cls, required_resource_id: ResourceId, json_data: dict) -> Future:
+        """ Builds a new data handler's instance from given json data in the background & swaps it in atomically.
+
+        Note:
+            readers keep getting the former instance until the new one is ready, so a refresh never exposes a
+            partially built instance.
+
+        Args:
+            required_resource_id(ResourceId): enum type of desired data resource id.
+            json_data(dict): new json data as dictionary for data handler.
+
+        Returns:
+            Future: resolves to the version number of the new instance, or holds a ValueError when the json data
+                couldn't be converted.
+
+        """
+
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="data_handler_refresh")
+
+        return cls._executor.submit(cls._refresh, required_resource_id, json_data)
+
+    @classmethod
+    def _refresh(cls, required_resource_id: ResourceId, json_data: dict) -> int:
+        """ Builds a new data handler's instance & swaps it in.
+
+        Note:
+            private method which get called by refresh's method in the background.
+
+        Args:
+            required_resource_id(ResourceId): enum type of desired data resource id.
+            json_data(dict): new json data as dictionary for data handler.
+
+        Returns:
+            int: version number of the new instance.
+
+        Raises:
+            ValueError: the json data couldn't be converted to a data frame.
+
+        """
+
+        data_handler = cls._create_data_handler(required_resource_id, json_data)
+        if data_handler is None or data_handler.df is None:
+            Logger().logger.exception(f"couldn't refresh {required_resource_id.name} by the given json data")
+            raise ValueError(f"couldn't refresh {required_resource_id.name} by the given json data")
+
+        number = cls._swap(required_resource_id, data_handler)
+        data_handler.logger.info(f"refreshed {required_resource_id.name} to version {number}")
+        return number
+
+    @classmethod
+    def pin(cls, required_resource_id: ResourceId) -> 'DataHandlerFactory.version' or None:
+        """ Pins the data resource's current instance, so multiple queries read the same version of the data.
+
+        Args:
+            required_resource_id(ResourceId): enum type of desired data resource id.
+
+        Returns:
+            DataHandlerFactory.version or None: pinned version, or None when there is no instance.
+
+        """
+
+        with cls._lock:
+            data_handler = cls.data_resources.get(required_resource_id.value)
+            if data_handler is None:
+                return None
+
+            number = cls.data_versions[required_resource_id.value]
+            pinned_version = DataHandlerFactory.version(required_resource_id, number, data_handler)
+            cls._pinned_versions.setdefault((required_resource_id.value, number), [data_handler, 0])[1] += 1
+
+        return pinned_version
+
+    @classmethod
+    def release(cls, pinned_version: 'DataHandlerFactory.version') -> None:
+        """ Releases a pinned version, the registry drops an old version once all of its readers released it.
+
+        Args:
+            pinned_version(DataHandlerFactory.version): version which was returned by pin's method.
+
+        Returns:
+            None.
+
+        """
+
+        key = (pinned_version.resource_id.value, pinned_version.number)
+        with cls._lock:
+            pinned = cls._pinned_versions.get(key)
+            if pinned is None:
+                return
+            pinned[1] -= 1
+            if pinned[1] <= 0:
+                del cls._pinned_versions[key]
+
+    @classmethod
+    @contextmanager
+    def pinned_instance(cls, required_resource_id: ResourceId) -> Generator[DataHandler or None, None, None]:
+        """ Yields the data resource's current instance pinned for the duration of the context.
+
+        Args:
+            required_resource_id(ResourceId): enum type of desired data resource id.
+
+        Yields:
+            DataHandler or None: pinned data handler's instance or None when there is no instance.
+
+        """
+
+        pinned_version = cls.pin(required_resource_id)
+        try:
+            yield None if pinned_version is None else pinned_version.data_handler
+        finally:
+            if pinned_version is not None:
+                cls.release(pinned_version)
+
+    @classmethod
+    def get_instance_from_snapshot(cls, required_resource_id: ResourceId, snapshot_store: SnapshotStore) \
+            -> DataHandler or None:
+        """ Create or get exist class's instance, a created instance gets its data from a columnar snapshot.
+
+        Args:
+            required_resource_id(ResourceId): enum type of desired data resource id.
+            snapshot_store(SnapshotStore): columnar store of the data resources' snapshots.
+
+        Returns:
+            DataHandler or None: data handler's class instance or None object when there is no snapshot.
+
+        """
+
+        if required_resource_id.value not in cls.data_resources:
+            with cls._lock:
+                if required_resource_id.value not in cls.data_resources:
+                    df = snapshot_store.load(required_resource_id)
+                    if df is None:
+                        return None
+                    cls._swap(required_resource_id,
+                              cls._create_data_handler_from_data_frame(required_resource_id, df))
+
+        return cls.data_resources[required_resource_id.value]
+
+    @classmethod
+    def _create_data_handler_from_data_frame(cls,
+                                             required_resource_id: ResourceId,
+                                             df: pd.DataFrame,
+                                             total: int = None) -> DataHandler or None:
+        """ Create Required Data Handler whose data is a ready data frame instead of the api's json data.
+
+        Note:
+            private method which get called by the methods which load a data frame, e.g. a snapshot or a stream.
+
+        Args:
+            required_resource_id(ResourceId): enum type of desired data resource id.
+            df(DataFrame): data resource's data frame, including the CKAN's _id column.
+            total(int): total amount of the data resource's records, by default the data frame's length.
 
         Returns:
             DataHandler or None: data handler's class instance or None object.
 
+        """
+
+        total = len(df) if total is None else total
+        data_handler = cls._create_data_handler(required_resource_id, {"result": {"records": [], "total": total}})
+        if data_handler is not None:
+            data_handler.df = df
+
+        return data_handler
+
+    @classmethod
+    def get_instance_from_data_frame(cls, required_resource_id: ResourceId, df: pd.DataFrame, total: int = None) \
+            -> DataHandler or None:
+        """ Create or get exist class's instance, a created instance gets its data from given data frame.
+
+        Args:
+            required_resource_id(ResourceId): enum type of desired data resource id.
+            df(DataFrame): data resource's data frame, e.g. of ApiDataIL's stream_data_frame method.
+            total(int): total amount of the data resource's records, by default the data frame's length.
+
         Returns:
             DataHandler or None: data handler's class instance or None object.
 
         """
 
-        logger = Logger().logger
-        switch_case = {
-            1: Area(logger, json_data),
-            2: Quarantine(logger, json_data),
-            3: LabTests(logger, json_data),
-            4: TestedIndividuals(logger, json_data),
-            5: TestedIndividualsScores(logger, json_data),
-            6: Recovered(logger, json_data),
-            7: Hospitalized(logger, json_data),
-            8: AgeGender(logger, json_data),
-            9: MedicalStaffMorbidity(logger, json_data),
-            10: Deaths(logger, json_data),
-            11: YoungPopulation(logger, json_data),
-            12: Cities(logger, json_data),
-            "default": None
-        }
-        return switch_case.get(required_resource_id.value, switch_case['default'])
+        if required_resource_id.value not in cls.data_resources:
+            with cls._lock:
+                if required_resource_id.value not in cls.data_resources:
+                    cls._swap(required_resource_id,
+                              cls._create_data_handler_from_data_frame(required_resource_id, df, total))
+
+        return cls.data_resources[required_resource_id.value]
+
+    @classmethod
+    def save_snapshot(cls, required_resource_id: ResourceId, snapshot_store: SnapshotStore) -> bool:
+        """ Stores the data of exist class's instance as a columnar snapshot.
+
+        Args:
+            required_resource_id(ResourceId): enum type of desired data resource id.
+            snapshot_store(SnapshotStore): columnar store of the data resources' snapshots.
+
+        Returns:
+            bool: whether a snapshot has been stored.
+
+        """
+
+        data_handler = cls.data_resources.get(required_resource_id.value)
+        if data_handler is None or data_handler.df is None:
+            return False
+
+        df = data_handler.df if data_handler.ids is None else data_handler.df.assign(_id=data_handler.ids)
+        snapshot_store.save(required_resource_id, df)
+        return True
+
+    @classmethod
+    def get_required_fields(cls, required_resource_id: ResourceId, *methods_names: str) -> Tuple[str, ...] or None:
+        """ Get the columns which given methods of the data resource's handler read, for the api's fields parameter.
+
+        Args:
+            required_resource_id(ResourceId): enum type of desired data resource id.
+            *methods_names(str): names of the data handler's public methods.
+
+        Returns:
+            Tuple[str, ...] or None: columns by the handler's fields manifest, or None for every column.
+
+        Raises:
+            KeyError: the data resource has no data handler.
+            ValueError: one of the names isn't a public method of the data handler.
+        """
+
+        return cls.data_handlers_classes[required_resource_id.value].get_required_fields(*methods_names)
+
+    @classmethod
+    def _create_data_handler(cls, required_resource_id: ResourceId, json_data: dict = None) -> DataHandler or None:
+        """ Create Required Data Handler for each Data Resource with its unique/special methods.
+
+        Note:
+            private method which get called by get_instance's method. only the required data handler's class gets
+            instantiated, so the json data gets converted to a data frame once.
+
+        Args:
+            required_resource_id(ResourceId): enum type of desired data resource id.
+            json_data(dict): json data as dictionary for data handler.
+
+        Returns:
+            DataHandler or None: data handler's class instance or None object.
+
+        """
+
+        data_handler_class = cls.data_handlers_classes.get(required_resource_id.value)
+
+        return data_handler_class(Logger().logger, json_data) if data_handler_class else None
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+
+class DateIndex:
+    """ Sorted Index of a date column: date -> row positions, built once per data frame.
+
+    Note:
+        the dates get sorted once, so a date's or a dates range's rows are found by a binary search(O(log n)) plus
+        the slice of their positions, instead of a full scan of the column per query. missing or unparsable dates
+        aren't indexed, their positions are kept aside.
+
+    Attributes:
+        _sorted_dates(np.ndarray): indexed dates in ascending order.
+        _positions(np.ndarray): row positions of the sorted dates, ascending within every date.
+        _unindexed_positions(np.ndarray): ascending row positions of the missing dates.
+
+    Methods:
+        get_positions(self, date: str): Returns the row positions of given date.
+        get_range_positions(self, start_date: str = None, end_date: str = None): Returns the row positions of the
+            dates within given inclusive range.
+
+    """
+
+    def __init__(self, dates: pd.Series) -> None:
+        """ Class Initialization
+
+        Args:
+            dates(Series): typed dates column.
+        """
+        values = dates.to_numpy(dtype="datetime64[ns]")
+        missing = np.isnat(values)
+        positions = np.flatnonzero(~missing)
+        order = np.argsort(values[positions], kind="stable")
+        self._sorted_dates = values[positions][order]
+        self._positions = positions[order]
+        self._unindexed_positions = np.flatnonzero(missing)
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}({len(self)} dates)"
+
+    def __len__(self) -> int:
+        """ Returns amount of indexed dates """
+        return len(self._sorted_dates)
+
+    @property
+    def unindexed_positions(self) -> np.ndarray:
+        """ np.ndarray: Returns the ascending row positions of the missing or unparsable dates """
+        return self._unindexed_positions
+
+    def _search(self, date: str, side: str) -> int:
+        """ Returns the insertion point of given date in the sorted dates.
+
+        Note:
+            private method which get called by the positions' methods.
+
+        Raises:
+            ValueError: the date isn't a valid date string.
+        """
+        return int(np.searchsorted(self._sorted_dates, np.datetime64(pd.Timestamp(date), "ns"), side=side))
+
+    def get_positions(self, date: str) -> np.ndarray:
+        """ Returns the row positions of given date, in the data frame's order.
+
+        Args:
+            date(str): required date, e.g. "2020-10-03".
+
+        Returns:
+            np.ndarray: row positions.
+
+        Raises:
+            ValueError: the date isn't a valid date string.
+
+        """
+
+        return self._positions[self._search(date, "left"):self._search(date, "right")]
+
+    def get_range_positions(self, start_date: str = None, end_date: str = None) -> np.ndarray:
+        """ Returns the row positions of the dates within given inclusive range, in the data frame's order.
+
+        Args:
+            start_date(str): first date of the range, unbounded when None.
+            end_date(str): last date of the range, unbounded when None.
+
+        Returns:
+            np.ndarray: row positions.
+
+        Raises:
+            ValueError: a date isn't a valid date string.
+
+        """
+
+        start = 0 if start_date is None else self._search(start_date, "left")
+        end = len(self) if end_date is None else self._search(end_date, "right")
+
+        return np.sort(self._positions[start:end])
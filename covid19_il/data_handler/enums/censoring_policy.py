@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class CensoringPolicy(Enum):
+    """ Censored Values("<15", "NULL", "N") Replacement Policies using Enum """
+    FIXED = 1
+    MIDPOINT = 2
+    SEEDED_FILL = 3
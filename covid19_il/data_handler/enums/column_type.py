@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class ColumnType(Enum):
+    """ Data Frame's Column Types of a Data Handler's Schema using Enum """
+    INT = 1
+    FLOAT = 2
+    DATE = 3
+    CATEGORY = 4
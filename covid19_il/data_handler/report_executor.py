@@ -0,0 +1,189 @@
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterable, List, Tuple
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from covid19_il.data_handler.data_handlers.data_handler import DataHandler
+from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+
+# worker process' data handlers by their shared memory block's name, built once per worker
+_worker_data_handlers = {}
+
+
+def _attach_shared_memory(name: str) -> SharedMemory:
+    """ Attaches an existing shared memory block which the parent process owns & unlinks """
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # python < 3.13 registers the block again in the resource tracker which is shared with the parent process,
+        # the parent's unlink unregisters it
+        return SharedMemory(name=name)
+
+
+def _to_plain(item: Any) -> Any:
+    """ Converts a handler's result item to picklable builtins: defaultdicts to dicts & named tuples to tuples """
+    if isinstance(item, dict):
+        return {key: _to_plain(value) for key, value in item.items()}
+    if isinstance(item, tuple):
+        return tuple(_to_plain(value) for value in item)
+    return item
+
+
+def _run_task(resource_id_value: int, shared_memory_name: str, method_name: str, args: Tuple) -> List:
+    """ Worker process' entry point: runs a data handler's method on data which is read from shared memory.
+
+    Note:
+        the data handler gets built once per worker & shared memory block, from an Arrow IPC stream which is read in
+        place out of the shared memory block.
+
+    Args:
+        resource_id_value(int): value of the data resource's id.
+        shared_memory_name(str): name of the shared memory block which holds the data frame as an Arrow IPC stream.
+        method_name(str): data handler's method name.
+        args(Tuple): method's arguments.
+
+    Returns:
+        List: method's result items as picklable builtins.
+
+    """
+
+    if shared_memory_name not in _worker_data_handlers:
+        shared_memory = _attach_shared_memory(shared_memory_name)
+        df = pa.ipc.open_stream(pa.py_buffer(shared_memory.buf)).read_all().to_pandas()
+        data_handler = DataHandlerFactory._create_data_handler_from_data_frame(ResourceId(resource_id_value), df)
+        # the shared memory block stays attached as long as the data frame may refer to its buffers
+        _worker_data_handlers[shared_memory_name] = (shared_memory, data_handler)
+
+    data_handler = _worker_data_handlers[shared_memory_name][1]
+    return [_to_plain(item) for item in getattr(data_handler, method_name)(*args)]
+
+
+class ReportExecutor:
+    """ Parallel Executor of independent data handlers' computations across processes.
+
+    Note:
+        every required data resource's data frame gets written once as an Arrow IPC stream into a shared memory block,
+        so the worker processes read it in place instead of unpickling a data frame per task. the results get
+        converted to picklable builtins(defaultdicts to dicts & named tuples to tuples). requires the optional
+        pyarrow dependency.
+
+    Attributes:
+        _logger(Logger.logger): report executor's actions logger.
+        _max_workers(int): amount of worker processes.
+        task(namedtuple): class attribute - a data handler's method call of a data resource.
+
+    Methods:
+        run(self, tasks: Iterable[ReportExecutor.task], data_handlers: Dict[ResourceId, DataHandler] = None): runs
+            the tasks in parallel & returns their results by the tasks' order.
+
+    """
+
+    task = namedtuple("ReportTask", ("resource_id", "method_name", "args"), defaults=((),))
+
+    def __init__(self, logger: Logger.logger, max_workers: int = None) -> None:
+        """ Class Initialization
+
+        Raises:
+            ImportError: the optional pyarrow dependency isn't installed.
+        """
+        if pa is None:
+            logger.error("ReportExecutor requires pyarrow, install it via: pip install pyarrow")
+            raise ImportError("ReportExecutor requires pyarrow, install it via: pip install pyarrow")
+
+        self._logger = logger
+        self._max_workers = max_workers or os.cpu_count() or 1
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}({self._logger}, {self._max_workers})"
+
+    @property
+    def max_workers(self) -> int:
+        """ int: Returns the amount of worker processes """
+        return self._max_workers
+
+    def _share_data_frame(self, data_handler: DataHandler) -> SharedMemory:
+        """ Writes the data handler's data frame as an Arrow IPC stream into a new shared memory block.
+
+        Note:
+            private method which get called by run's method.
+
+        Args:
+            data_handler(DataHandler): data handler of a data resource.
+
+        Returns:
+            SharedMemory: shared memory block which holds the data frame.
+
+        """
+
+        df = data_handler.df if data_handler.ids is None else data_handler.df.assign(_id=data_handler.ids)
+        table = pa.Table.from_pandas(df.reset_index(drop=True), preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        buffer = sink.getvalue()
+
+        shared_memory = SharedMemory(create=True, size=max(buffer.size, 1))
+        shared_memory.buf[:buffer.size] = memoryview(buffer).cast("B")
+        return shared_memory
+
+    def run(self,
+            tasks: Iterable['ReportExecutor.task'],
+            data_handlers: Dict[ResourceId, DataHandler] = None) -> List[List]:
+        """ Runs the tasks in parallel worker processes & returns their results by the tasks' order.
+
+        Args:
+            tasks(Iterable[ReportExecutor.task]): data handlers' method calls.
+            data_handlers(Dict[ResourceId, DataHandler]): data handlers of the tasks' data resources, by default the
+                factory's current instances which stay pinned until the data got shared.
+
+        Returns:
+            List[List]: every task's result items.
+
+        Raises:
+            ValueError: a task's data resource has no data handler.
+
+        """
+
+        tasks = list(tasks)
+        data_handlers = dict(data_handlers or {})
+        pinned_versions = []
+        shared_memories = {}
+        try:
+            for required_resource_id in {task.resource_id for task in tasks} - data_handlers.keys():
+                pinned_version = DataHandlerFactory.pin(required_resource_id)
+                if pinned_version is None:
+                    self._logger.exception(f"there is no data handler of {required_resource_id.name}")
+                    raise ValueError(f"there is no data handler of {required_resource_id.name}")
+                pinned_versions.append(pinned_version)
+                data_handlers[required_resource_id] = pinned_version.data_handler
+
+            for required_resource_id in {task.resource_id for task in tasks}:
+                shared_memories[required_resource_id] = self._share_data_frame(data_handlers[required_resource_id])
+
+            for pinned_version in pinned_versions:
+                DataHandlerFactory.release(pinned_version)
+            pinned_versions.clear()
+
+            self._logger.info(f"running {len(tasks)} report tasks of {len(shared_memories)} data resources by "
+                              f"{self._max_workers} processes")
+            with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+                futures = [executor.submit(_run_task, task.resource_id.value,
+                                           shared_memories[task.resource_id].name, task.method_name,
+                                           tuple(task.args))
+                           for task in tasks]
+                return [future.result() for future in futures]
+        finally:
+            for pinned_version in pinned_versions:
+                DataHandlerFactory.release(pinned_version)
+            for shared_memory in shared_memories.values():
+                shared_memory.close()
+                shared_memory.unlink()
@@ -0,0 +1,185 @@
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Generator, Hashable, NoReturn, Tuple
+
+from covid19_il.metrics.metrics import Metrics
+import covid19_il.data_handler.consts as data_handler_consts
+
+
+class ResultCache:
+    """ In-Memory Cache of a data handler's materialized methods' results.
+
+    Note:
+        every data handler's instance owns its cache, so cached results never outlive the instance nor pin it.
+        results are stored as tuples of the yielded items, bounded by amount of entries(least recently used gets
+        evicted) & by age, and get invalidated as a whole whenever the handler's data changes. every invalidation
+        starts a new generation, so a result which was computed from the former data doesn't get stored.
+
+    Attributes:
+        _max_size(int): max amount of cached results.
+        _ttl(float or None): seconds which a result is valid for, or None for no expiration.
+        _entries(OrderedDict): key: (stored time, materialized result) ordered by least recent use.
+        _lock(Lock): guards reads & writes of the entries.
+        _generation(int): amount of invalidations, bumped by clear's method.
+
+    Methods:
+        get(self, key: Hashable): Returns the cached result of given key or None.
+        put(self, key: Hashable, result: Tuple, generation: int = None): stores the result of given key unless the
+            cache got invalidated since given generation, and evicts least recently used ones.
+        clear(self): removes all cached results & starts a new generation.
+
+    """
+
+    def __init__(self,
+                 max_size: int = data_handler_consts.DEFAULT_RESULT_CACHE_MAX_SIZE,
+                 ttl: float = data_handler_consts.DEFAULT_RESULT_CACHE_TTL) -> None:
+        """ Class Initialization """
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._generation = 0
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}({self._max_size}, {self._ttl})"
+
+    def __len__(self) -> int:
+        """ Returns amount of cached results """
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """ int: Returns the current generation, which a computation reads before computing its result """
+        return self._generation
+
+    def get(self, key: Hashable) -> Tuple or None:
+        """ Returns the cached result of given key and marks it as recently used.
+
+        Args:
+            key(Hashable): method's name & arguments.
+
+        Returns:
+            Tuple or None: materialized result or None when it isn't cached or has expired.
+
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, result = entry
+            if self._ttl is not None and time.monotonic() - stored_at >= self._ttl:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: Hashable, result: Tuple, generation: int = None) -> None:
+        """ Stores the result of given key, then evicts least recently used results beyond the cache's bound.
+
+        Args:
+            key(Hashable): method's name & arguments.
+            result(Tuple): materialized result.
+            generation(int): generation which the result was computed at, a result of a former generation(the data
+                changed during its computation) doesn't get stored. None for storing it anyway.
+
+        Returns:
+            None.
+
+        """
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """ Removes all cached results & starts a new generation """
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+
+class _FrozenDict(dict):
+    """ Read Only Dictionary of a cached result, which keeps the dict's type & pickling of the yielded items """
+
+    def _read_only(self, *args, **kwargs) -> NoReturn:
+        """ Raises TypeError for every change of the cached result """
+        raise TypeError(f"{self.__class__.__name__} of a cached result can't be changed")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> Tuple:
+        """ Pickles the dictionary by its items, e.g. for a process pool's report """
+        return self.__class__, (dict(self),)
+
+
+def _freeze(item: Any) -> Any:
+    """ Returns an immutable equivalent of given result's item: mappings as read only dictionaries & lists as tuples.
+
+    Note:
+        private function which get called by cached_result's wrapper once per computed result, so the cached items
+        can be yielded as they are.
+
+    Args:
+        item(Any): yielded item of a data handler's method.
+
+    Returns:
+        Any: the immutable item.
+
+    """
+
+    if isinstance(item, Mapping):
+        return _FrozenDict((key, _freeze(value)) for key, value in item.items())
+    if isinstance(item, tuple) and hasattr(item, "_fields"):
+        return type(item)(*(_freeze(value) for value in item))
+    if isinstance(item, (list, tuple)):
+        return tuple(_freeze(value) for value in item)
+    return item
+
+
+def cached_result(method: Callable[..., Any]) -> Callable[..., Generator]:
+    """ Caches the materialized result of a data handler's method in the handler's result cache.
+
+    Note:
+        the result gets computed on the first iteration, so errors are raised at the same point as the undecorated
+        method's. the result gets stored immutable(mappings as read only dictionaries, lists as tuples) & every call
+        yields the cached items as they are, so a consumer can neither exhaust nor change the cached result. calls
+        with unhashable arguments are computed without caching. hits & misses get counted by the package's Metrics.
+
+    Args:
+        method(Callable): data handler's method which returns an iterable of items.
+
+    Returns:
+        Callable: wrapped method which returns a fresh generator per call.
+
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs) -> Generator:
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            result = self.result_cache.get(key)
+        except TypeError:
+            yield from method(self, *args, **kwargs)
+            return
+
+        Metrics().increment("handler_result_cache_total", handler=self.__class__.__name__, method=method.__name__,
+                            result="miss" if result is None else "hit")
+        if result is None:
+            generation = self.result_cache.generation
+            result = tuple(_freeze(item) for item in method(self, *args, **kwargs))
+            self.result_cache.put(key, result, generation)
+
+        yield from result
+
+    return wrapper
@@ -0,0 +1,128 @@
+import os
+from typing import List
+
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+import covid19_il.data_handler.consts as data_consts
+
+
+class SnapshotStore:
+    """ Columnar Local Store of the data resources' data frames as uncompressed Arrow/Feather files.
+
+    Note:
+        uncompressed feather files get memory-mapped on load, so a cold start maps a typed file instead of parsing
+        the api's json data: fixed-width columns without nulls(ints, floats, bools) stay read only views of the
+        mapped file, while the other columns(e.g. strings) get converted to the heap. requires the optional pyarrow
+        dependency.
+
+    Attributes:
+        _logger(Logger.logger): snapshot store's actions logger.
+        _store_dir(str): directory of the snapshots.
+
+    Methods:
+        save(self, enum_resource_id: ResourceId, df: pd.DataFrame): stores the data frame of given data resource.
+        load(self, enum_resource_id: ResourceId, memory_map: bool = True): Returns the stored data frame of given
+            data resource or None.
+        exists(self, enum_resource_id: ResourceId): Returns whether given data resource has a snapshot.
+        remove(self, enum_resource_id: ResourceId): removes the snapshot of given data resource.
+        stored_resources(self): Returns the data resources which have a snapshot.
+
+    """
+
+    def __init__(self, logger: Logger.logger, store_dir: str = data_consts.DEFAULT_SNAPSHOT_DIR) -> None:
+        """ Class Initialization
+
+        Raises:
+            ImportError: the optional pyarrow dependency isn't installed.
+        """
+        if feather is None:
+            logger.error("SnapshotStore requires pyarrow, install it via: pip install pyarrow")
+            raise ImportError("SnapshotStore requires pyarrow, install it via: pip install pyarrow")
+
+        self._logger = logger
+        self._store_dir = store_dir
+        os.makedirs(self._store_dir, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}({self._logger}, {self._store_dir})"
+
+    @property
+    def store_dir(self) -> str:
+        """ str: Returns the directory of the snapshots """
+        return self._store_dir
+
+    def _get_path(self, enum_resource_id: ResourceId) -> str:
+        """ Returns the snapshot's file path of given data resource """
+        return os.path.join(self._store_dir, f"{enum_resource_id.name}.feather")
+
+    def save(self, enum_resource_id: ResourceId, df: pd.DataFrame) -> None:
+        """ Stores the data frame of given data resource as an uncompressed(memory-mappable) feather file.
+
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+            df(DataFrame): data resource's data frame.
+
+        Returns:
+            None.
+
+        Raises:
+            TypeError: df isn't a pandas data frame.
+
+        """
+
+        if not isinstance(df, pd.DataFrame):
+            self._logger.exception(f"the input value: {df} isn't pandas data frame")
+            raise TypeError(f"the input value: {df} isn't pandas data frame")
+
+        path = self._get_path(enum_resource_id)
+        # feather requires a default index, written to a temporary file so readers never map a partial file
+        feather.write_feather(df.reset_index(drop=True), f"{path}.tmp", compression="uncompressed")
+        os.replace(f"{path}.tmp", path)
+        self._logger.info(f"saved snapshot of {enum_resource_id.name} with {len(df)} rows")
+
+    def load(self, enum_resource_id: ResourceId, memory_map: bool = True) -> pd.DataFrame or None:
+        """ Returns the stored data frame of given data resource.
+
+        Note:
+            a memory-mapped load converts the arrow table column by column & releases every converted column, so
+            fixed-width columns without nulls are zero-copy read only views of the file, and only the other columns
+            get copied. reading without memory-mapping is a full read of the file to the heap.
+
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+            memory_map(bool): whether memory-map the snapshot's file instead of reading it.
+
+        Returns:
+            DataFrame or None: data resource's data frame or None when it has no snapshot.
+
+        """
+
+        path = self._get_path(enum_resource_id)
+        if not os.path.exists(path):
+            return None
+
+        # split blocks keep every column as its own array, so the mapped buffers don't get consolidated(copied)
+        df = feather.read_table(path, memory_map=memory_map).to_pandas(split_blocks=True, self_destruct=True)
+        self._logger.info(f"loaded snapshot of {enum_resource_id.name} with {len(df)} rows")
+        return df
+
+    def exists(self, enum_resource_id: ResourceId) -> bool:
+        """ Returns whether given data resource has a snapshot """
+        return os.path.exists(self._get_path(enum_resource_id))
+
+    def remove(self, enum_resource_id: ResourceId) -> None:
+        """ Removes the snapshot of given data resource """
+        if self.exists(enum_resource_id):
+            os.remove(self._get_path(enum_resource_id))
+
+    def stored_resources(self) -> List[ResourceId]:
+        """ Returns the data resources which have a snapshot """
+        return [enum_resource_id for enum_resource_id in ResourceId if self.exists(enum_resource_id)]
@@ -0,0 +1,15 @@
+import logging
+import os
+
+# rotating log file: path, max size in bytes before a rollover & amount of kept rolled over files
+DEFAULT_LOG_FILE_PATH = os.path.join(os.curdir, "covid_19_il.log")
+DEFAULT_LOG_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_LOG_BACKUP_COUNT = 5
+
+# max length of a formatted log message, longer messages(e.g. json payloads) get truncated
+DEFAULT_MAX_MESSAGE_LENGTH = 2000
+
+# logger's default level, debug records(e.g. the api client's requests) get formatted only when enabled explicitly
+DEFAULT_LOGGING_LEVEL = logging.INFO
+
+LOG_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
@@ -1,6 +1,12 @@
+import atexit
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from threading import Lock
 
+import covid19_il.logger.consts as logger_consts
+
 """
 # DEBUG: Detailed information, typically of interest only when diagnosing problems.
 ## INFO: Confirmation that things are working as expected.
@@ -10,17 +16,86 @@ from threading import Lock
 """
 
 
+class _LazyQueueHandler(QueueHandler):
+    """ Queue Handler which enqueues the records as they are, so the listener's thread formats their messages """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """ Returns the record unformatted, unlike QueueHandler which formats it on the caller's thread """
+        return record
+
+
+class _TruncatingFormatter(logging.Formatter):
+    """ Formatter which truncates messages longer than max message length, e.g. logged json payloads """
+
+    def __init__(self, fmt: str, max_message_length: int = None) -> None:
+        """ Class Initialization """
+        super().__init__(fmt)
+        self._max_message_length = max_message_length
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """ Returns the formatted record, with its message truncated to max message length """
+        message_length = len(record.message)
+        if self._max_message_length and message_length > self._max_message_length:
+            record.message = f"{record.message[:self._max_message_length]}... " \
+                             f"[truncated {message_length - self._max_message_length} characters]"
+        return super().formatMessage(record)
+
+
 class Logger:
-    """ Universal Logger """
+    """ Universal Logger
+
+    Note:
+        a singleton which configures the package's logger once, by its first construction or by configure's method.
+        in queued mode(the default) the logger's only handler enqueues the records, & a listener thread formats &
+        writes them to the rotating log file & the console, so logging never formats nor writes on the caller's
+        thread. the log calls should pass their arguments %-style(logger.debug("url query is: %s", url_query)) rather
+        than as f-strings, so an argument gets formatted only if its level is enabled, & only by the listener thread.
+        a payload(e.g. json data) should be logged by its size or summary, since the truncation of a long message
+        happens only after the whole message got formatted.
+        a forked child process(e.g. a process pool's worker) writes synchronously, since the listener thread isn't
+        forked.
+
+    Attributes:
+        _instance(Logger): class attribute - the singleton instance.
+        _logger(logging.Logger): class attribute - the package's logger.
+        _lock(Lock): class attribute - guards the singleton's creation & configuration.
+        _initialized(bool): whether the singleton was initialized.
+        _logging_level(int): logger's level.
+        _handlers(List[logging.Handler]): rotating file & console handlers.
+        _queue_handler(QueueHandler): logger's handler in queued mode, otherwise None.
+        _listener(QueueListener): thread which writes the queued records to the handlers, otherwise None.
+
+    Methods:
+        configure(self, ...): replaces the logger's handlers by given configuration.
+        set_level(self, logging_level: int, file_level: int = None, stream_level: int = None): sets the logger's &
+            handlers' levels.
+        flush(self): writes the queued records.
+        stop(self): writes the queued records & stops the listener thread.
+
+    """
+
     _instance = None
     _logger = logging.getLogger('root')
+    _lock = Lock()
 
-    def __init__(self, logging_level: int = logging.DEBUG) -> None:
-        self._logging_level = logging_level
-        self._file_handler = logging.FileHandler(f".\\covid_19_il.log")
-        self._stream_handler = logging.StreamHandler()
-        self._formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
-        self._logger_init()
+    def __init__(self, logging_level: int = logger_consts.DEFAULT_LOGGING_LEVEL, **kwargs) -> None:
+        """ Class Initialization, configures the logger on the singleton's first construction only
+
+        Args:
+            logging_level(int): logger's level.
+            **kwargs: configure's method's keyword arguments.
+        """
+        with Logger._lock:
+            if getattr(self, "_initialized", False):
+                return
+            self._initialized = True
+            self._queue_handler = None
+            self._listener = None
+            self._handlers = []
+        self.configure(logging_level, **kwargs)
+        atexit.register(self.stop)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork_in_child)
 
     def __repr__(self) -> str:
         """ Returns Class Representation """
@@ -29,9 +104,9 @@ class Logger:
     def __new__(cls, *args, **kwargs) -> 'Logger':
         """ Constructor's Double Check Lock for Handling a Singelton Instance """
         if not cls._instance:
-            with Lock():
+            with cls._lock:
                 if not cls._instance:
-                    cls._instance = super().__new__(cls, *args, **kwargs)
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
     @property
@@ -39,10 +114,121 @@ class Logger:
         """ Returns Logger Component """
         return self._logger
 
-    def _logger_init(self) -> None:
-        """ Logger initialization: Level, Formatter and Handlers """
-        self._logger.setLevel(self._logging_level)
-        self._file_handler.setFormatter(self._formatter)
-        self._stream_handler.setFormatter(self._formatter)
-        self._logger.addHandler(self._file_handler)
-        self._logger.addHandler(self._stream_handler)
+    @property
+    def queued(self) -> bool:
+        """ bool: Returns whether the records get written by the listener thread """
+        return self._listener is not None
+
+    def configure(self,
+                  logging_level: int = logger_consts.DEFAULT_LOGGING_LEVEL,
+                  queued: bool = True,
+                  log_file_path: str = logger_consts.DEFAULT_LOG_FILE_PATH,
+                  max_bytes: int = logger_consts.DEFAULT_LOG_MAX_BYTES,
+                  backup_count: int = logger_consts.DEFAULT_LOG_BACKUP_COUNT,
+                  max_message_length: int = logger_consts.DEFAULT_MAX_MESSAGE_LENGTH,
+                  file_level: int = logging.NOTSET,
+                  stream_level: int = logging.NOTSET) -> None:
+        """ Replaces the logger's handlers by given configuration, after writing the already queued records.
+
+        Args:
+            logging_level(int): logger's level.
+            queued(bool): whether the records get written by a listener thread instead of the caller's thread.
+            log_file_path(str): path of the rotating log file, None for logging to the console only.
+            max_bytes(int): log file's max size in bytes before a rollover, 0 for never rolling over.
+            backup_count(int): amount of kept rolled over log files.
+            max_message_length(int): max length of a formatted message, None for never truncating.
+            file_level(int): log file handler's level.
+            stream_level(int): console handler's level.
+
+        """
+
+        with Logger._lock:
+            self._remove_handlers()
+            self._logging_level = logging_level
+            formatter = _TruncatingFormatter(logger_consts.LOG_FORMAT, max_message_length)
+            self._handlers = []
+            if log_file_path is not None:
+                file_handler = RotatingFileHandler(log_file_path, maxBytes=max_bytes, backupCount=backup_count,
+                                                   encoding="utf-8", delay=True)
+                file_handler.set_name("file")
+                file_handler.setLevel(file_level)
+                self._handlers.append(file_handler)
+            stream_handler = logging.StreamHandler()
+            stream_handler.set_name("stream")
+            stream_handler.setLevel(stream_level)
+            self._handlers.append(stream_handler)
+            for handler in self._handlers:
+                handler.setFormatter(formatter)
+
+            self._logger.setLevel(logging_level)
+            if queued:
+                records_queue = queue.SimpleQueue()
+                self._queue_handler = _LazyQueueHandler(records_queue)
+                self._listener = QueueListener(records_queue, *self._handlers, respect_handler_level=True)
+                self._listener.start()
+                self._logger.addHandler(self._queue_handler)
+            else:
+                for handler in self._handlers:
+                    self._logger.addHandler(handler)
+
+    def set_level(self, logging_level: int, file_level: int = None, stream_level: int = None) -> None:
+        """ Sets the logger's level & optionally its handlers' levels.
+
+        Args:
+            logging_level(int): logger's level.
+            file_level(int): log file handler's level, None for keeping it.
+            stream_level(int): console handler's level, None for keeping it.
+
+        """
+
+        self._logging_level = logging_level
+        self._logger.setLevel(logging_level)
+        for handler in self._handlers:
+            handler_level = {"file": file_level, "stream": stream_level}[handler.get_name()]
+            if handler_level is not None:
+                handler.setLevel(handler_level)
+
+    def flush(self) -> None:
+        """ Writes the queued records & flushes the handlers. """
+        with Logger._lock:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener.start()
+            for handler in self._handlers:
+                handler.flush()
+
+    def stop(self) -> None:
+        """ Writes the queued records, stops the listener thread & closes the handlers. """
+        with Logger._lock:
+            self._remove_handlers()
+
+    def _remove_handlers(self) -> None:
+        """ Removes & closes the logger's handlers after writing the queued records.
+        Note:
+            private method which get called by configure & stop's methods, while holding the lock.
+        """
+
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._queue_handler is not None:
+            self._logger.removeHandler(self._queue_handler)
+            self._queue_handler = None
+        for handler in self._handlers:
+            self._logger.removeHandler(handler)
+            handler.close()
+        self._handlers = []
+
+    def _after_fork_in_child(self) -> None:
+        """ Switches a forked child process to synchronous handlers, since its listener thread wasn't forked.
+        Note:
+            private method which get called by os.fork in the child process.
+        """
+
+        Logger._lock = Lock()
+        if self._queue_handler is not None:
+            self._logger.removeHandler(self._queue_handler)
+            self._queue_handler = None
+            self._listener = None
+            for handler in self._handlers:
+                self._logger.addHandler(handler)
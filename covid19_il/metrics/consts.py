@@ -0,0 +1,10 @@
+# environment variable which enables the metrics' recording at import time, e.g. COVID19_IL_METRICS=1
+METRICS_ENV_VAR = "COVID19_IL_METRICS"
+
+# prefix of the exported metrics' names
+METRICS_PREFIX = "covid19_il_"
+
+# histograms' upper bounds: latency in seconds, response size in bytes & amount of rows or items
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+BYTES_BUCKETS = (1024, 10 * 1024, 100 * 1024, 1024 ** 2, 10 * 1024 ** 2, 100 * 1024 ** 2)
+ROWS_BUCKETS = (1, 10, 100, 1000, 10000, 100000, 1000000)
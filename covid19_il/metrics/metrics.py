@@ -0,0 +1,376 @@
+import bisect
+import inspect
+import json
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Dict, Generator, Iterable, Tuple
+
+import covid19_il.metrics.consts as metrics_consts
+
+
+class Histogram:
+    """ Cumulative Histogram of observed values by fixed upper bounds, like Prometheus' histogram.
+
+    Attributes:
+        _buckets(Tuple[float]): sorted upper bounds of the buckets, +Inf is implicit.
+        _counts(List[int]): observations per bucket, the last one counts the observations above every bound.
+        _sum(float): sum of the observed values.
+        _count(int): amount of observations.
+
+    Methods:
+        observe(self, value: float): counts given value in its bucket.
+        to_dict(self): Returns the cumulative buckets' counts, sum & count.
+
+    """
+
+    def __init__(self, buckets: Iterable[float]) -> None:
+        """ Class Initialization """
+        self._buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}({self._buckets})"
+
+    @property
+    def sum(self) -> float:
+        """ float: Returns the sum of the observed values """
+        return self._sum
+
+    @property
+    def count(self) -> int:
+        """ int: Returns the amount of observations """
+        return self._count
+
+    def observe(self, value: float) -> None:
+        """ Counts given value in the first bucket whose upper bound isn't below it """
+        self._counts[bisect.bisect_left(self._buckets, value)] += 1
+        self._sum += value
+        self._count += 1
+
+    def to_dict(self) -> Dict:
+        """ Returns the cumulative counts by upper bound(as Prometheus' le label), sum & count """
+        cumulative_counts, total = {}, 0
+        for upper_bound, bucket_count in zip((*self._buckets, float("inf")), self._counts):
+            total += bucket_count
+            cumulative_counts[_format_number(upper_bound)] = total
+        return {"buckets": cumulative_counts, "sum": self._sum, "count": self._count}
+
+
+class Metrics:
+    """ Opt-In Registry of the package's timing & size metrics: histograms & counters by name & labels.
+
+    Note:
+        a singleton like the Logger. recording is disabled by default, so the instrumented hot paths only check a
+        flag; enable it by enable's method or by the COVID19_IL_METRICS=1 environment variable. the metrics get
+        exported as Prometheus' text exposition format or as json.
+
+    Attributes:
+        _instance(Metrics): class attribute - the singleton instance.
+        _lock(Lock): class attribute - guards the singleton's creation & the registry's updates.
+        _enabled(bool): whether metrics get recorded.
+        _histograms(Dict[str, Dict[Tuple, Histogram]]): metric's name: labels: histogram.
+        _counters(Dict[str, Dict[Tuple, float]]): metric's name: labels: value.
+
+    Methods:
+        enable(self): starts recording metrics.
+        disable(self): stops recording metrics.
+        reset(self): removes every recorded metric.
+        observe(self, name: str, value: float, buckets: Iterable[float], **labels): counts a value in a histogram.
+        increment(self, name: str, value: float = 1, **labels): increments a counter.
+        timer(self, name: str, **labels): context manager which observes its block's latency in seconds.
+        get_histogram(self, name: str, **labels): Returns the histogram of given name & labels or None.
+        get_counter(self, name: str, **labels): Returns the counter's value of given name & labels.
+        to_dict(self): Returns every recorded metric as a dictionary.
+        to_json(self): Returns every recorded metric as json.
+        to_prometheus(self): Returns every recorded metric in Prometheus' text exposition format.
+
+    """
+
+    _instance = None
+    _lock = Lock()
+
+    def __init__(self) -> None:
+        """ Class Initialization, only on the singleton's first construction """
+        if getattr(self, "_histograms", None) is not None:
+            return
+        with Metrics._lock:
+            if getattr(self, "_histograms", None) is not None:
+                return
+            self._enabled = os.environ.get(metrics_consts.METRICS_ENV_VAR, "").lower() in ("1", "true", "yes")
+            self._histograms = {}
+            self._counters = {}
+
+    def __new__(cls, *args, **kwargs) -> 'Metrics':
+        """ Constructor's Double Check Lock for Handling a Singelton Instance """
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}(enabled={self._enabled})"
+
+    @property
+    def enabled(self) -> bool:
+        """ bool: Returns whether metrics get recorded """
+        return self._enabled
+
+    def enable(self) -> None:
+        """ Starts recording metrics. """
+        self._enabled = True
+
+    def disable(self) -> None:
+        """ Stops recording metrics, the recorded ones are kept. """
+        self._enabled = False
+
+    def reset(self) -> None:
+        """ Removes every recorded metric. """
+        with Metrics._lock:
+            self._histograms = {}
+            self._counters = {}
+
+    def observe(self, name: str, value: float, buckets: Iterable[float] = metrics_consts.LATENCY_BUCKETS,
+                **labels: Any) -> None:
+        """ Counts a value in the histogram of given name & labels, when recording is enabled.
+
+        Args:
+            name(str): metric's name, without the package's prefix.
+            value(float): observed value.
+            buckets(Iterable[float]): histogram's upper bounds, used when the histogram gets created.
+            **labels: metric's labels.
+
+        """
+
+        if not self._enabled:
+            return
+
+        labels_key = _get_labels_key(labels)
+        with Metrics._lock:
+            histograms = self._histograms.setdefault(name, {})
+            if labels_key not in histograms:
+                histograms[labels_key] = Histogram(buckets)
+            histograms[labels_key].observe(value)
+
+    def increment(self, name: str, value: float = 1, **labels: Any) -> None:
+        """ Increments the counter of given name & labels, when recording is enabled.
+
+        Args:
+            name(str): metric's name, without the package's prefix.
+            value(float): increment.
+            **labels: metric's labels.
+
+        """
+
+        if not self._enabled:
+            return
+
+        labels_key = _get_labels_key(labels)
+        with Metrics._lock:
+            counters = self._counters.setdefault(name, {})
+            counters[labels_key] = counters.get(labels_key, 0) + value
+
+    @contextmanager
+    def timer(self, name: str, **labels: Any) -> Generator[None, None, None]:
+        """ Observes the latency in seconds of the context manager's block, also when it raises.
+
+        Args:
+            name(str): histogram's name, without the package's prefix.
+            **labels: histogram's labels.
+
+        """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def get_histogram(self, name: str, **labels: Any) -> Histogram or None:
+        """ Returns the histogram of given name & labels or None when nothing was observed """
+        labels_key = _get_labels_key(labels)
+        return self._histograms.get(name, {}).get(labels_key)
+
+    def get_counter(self, name: str, **labels: Any) -> float:
+        """ Returns the counter's value of given name & labels, 0 when it wasn't incremented """
+        labels_key = _get_labels_key(labels)
+        return self._counters.get(name, {}).get(labels_key, 0)
+
+    def to_dict(self) -> Dict:
+        """ Returns every recorded metric as a dictionary.
+
+        Returns:
+            Dict: {"histograms": {name: [{"labels": {...}, "buckets": {le: count}, "sum": ..., "count": ...}]},
+                "counters": {name: [{"labels": {...}, "value": ...}]}}, names include the package's prefix.
+
+        """
+
+        with Metrics._lock:
+            return {"histograms": {f"{metrics_consts.METRICS_PREFIX}{name}":
+                                   [{"labels": dict(labels_key), **histogram.to_dict()}
+                                    for labels_key, histogram in histograms.items()]
+                                   for name, histograms in sorted(self._histograms.items())},
+                    "counters": {f"{metrics_consts.METRICS_PREFIX}{name}":
+                                 [{"labels": dict(labels_key), "value": value}
+                                  for labels_key, value in counters.items()]
+                                 for name, counters in sorted(self._counters.items())}}
+
+    def to_json(self) -> str:
+        """ Returns every recorded metric as json, see to_dict's method """
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """ Returns every recorded metric in Prometheus' text exposition format.
+
+        Returns:
+            str: histograms' _bucket, _sum & _count series & counters' series, each metric with its TYPE line.
+
+        """
+
+        metrics = self.to_dict()
+        lines = []
+        for name, histograms in metrics["histograms"].items():
+            lines.append(f"# TYPE {name} histogram")
+            for histogram in histograms:
+                for upper_bound, count in histogram["buckets"].items():
+                    lines.append(f"{name}_bucket{_format_labels({**histogram['labels'], 'le': upper_bound})} {count}")
+                lines.append(f"{name}_sum{_format_labels(histogram['labels'])} {_format_number(histogram['sum'])}")
+                lines.append(f"{name}_count{_format_labels(histogram['labels'])} {histogram['count']}")
+        for name, counters in metrics["counters"].items():
+            lines.append(f"# TYPE {name} counter")
+            for counter in counters:
+                lines.append(f"{name}{_format_labels(counter['labels'])} {_format_number(counter['value'])}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _get_labels_key(labels: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    """ Returns the registry's key of given labels: sorted (name, value as string) pairs """
+    return tuple(sorted((label_name, str(label_value)) for label_name, label_value in labels.items()))
+
+
+def _format_number(value: float) -> str:
+    """ Formats a number as Prometheus' text format does: +Inf, integers without a fraction & repr of floats """
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """ Formats labels as Prometheus' text format does, escaping backslashes, quotes & new lines """
+    if not labels:
+        return ""
+    escaped_labels = (f'{label_name}="{_escape_label_value(label_value)}"'
+                      for label_name, label_value in labels.items())
+    return "{" + ",".join(escaped_labels) + "}"
+
+
+def _escape_label_value(label_value: str) -> str:
+    """ Escapes a label's value for Prometheus' text format """
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _observe_generator(generator: Generator, name: str, labels: Dict[str, Any]) -> Generator:
+    """ Yields the generator's items, then observes the time spent in producing them & their amount.
+
+    Note:
+        only the time spent inside the generator is measured, not the consumer's time between the items. the
+        observation gets recorded once the generator gets exhausted, closed or raises.
+
+    """
+
+    metrics = Metrics()
+    elapsed, items_count = 0.0, 0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(generator)
+            except StopIteration:
+                elapsed += time.perf_counter() - start
+                return
+            except Exception:
+                metrics.increment(f"{name}_errors_total", **labels)
+                raise
+            elapsed += time.perf_counter() - start
+            items_count += 1
+            yield item
+    finally:
+        generator.close()
+        metrics.observe(f"{name}_seconds", elapsed, **labels)
+        metrics.observe(f"{name}_items", items_count, metrics_consts.ROWS_BUCKETS, **labels)
+
+
+def timed(name: str, **labels: Any) -> Callable[[Callable], Callable]:
+    """ Decorator which observes the latency in seconds of every call of the function, when recording is enabled.
+
+    Args:
+        name(str): histogram's name, without the package's prefix & the _seconds suffix.
+        **labels: histogram's labels.
+
+    Returns:
+        Callable: decorator.
+
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> Any:
+            metrics = Metrics()
+            if not metrics.enabled:
+                return function(*args, **kwargs)
+            with metrics.timer(f"{name}_seconds", **labels):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def instrumented_method(method: Callable) -> Callable:
+    """ Decorator which observes the latency of a data handler's public method & the amount of its result's items.
+
+    Note:
+        labeled by the handler's class & the method's name. a generator's latency is the time spent in producing
+        its items, measured once it gets exhausted, so lazy results keep being lazy. when recording is disabled the
+        method gets called as is.
+
+    Args:
+        method(Callable): data handler's public method.
+
+    Returns:
+        Callable: wrapped method.
+
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs) -> Any:
+        metrics = Metrics()
+        if not metrics.enabled:
+            return method(self, *args, **kwargs)
+
+        labels = {"handler": self.__class__.__name__, "method": method.__name__}
+        start = time.perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+        except Exception:
+            metrics.increment("handler_method_errors_total", **labels)
+            raise
+        if inspect.isgenerator(result):
+            return _observe_generator(result, "handler_method", labels)
+
+        metrics.observe("handler_method_seconds", time.perf_counter() - start, **labels)
+        return result
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
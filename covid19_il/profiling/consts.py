@@ -0,0 +1,10 @@
+# environment variables which enable the profiling at import time: reports' directory & comma separated targets,
+# e.g. COVID19_IL_PROFILE_DIR=profiles COVID19_IL_PROFILE_TARGETS="Cities.*,ApiDataIL.get_data_by_resource_id"
+PROFILE_DIR_ENV_VAR = "COVID19_IL_PROFILE_DIR"
+PROFILE_TARGETS_ENV_VAR = "COVID19_IL_PROFILE_TARGETS"
+
+# amount of functions & allocations' lines listed by a report
+DEFAULT_PROFILE_TOP_N = 25
+
+# name of pandas' copy methods, e.g. NDFrame.copy & BlockManager.copy, counted as data frame copies
+PANDAS_COPY_FUNCTION_NAME = "copy"
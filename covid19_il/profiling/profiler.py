@@ -0,0 +1,361 @@
+import cProfile
+import fnmatch
+import inspect
+import io
+import os
+import pstats
+import time
+import tracemalloc
+from functools import wraps
+from threading import Lock, local
+from typing import Any, Callable, Generator, Iterable, List
+
+from covid19_il.logger.logger import Logger
+import covid19_il.profiling.consts as profiling_consts
+
+
+class _CallProfile:
+    """ cProfile & tracemalloc session of a single profiled call.
+
+    Note:
+        tracemalloc traces every thread, so concurrently profiled calls share its tracing & their peaks overlap.
+        it gets started by the first running session & stopped by the last one, unless it was already tracing.
+
+    Attributes:
+        _tracemalloc_lock(Lock): class attribute - guards the running sessions' counter.
+        _tracemalloc_sessions(int): class attribute - amount of running sessions.
+        _tracemalloc_started(bool): class attribute - whether the sessions started tracemalloc.
+        name(str): profiled call's name, Class.method.
+        _profile(cProfile.Profile): call's profile, enabled while the call runs.
+        _start_snapshot(tracemalloc.Snapshot): traced allocations at the call's start.
+        _start_memory(int): traced memory in bytes at the call's start.
+        _start(float): call's start time.
+
+    """
+
+    _tracemalloc_lock = Lock()
+    _tracemalloc_sessions = 0
+    _tracemalloc_started = False
+
+    def __init__(self, name: str) -> None:
+        """ Class Initialization, starts tracing the allocations """
+        self.name = name
+        self._profile = cProfile.Profile()
+        with _CallProfile._tracemalloc_lock:
+            if _CallProfile._tracemalloc_sessions == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _CallProfile._tracemalloc_started = True
+            _CallProfile._tracemalloc_sessions += 1
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        self._start_snapshot = tracemalloc.take_snapshot()
+        self._start_memory = tracemalloc.get_traced_memory()[0]
+        self._start = time.perf_counter()
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}({self.name})"
+
+    def resume(self) -> None:
+        """ Enables the call's profile. """
+        self._profile.enable()
+
+    def pause(self) -> None:
+        """ Disables the call's profile. """
+        self._profile.disable()
+
+    def finish(self, outcome: str, top_n: int) -> str:
+        """ Stops tracing the allocations & Returns the call's report.
+
+        Args:
+            outcome(str): call's result's description, e.g. returned or raised ValueError.
+            top_n(int): amount of listed functions & allocations' lines.
+
+        Returns:
+            str: report of the call's wall time, top functions by cumulative time, peak & retained allocations &
+                pandas' copies.
+
+        """
+
+        wall_time = time.perf_counter() - self._start
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        with _CallProfile._tracemalloc_lock:
+            _CallProfile._tracemalloc_sessions -= 1
+            if _CallProfile._tracemalloc_sessions == 0 and _CallProfile._tracemalloc_started:
+                tracemalloc.stop()
+                _CallProfile._tracemalloc_started = False
+
+        report = io.StringIO()
+        report.write(f"profile of {self.name}: {outcome} after {wall_time:.6f} seconds\n")
+        report.write(f"peak traced memory: {_format_size(peak_memory - self._start_memory)}, "
+                     f"retained: {_format_size(current_memory - self._start_memory)}\n\n")
+
+        stats = pstats.Stats(self._profile, stream=report)
+        report.write(f"top {top_n} functions by cumulative time:\n")
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top_n)
+
+        filters = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__),
+                   tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                   tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"))
+        statistics = snapshot.filter_traces(filters).compare_to(self._start_snapshot.filter_traces(filters), "lineno")
+        report.write(f"top {top_n} allocations' lines by retained size:\n")
+        for statistic in statistics[:top_n]:
+            if statistic.size_diff <= 0:
+                break
+            report.write(f"    {statistic.traceback}: {_format_size(statistic.size_diff)} "
+                         f"in {statistic.count_diff} blocks\n")
+
+        report.write("\npandas' copies:\n")
+        report.write("".join(_get_pandas_copies_lines(stats)) or "    none\n")
+        return report.getvalue()
+
+    def dump_stats(self, file_path: str) -> None:
+        """ Writes the call's profile to given file, for pstats & profile viewers. """
+        self._profile.dump_stats(file_path)
+
+
+class Profiler:
+    """ Opt-In Profiler of the data handlers' public methods & the api client's get requests.
+
+    Note:
+        a singleton like the Logger. profiling is disabled by default, so the wrapped methods only check a flag;
+        enable it by enable's method or by the COVID19_IL_PROFILE_DIR & COVID19_IL_PROFILE_TARGETS environment
+        variables. every profiled call writes a text report(top functions, peak & retained allocations, pandas'
+        copies) & a .prof file of its cProfile stats to the reports' directory. a generator gets profiled while it
+        produces its items, & its report gets written once it gets exhausted, closed or raises. a profiled call
+        within another profiled call of the same thread is part of the outer call's report.
+
+    Attributes:
+        _instance(Profiler): class attribute - the singleton instance.
+        _lock(Lock): class attribute - guards the singleton's creation & the reports' sequence.
+        _enabled(bool): whether calls get profiled.
+        _output_dir(str): reports' directory.
+        _targets(Tuple[str]): fnmatch patterns of the profiled Class.method names, None for every wrapped method.
+        _top_n(int): amount of functions & allocations' lines listed by a report.
+        _sequence(int): amount of profiled calls, part of the reports' file names.
+        _thread_local(local): whether a call is being profiled by the current thread.
+
+    Methods:
+        enable(self, output_dir: str, targets: Iterable[str] = None, top_n: int = 25): starts profiling the targets.
+        disable(self): stops profiling.
+        is_target(self, name: str): Returns whether calls of given Class.method name get profiled.
+        profile_call(self, name: str, function: Callable, *args, **kwargs): Returns the function's result & writes
+            its report.
+
+    """
+
+    _instance = None
+    _lock = Lock()
+
+    def __init__(self) -> None:
+        """ Class Initialization, only on the singleton's first construction """
+        if getattr(self, "_thread_local", None) is not None:
+            return
+        with Profiler._lock:
+            if getattr(self, "_thread_local", None) is not None:
+                return
+            self._enabled = False
+            self._output_dir = None
+            self._targets = None
+            self._top_n = profiling_consts.DEFAULT_PROFILE_TOP_N
+            self._sequence = 0
+            self._thread_local = local()
+
+        output_dir = os.environ.get(profiling_consts.PROFILE_DIR_ENV_VAR)
+        if output_dir:
+            targets = os.environ.get(profiling_consts.PROFILE_TARGETS_ENV_VAR)
+            self.enable(output_dir, targets.split(",") if targets else None)
+
+    def __new__(cls, *args, **kwargs) -> 'Profiler':
+        """ Constructor's Double Check Lock for Handling a Singelton Instance """
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}(enabled={self._enabled}, output_dir={self._output_dir})"
+
+    @property
+    def enabled(self) -> bool:
+        """ bool: Returns whether calls get profiled """
+        return self._enabled
+
+    @property
+    def output_dir(self) -> str or None:
+        """ str: Returns the reports' directory """
+        return self._output_dir
+
+    def enable(self, output_dir: str, targets: Iterable[str] = None,
+               top_n: int = profiling_consts.DEFAULT_PROFILE_TOP_N) -> None:
+        """ Starts profiling the targets' calls, creating the reports' directory if needed.
+
+        Args:
+            output_dir(str): reports' directory.
+            targets(Iterable[str]): fnmatch patterns of Class.method names, e.g. "Cities.*" or
+                "ApiDataIL.get_data_by_resource_id", None for every wrapped method.
+            top_n(int): amount of functions & allocations' lines listed by a report.
+
+        Raises:
+            ValueError: top_n isn't positive.
+
+        """
+
+        if top_n < 1:
+            raise ValueError(f"top_n must be positive, got {top_n}")
+
+        os.makedirs(output_dir, exist_ok=True)
+        self._output_dir = output_dir
+        self._targets = tuple(target.strip() for target in targets if target.strip()) if targets is not None else None
+        self._top_n = top_n
+        self._enabled = True
+
+    def disable(self) -> None:
+        """ Stops profiling, the written reports are kept. """
+        self._enabled = False
+
+    def is_target(self, name: str) -> bool:
+        """ Returns whether calls of given Class.method name get profiled """
+        if not self._enabled or getattr(self._thread_local, "active", False):
+            return False
+        return self._targets is None or any(fnmatch.fnmatchcase(name, target) for target in self._targets)
+
+    def profile_call(self, name: str, function: Callable, *args, **kwargs) -> Any:
+        """ Calls the function under cProfile & tracemalloc & writes the call's report.
+
+        Args:
+            name(str): call's name in the report & its file name, Class.method.
+            function(Callable): profiled function.
+            *args: function's arguments.
+            **kwargs: function's keyword arguments.
+
+        Returns:
+            Any: function's result, a generator's result gets profiled while it produces its items.
+
+        """
+
+        call_profile = _CallProfile(name)
+        self._thread_local.active = True
+        call_profile.resume()
+        try:
+            result = function(*args, **kwargs)
+        except Exception as e:
+            call_profile.pause()
+            self._thread_local.active = False
+            self._write_report(call_profile, f"raised {e.__class__.__name__}")
+            raise
+        call_profile.pause()
+        self._thread_local.active = False
+
+        if inspect.isgenerator(result):
+            return self._profile_generator(call_profile, result)
+
+        self._write_report(call_profile, "returned")
+        return result
+
+    def _profile_generator(self, call_profile: _CallProfile, generator: Generator) -> Generator:
+        """ Yields the generator's items, profiling it only while it produces them.
+        Note:
+            private method which get called by profile_call's method.
+        """
+
+        items_count, outcome = 0, "closed"
+        try:
+            while True:
+                self._thread_local.active = True
+                call_profile.resume()
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    outcome = "exhausted"
+                    return
+                except Exception as e:
+                    outcome = f"raised {e.__class__.__name__}"
+                    raise
+                finally:
+                    call_profile.pause()
+                    self._thread_local.active = False
+                items_count += 1
+                yield item
+        finally:
+            generator.close()
+            self._write_report(call_profile, f"{outcome} with {items_count} items")
+
+    def _write_report(self, call_profile: _CallProfile, outcome: str) -> None:
+        """ Writes the call's text report & its .prof stats file to the reports' directory.
+        Note:
+            private method which get called once a profiled call ends. a failure to write the report gets logged &
+            never fails the profiled call.
+        """
+
+        with Profiler._lock:
+            self._sequence += 1
+            sequence = self._sequence
+        file_path = os.path.join(self._output_dir,
+                                 f"{time.strftime('%Y%m%d-%H%M%S')}_{os.getpid()}_{sequence:05d}_{call_profile.name}")
+        logger = Logger().logger
+        try:
+            report = call_profile.finish(outcome, self._top_n)
+            call_profile.dump_stats(f"{file_path}.prof")
+            with open(f"{file_path}.txt", "w", encoding="utf-8") as report_file:
+                report_file.write(report)
+        except (OSError, ValueError) as e:
+            logger.exception(e)
+        else:
+            logger.info("wrote profile report of %s to %s.txt", call_profile.name, file_path)
+
+
+def _format_size(size: int) -> str:
+    """ Formats a size in bytes as KiB or MiB, keeping its sign """
+    if abs(size) >= 1024 ** 2:
+        return f"{size / 1024 ** 2:.2f} MiB"
+    return f"{size / 1024:.2f} KiB"
+
+
+def _get_pandas_copies_lines(stats: pstats.Stats) -> List[str]:
+    """ Returns the report's lines of pandas' copy methods' calls & their callers, by descending calls amount """
+    lines = []
+    pandas_dir = f"{os.sep}pandas{os.sep}"
+    copies = [(function, function_stats) for function, function_stats in stats.stats.items()
+              if function[2] == profiling_consts.PANDAS_COPY_FUNCTION_NAME and pandas_dir in function[0]]
+    for (file_name, line_number, _), (_, calls, _, cumulative_time, callers) in \
+            sorted(copies, key=lambda copy: copy[1][1], reverse=True):
+        lines.append(f"    {file_name[file_name.rfind(pandas_dir) + 1:]}:{line_number}(copy): {calls} calls, "
+                     f"{cumulative_time:.6f} seconds\n")
+        for (caller_file_name, caller_line_number, caller_name), caller_stats in callers.items():
+            lines.append(f"        called {caller_stats[0]} times by {os.path.basename(caller_file_name)}:"
+                         f"{caller_line_number}({caller_name})\n")
+    return lines
+
+
+def profiled_method(method: Callable) -> Callable:
+    """ Decorator which profiles a method's calls by the package's Profiler, when its Class.method is a target.
+
+    Note:
+        named by the instance's class, so a subclass' calls match its own name. when profiling is disabled the
+        method gets called as is.
+
+    Args:
+        method(Callable): data handler's public method or api client's method.
+
+    Returns:
+        Callable: wrapped method.
+
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs) -> Any:
+        profiler = Profiler()
+        if not profiler.enabled:
+            return method(self, *args, **kwargs)
+
+        name = f"{self.__class__.__name__}.{method.__name__}"
+        if not profiler.is_target(name):
+            return method(self, *args, **kwargs)
+        return profiler.profile_call(name, method, self, *args, **kwargs)
+
+    wrapper.__profiled__ = True
+    return wrapper
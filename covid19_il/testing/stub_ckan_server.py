@@ -0,0 +1,396 @@
+import hashlib
+import json
+import math
+import random
+import time
+from collections import deque
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from covid19_il.data_handler.enums.resource_id import ResourceId
+import covid19_il.api_handler.consts as api_consts
+
+
+class _StubCkanRequestHandler(BaseHTTPRequestHandler):
+    """ Http Request Handler of the Stub CKAN Server, which delegates every get request to the server's stub """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        """ Silences the per request log line of the base class """
+
+    def do_GET(self) -> None:
+        """ Responds a get request by the stub's resources & configuration """
+        status, headers, body = self.server.stub._respond(self.path, self.headers)
+        self.send_response(status)
+        for header_name, header_value in headers.items():
+            self.send_header(header_name, header_value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubCkanServer:
+    """ Local Stand-in of data.gov.il's CKAN datastore_search & resource_show actions, serving given resources.
+
+    Note:
+        for offline tests & load tests of the api clients: the server runs on a local port in a background thread &
+        its base_url gets passed to an api client, e.g. ApiDataIL(logger, base_url=server.base_url). records get paged
+        by limit & offset like CKAN(page_size records without a limit, at most rows_max), q filters the records which
+        have a value containing it, filters by columns' values, sort orders them, fields projects their columns &
+        distinct drops the repeated rows, & a response's ETag is honored by If-None-Match with 304. an unknown column
+        gets CKAN's 409 validation error. the latency, error injection & throttling attributes may be changed while
+        the server runs.
+
+    Attributes:
+        latency(float): seconds of delay before every response.
+        page_size(int): amount of records of a request without a limit.
+        rows_max(int): max amount of records of a request.
+        error_rate(float): probability of a request to fail with error_status.
+        error_status(int): http status code of the injected errors.
+        max_requests_per_second(float or None): throttling rate, exceeding requests get 429 with a Retry-After header.
+        _resources(Dict[str, Dict]): resource id: json data of the resource's records & fields.
+        _metadata_modified(Dict[str, str]): resource id: the time the resource was added.
+        _random(random.Random): injected errors' random generator, seeded for reproducible errors.
+        _failing_requests(deque): status codes of the next requests which fail deterministically.
+        _requests_times(deque): times of the last second's requests, for throttling.
+        _requests_count(int): amount of requests which were received.
+        _lock(Lock): guards the server's counters between the request handling threads.
+        _host(str): host to bind to.
+        _port(int): port to bind to, a free port when 0.
+        _http_server(ThreadingHTTPServer): running http server or None.
+        _thread(Thread): thread of the running http server or None.
+
+    Methods:
+        add_resource(self, enum_resource_id: ResourceId, json_data: Dict): serves the records of given json data as
+            the data resource.
+        add_json_file(self, enum_resource_id: ResourceId, json_file_path: str): serves the records of given json
+            file as the data resource.
+        fail_next_requests(self, count: int, status: int = 503): makes the next requests fail with given status.
+        start(self): starts serving in a background thread.
+        close(self): stops serving & releases the port.
+
+    """
+
+    def __init__(self,
+                 latency: float = 0,
+                 page_size: int = 100,
+                 rows_max: int = 32000,
+                 error_rate: float = 0,
+                 error_status: int = 500,
+                 max_requests_per_second: float = None,
+                 seed: int = None,
+                 host: str = "127.0.0.1",
+                 port: int = 0) -> None:
+        """ Class Initialization
+
+        Args:
+            latency(float): seconds of delay before every response.
+            page_size(int): amount of records of a request without a limit, CKAN's default is 100.
+            rows_max(int): max amount of records of a request, CKAN's default is 32000.
+            error_rate(float): probability of a request to fail with error_status.
+            error_status(int): http status code of the injected errors.
+            max_requests_per_second(float): throttling rate, unlimited when None.
+            seed(int): seed of the injected errors' random generator.
+            host(str): host to bind to.
+            port(int): port to bind to, a free port when 0.
+        """
+        self.latency = latency
+        self.page_size = page_size
+        self.rows_max = rows_max
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.max_requests_per_second = max_requests_per_second
+        self._resources = {}
+        self._metadata_modified = {}
+        self._random = random.Random(seed)
+        self._failing_requests = deque()
+        self._requests_times = deque()
+        self._requests_count = 0
+        self._lock = Lock()
+        self._host = host
+        self._port = port
+        self._http_server = None
+        self._thread = None
+
+    def __repr__(self) -> str:
+        """ Returns Class Representation """
+        return f"{self.__class__.__name__}({self.base_url}, {len(self._resources)} resources)"
+
+    def __enter__(self) -> 'StubCkanServer':
+        """ Starts the Server as a Context Manager """
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """ Closes the Server when leaving the Context Manager """
+        self.close()
+
+    @property
+    def base_url(self) -> str or None:
+        """ str or None: Returns the running server's base url, e.g. http://127.0.0.1:8080 """
+        if self._http_server is None:
+            return None
+        return f"http://{self._host}:{self._http_server.server_port}"
+
+    @property
+    def requests_count(self) -> int:
+        """ int: Returns the amount of requests which were received """
+        return self._requests_count
+
+    def add_resource(self, enum_resource_id: ResourceId, json_data: Dict) -> None:
+        """ Serves the records of given datastore_search json data as the data resource.
+
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+            json_data(Dict): datastore_search json data, e.g. of the data handlers' tests' mocked json files.
+
+        """
+
+        resource_id = api_consts.db[enum_resource_id.name]
+        self._resources[resource_id] = json_data
+        self._metadata_modified[resource_id] = datetime.now().isoformat()
+
+    def add_json_file(self, enum_resource_id: ResourceId, json_file_path: str) -> None:
+        """ Serves the records of given datastore_search json file as the data resource.
+
+        Args:
+            enum_resource_id(ResourceId): data resource's id.
+            json_file_path(str): path of a datastore_search json file.
+
+        """
+
+        with open(json_file_path, encoding="utf-8") as json_file:
+            self.add_resource(enum_resource_id, json.load(json_file))
+
+    def fail_next_requests(self, count: int, status: int = 503) -> None:
+        """ Makes the next requests fail with given status, before the random injected errors.
+
+        Args:
+            count(int): amount of the next requests which fail.
+            status(int): http status code of the failures.
+
+        """
+
+        with self._lock:
+            self._failing_requests.extend([status] * count)
+
+    def start(self) -> 'StubCkanServer':
+        """ Starts serving in a background thread.
+
+        Returns:
+            StubCkanServer: the server itself.
+
+        """
+
+        if self._http_server is None:
+            self._http_server = ThreadingHTTPServer((self._host, self._port), _StubCkanRequestHandler)
+            self._http_server.daemon_threads = True
+            self._http_server.stub = self
+            self._thread = Thread(target=self._http_server.serve_forever, daemon=True)
+            self._thread.start()
+
+        return self
+
+    def close(self) -> None:
+        """ Stops serving & releases the server's port. """
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._thread.join()
+            self._http_server = None
+            self._thread = None
+
+    def _get_injected_failure(self) -> Tuple[int, Dict[str, str]] or None:
+        """ Returns the status code & headers of a throttled or an injected failure of the current request.
+
+        Note:
+            private method which get called by _respond's method.
+
+        Returns:
+            Tuple[int, Dict[str, str]] or None: failure's status code & headers, or None for a served request.
+
+        """
+
+        with self._lock:
+            self._requests_count += 1
+            if self.max_requests_per_second:
+                now = time.monotonic()
+                while self._requests_times and now - self._requests_times[0] >= 1:
+                    self._requests_times.popleft()
+                if len(self._requests_times) >= self.max_requests_per_second:
+                    retry_after = max(1, math.ceil(1 - (now - self._requests_times[0])))
+                    return 429, {"Retry-After": str(retry_after)}
+                self._requests_times.append(now)
+            if self._failing_requests:
+                return self._failing_requests.popleft(), {}
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self.error_status, {}
+
+        return None
+
+    def _respond(self, path: str, request_headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """ Returns the response of a get request by the stub's resources & configuration.
+
+        Note:
+            private method which get called by the http request handler.
+
+        Args:
+            path(str): request's path & query string.
+            request_headers(Dict[str, str]): request's headers.
+
+        Returns:
+            Tuple[int, Dict[str, str], bytes]: response's status code, headers & body.
+
+        """
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        url = urlparse(path)
+        parameters = {key: values[0] for key, values in parse_qs(url.query).items()}
+        failure = self._get_injected_failure()
+        if failure is not None:
+            status, headers = failure
+            return status, headers, self._dump({"success": False, "error": {"message": "stub injected error",
+                                                                            "__type": "Stub Error"}})
+
+        if url.path == "/api/3/action/resource_show":
+            resource_id = parameters.get("id")
+            if resource_id not in self._resources:
+                return self._not_found(resource_id)
+            json_data = {"success": True,
+                         "result": {"id": resource_id, "metadata_modified": self._metadata_modified[resource_id]}}
+        elif url.path == "/api/3/action/datastore_search":
+            resource_id = parameters.get("resource_id")
+            if resource_id not in self._resources:
+                return self._not_found(resource_id)
+            try:
+                json_data = self._search(resource_id, parameters)
+            except ValueError as validation_error:
+                return 409, {"Content-Type": "application/json;charset=utf-8"}, \
+                    self._dump({"success": False, "error": {"message": str(validation_error),
+                                                            "__type": "Validation Error"}})
+        else:
+            return self._not_found(url.path)
+
+        body = self._dump(json_data)
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if request_headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, b""
+
+        return 200, {"Content-Type": "application/json;charset=utf-8", "ETag": etag}, body
+
+    def _search(self, resource_id: str, parameters: Dict[str, str]) -> Dict:
+        """ Returns the datastore_search json data of a resource's page by the request's parameters.
+
+        Note:
+            private method which get called by _respond's method.
+
+        Args:
+            resource_id(str): data resource's id.
+            parameters(Dict[str, str]): request's query parameters.
+
+        Returns:
+            Dict: datastore_search json data.
+
+        Raises:
+            ValueError: the parameters refer to an unknown column or aren't valid.
+
+        """
+
+        resource = self._resources[resource_id]["result"]
+        records = resource["records"]
+        fields = resource.get("fields") or [{"id": column_name} for column_name in dict.fromkeys(
+            column_name for record in records for column_name in record)]
+        columns_names = [field["id"] for field in fields]
+        query = parameters.get("q")
+        if query:
+            records = [record for record in records
+                       if any(query.lower() in str(value).lower() for value in record.values())]
+        if parameters.get("filters"):
+            records = self._filter(records, json.loads(parameters["filters"]), columns_names)
+        if parameters.get("sort"):
+            records = self._sort(records, parameters["sort"], columns_names)
+        if parameters.get("fields"):
+            requested_columns_names = parameters["fields"].split(",")
+            self._validate_columns(requested_columns_names, columns_names)
+            fields = [field for column_name in requested_columns_names for field in fields
+                      if field["id"] == column_name]
+            records = [{column_name: record.get(column_name) for column_name in requested_columns_names}
+                       for record in records]
+        if parameters.get("distinct", "false").lower() in ("true", "1"):
+            distinct_records = {}
+            for record in records:
+                distinct_records.setdefault(json.dumps(record, sort_keys=True), record)
+            records = list(distinct_records.values())
+
+        limit = min(int(parameters.get("limit", self.page_size)), self.rows_max)
+        offset = int(parameters.get("offset", 0))
+        include_total = parameters.get("include_total", "false").lower() in ("true", "1")
+        action_url = f"/api/3/action/datastore_search?resource_id={resource_id}"
+        result = {"include_total": include_total,
+                  "resource_id": resource_id,
+                  "fields": fields,
+                  "records_format": "objects",
+                  "records": records[offset:offset + limit],
+                  "limit": limit,
+                  "_links": {"start": action_url, "next": f"{action_url}&offset={offset + limit}"}}
+        if offset:
+            result["offset"] = offset
+        if include_total:
+            result["total"] = len(records)
+
+        return {"help": f"{self.base_url}/api/3/action/help_show?name=datastore_search",
+                "success": True,
+                "result": result}
+
+    @staticmethod
+    def _validate_columns(required_columns_names: List[str], columns_names: List[str]) -> None:
+        """ Raises CKAN's validation error of the required columns which the resource doesn't have """
+        unknown_columns_names = [column_name for column_name in required_columns_names
+                                 if column_name not in columns_names]
+        if unknown_columns_names:
+            raise ValueError(f"field(s) not found: {', '.join(unknown_columns_names)}")
+
+    def _filter(self, records: List[Dict], filters: Dict[str, Any], columns_names: List[str]) -> List[Dict]:
+        """ Returns the records whose columns equal the filters' value or one of their list of values """
+        if not isinstance(filters, dict):
+            raise ValueError("filters must be a json object")
+        self._validate_columns(list(filters), columns_names)
+        required_values = {column_name: {str(value) for value in (values if isinstance(values, list) else [values])}
+                           for column_name, values in filters.items()}
+        return [record for record in records
+                if all(str(record.get(column_name)) in values for column_name, values in required_values.items())]
+
+    def _sort(self, records: List[Dict], sort: str, columns_names: List[str]) -> List[Dict]:
+        """ Returns the records ordered by CKAN's sort string, e.g. "date desc, town" """
+        sort_keys = [sort_key.split() for sort_key in sort.split(",") if sort_key.strip()]
+        self._validate_columns([sort_key[0] for sort_key in sort_keys], columns_names)
+        records = list(records)
+        # a stable sort per key, from the least significant key to the most significant one
+        for column_name, *direction in reversed(sort_keys):
+            records.sort(key=lambda record: self._get_sort_value(record.get(column_name)),
+                         reverse=bool(direction) and direction[0].lower() == "desc")
+        return records
+
+    @staticmethod
+    def _get_sort_value(value: Any) -> Tuple:
+        """ Returns a comparable sort key of a record's value: numbers, then strings, then nulls """
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return 0, value, ""
+        if value is None:
+            return 2, 0, ""
+        return 1, 0, str(value)
+
+    def _not_found(self, name: str) -> Tuple[int, Dict[str, str], bytes]:
+        """ Returns CKAN's not found response of given resource or path """
+        return 404, {"Content-Type": "application/json;charset=utf-8"}, \
+            self._dump({"success": False, "error": {"message": f"Not found: {name}", "__type": "Not Found Error"}})
+
+    @staticmethod
+    def _dump(json_data: Dict) -> bytes:
+        """ Returns the utf-8 json body of given json data """
+        return json.dumps(json_data, ensure_ascii=False).encode("utf-8")
@@ -1,11 +1,16 @@
 import unittest
-from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+from urllib.parse import urlparse, parse_qs
 import os
 import json
 
 from covid19_il.api_handler.api_factory.api_factory import ApiFactory
 from covid19_il.api_handler.api_factory.api_enum import ApiEnum
+from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.api_handler.exceptions import ApiHttpError
 from covid19_il.data_handler.enums.resource_id import ResourceId
+import covid19_il.api_handler.consts as api_consts
 
 
 class TestApiDataIL(unittest.TestCase):
@@ -15,6 +20,9 @@ class TestApiDataIL(unittest.TestCase):
          def setUp(self): announce of starting the class's tests and initialize api's instances
          def tearDown(self): announce of finishing the class's tests
          def test_create_api_client(self): test api's class instance creation and lru_cache's behaviour as "singleton".
+         def test_session(self): test the persistent session's pooling, keep-alive & gzip negotiation configuration.
+         def test_iter_all_records(self): test paginated fetching of all resource's records, sequentially & concurrently.
+         def test_fetch(self): test concurrent stateless fetches of a shared client return their own responses.
 
      """
 
@@ -34,7 +42,7 @@ class TestApiDataIL(unittest.TestCase):
                            f"resource_id={os.getenv(ResourceId.AREA_RESOURCE_ID.name)}&limit=5"
 
         # mocked get request
-        with patch('covid19_il.api_handler.api.api_data_il.requests.get') as mocked_get:
+        with patch.object(self.api_data_1.session, 'get') as mocked_get:
             # Check a successful http get request
             with open('mocked_api_data.txt') as mocked_result:
                 mocked_get.return_value.content = json.load(mocked_result)
@@ -42,7 +50,7 @@ class TestApiDataIL(unittest.TestCase):
             mocked_get.return_value.status_code = 200
 
             response = self.api_data_1.get_data_by_resource_id(enum_resource_id=ResourceId.AREA_RESOURCE_ID, limit=5)
-            mocked_get.assert_called_with(mocked_url_query)
+            mocked_get.assert_called_with(mocked_url_query, timeout=self.api_data_1.timeout)
             self.assertEqual(response, self.api_data_1.json_data)
             self.assertEqual(mocked_get.return_value.status_code, self.api_data_1.request_status)
 
@@ -52,8 +60,72 @@ class TestApiDataIL(unittest.TestCase):
             mocked_url_query = f"{self.api_data_1.base_url}/api/3/action/datastore_search?" \
                                f"resource_id={os.getenv(ResourceId.DEATHS_DATA_RESOURCE_ID.name)}&limit=5"
 
-            response = self.api_data_1.get_data_by_resource_id(enum_resource_id=ResourceId.DEATHS_DATA_RESOURCE_ID,
-                                                               limit=5)
-            mocked_get.assert_called_with(mocked_url_query)
-            self.assertEqual(response, self.api_data_1.json_data)
+            with self.assertRaises(ApiHttpError):
+                self.api_data_1.get_data_by_resource_id(enum_resource_id=ResourceId.DEATHS_DATA_RESOURCE_ID, limit=5)
+            mocked_get.assert_called_with(mocked_url_query, timeout=self.api_data_1.timeout)
+            self.assertIsNone(self.api_data_1.json_data)
             self.assertEqual(mocked_get.return_value.status_code, self.api_data_1.request_status)
+
+    def test_session(self) -> None:
+        """ Test the persistent session's pooling, keep-alive & gzip negotiation configuration """
+        self.assertEqual(self.api_data_1.session.headers["Connection"], "keep-alive")
+        self.assertIn("gzip", self.api_data_1.session.headers["Accept-Encoding"])
+        self.assertEqual(self.api_data_1.session.get_adapter(self.api_data_1.base_url)._pool_maxsize,
+                         api_consts.DEFAULT_POOL_SIZE)
+        with self.assertRaises(ValueError):
+            ApiDataIL(self.api_data_1.logger, pool_size=0)
+
+    def _mocked_paginated_get(self, url_query: str, timeout: tuple = None, total: int = 25) -> MagicMock:
+        """ Returns a mocked http get response of a single page by url query's limit & offset """
+        parameters = parse_qs(urlparse(url_query).query)
+        limit = int(parameters["limit"][0])
+        offset = int(parameters.get("offset", [0])[0])
+        mocked_response = MagicMock(ok=True, status_code=200)
+        mocked_response.json.return_value = {"result": {"records": [{"_id": _id}
+                                                                    for _id in range(offset + 1,
+                                                                                     min(offset + limit, total) + 1)],
+                                                        "total": total}}
+        return mocked_response
+
+    def test_iter_all_records(self) -> None:
+        """ Test paginated fetching of all resource's records, sequentially & concurrently """
+        with patch.object(self.api_data_1.session, 'get') as mocked_get:
+            mocked_get.side_effect = self._mocked_paginated_get
+            for max_workers in (1, 3):
+                pages = list(self.api_data_1.iter_all_records(ResourceId.LAB_TESTS_RESOURCE_ID,
+                                                              page_size=10,
+                                                              max_workers=max_workers))
+                self.assertListEqual([len(page) for page in pages], [10, 10, 5])
+                self.assertListEqual([record["_id"] for page in pages for record in page], list(range(1, 26)))
+
+            with self.assertRaises(ValueError):
+                next(self.api_data_1.iter_all_records(ResourceId.LAB_TESTS_RESOURCE_ID, page_size=0))
+
+            # Check a failure http get request
+            mocked_get.side_effect = None
+            mocked_get.return_value.ok = False
+            with self.assertRaises(RuntimeError):
+                next(self.api_data_1.iter_all_records(ResourceId.LAB_TESTS_RESOURCE_ID, page_size=10))
+
+    def _mocked_echo_get(self, url_query: str, timeout: tuple = None) -> MagicMock:
+        """ Returns a mocked http get response whose json data holds its own url query """
+        mocked_response = MagicMock(ok=True, status_code=200, content=url_query.encode("utf-8"))
+        mocked_response.json.return_value = {"result": {"url_query": url_query}}
+        return mocked_response
+
+    def test_fetch(self) -> None:
+        """ Test concurrent stateless fetches of a shared client return their own responses """
+        with patch.object(self.api_data_1.session, 'get') as mocked_get:
+            mocked_get.side_effect = self._mocked_echo_get
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                responses = list(executor.map(lambda resource_id: self.api_data_1.fetch(resource_id, limit=5),
+                                              list(ResourceId) * 4))
+
+        for response in responses:
+            self.assertIsInstance(response, ApiDataIL.response)
+            self.assertEqual(response.json_data["result"]["url_query"], response.url_query)
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.size, len(response.url_query))
+            self.assertGreaterEqual(response.elapsed, 0)
+        with self.assertRaises(AttributeError):
+            responses[0].status = 404
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from covid19_il.api_handler.api.api_data_il_async import ApiDataILAsync
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+
+
+class TestApiDataILAsync(unittest.TestCase):
+    """ Tests for the Asyncio API Client.
+
+    Methods:
+        setUp(self): announce of starting the class's tests and initialize api's instance.
+        tearDown(self): announce of finishing the class's tests and close api's instance.
+        test_fetch(self): test fetching a single data resource.
+        test_fetch_many(self): test fetching several data resources concurrently within the concurrency bound.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests and initialize api's instance """
+        print("testing ApiDataILAsync Class...")
+        self.api_data_1 = ApiDataILAsync(Logger().logger, max_concurrency=3)
+        self.in_flight_requests = 0
+        self.max_in_flight_requests = 0
+        self.lock = threading.Lock()
+
+    def tearDown(self) -> None:
+        """ Announce of finishing the class's tests and close api's instance """
+        print("finished testing ApiDataILAsync Class...")
+        self.api_data_1.close()
+
+    def _mocked_get_page(self, url_query: str) -> dict:
+        """ Mocked blocking page request which tracks the amount of concurrent requests """
+        with self.lock:
+            self.in_flight_requests += 1
+            self.max_in_flight_requests = max(self.max_in_flight_requests, self.in_flight_requests)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight_requests -= 1
+        if "fail" in url_query:
+            raise RuntimeError(f"page request {url_query} failed")
+        return {"result": {"records": [], "url_query": url_query}}
+
+    def test_fetch(self) -> None:
+        """ Test fetching a single data resource """
+        with patch.object(self.api_data_1._api_client, '_get_page', side_effect=self._mocked_get_page):
+            data = asyncio.run(self.api_data_1.fetch(ResourceId.AREA_RESOURCE_ID, limit=5))
+            self.assertEqual(data["result"]["url_query"], self.api_data_1.url_query)
+            self.assertTrue(self.api_data_1.url_query.endswith("&limit=5"))
+
+    def test_fetch_many(self) -> None:
+        """ Test fetching several data resources concurrently within the concurrency bound """
+        with patch.object(self.api_data_1._api_client, '_get_page', side_effect=self._mocked_get_page):
+            data = asyncio.run(self.api_data_1.fetch_many(ResourceId))
+            self.assertListEqual(list(data.keys()), list(ResourceId))
+            self.assertEqual(self.max_in_flight_requests, self.api_data_1.max_concurrency)
+
+            # Check a failure http get request
+            with patch.object(self.api_data_1._api_client, '_format_url_query', return_value="fail"):
+                with self.assertRaises(RuntimeError):
+                    asyncio.run(self.api_data_1.fetch_many([ResourceId.AREA_RESOURCE_ID]))
+                data = asyncio.run(self.api_data_1.fetch_many([ResourceId.AREA_RESOURCE_ID], return_exceptions=True))
+                self.assertIsInstance(data[ResourceId.AREA_RESOURCE_ID], RuntimeError)
@@ -2,6 +2,7 @@ import unittest
 
 from covid19_il.api_handler.api_factory.api_factory import ApiFactory
 from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.api_handler.api.api_data_il_async import ApiDataILAsync
 from covid19_il.api_handler.api_factory.api_enum import ApiEnum
 
 
@@ -41,3 +42,5 @@ class TestApiFactory(unittest.TestCase):
         # Checks that exception gets raise when gets different type from ApiEnum
         with self.assertRaises(TypeError):
             self.api_data_1 = ApiFactory.create_api_client(1)
+        # Checks the creation of the asyncio api client
+        self.assertIsInstance(ApiFactory.create_api_client(ApiEnum.api_data_il_async), ApiDataILAsync)
@@ -0,0 +1,94 @@
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from covid19_il.api_handler.delta_sync import DeltaSync
+from covid19_il.data_handler.data_handlers.quarantine import Quarantine
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+
+
+class TestDeltaSync(unittest.TestCase):
+    """ Tests for the Incremental Delta Sync.
+
+    Methods:
+        setUp(self): announce of starting the class's tests and initialize delta sync's instance with a mocked api.
+        tearDown(self): announce of finishing the class's tests and remove the datasets' directory.
+        test_sync(self): test full & incremental syncs of the local dataset and the live data handler.
+        test_sync_of_overlapping_tail(self): test the offset advances by the read records which aren't new.
+        test_sync_of_republished_resource(self): test full resync of the local dataset and the live data handler when
+            the data resource has fewer records.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests and initialize delta sync's instance with a mocked api """
+        print("testing DeltaSync Class...")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.remote_records = [self._record(_id) for _id in range(1, 6)]
+        self.api_client = MagicMock()
+        self.api_client.get_total_records.side_effect = lambda enum_resource_id: len(self.remote_records)
+        self.api_client.iter_all_records.side_effect = \
+            lambda enum_resource_id, page_size, offset, sort: iter([self.remote_records[offset:]])
+        self.delta_sync = DeltaSync(Logger().logger, self.api_client, data_dir=self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        """ Announce of finishing the class's tests and remove the datasets' directory """
+        print("finished testing DeltaSync Class...")
+        self.temp_dir.cleanup()
+
+    def _record(self, _id: int) -> dict:
+        """ Returns a quarantine's record with given _id """
+        return {"_id": _id, "date": f"2020-10-{_id:02}", "isolated_today_contact_with_confirmed": str(_id),
+                "isolated_today_abroad": "1", "new_contact_with_confirmed": "2", "new_from_abroad": "3"}
+
+    def test_sync(self) -> None:
+        """ Test full & incremental syncs of the local dataset and the live data handler """
+        self.assertEqual(len(self.delta_sync.sync(ResourceId.QUARANTINE_RESOURCE_ID)), 5)
+        self.assertDictEqual(self.delta_sync.get_state(ResourceId.QUARANTINE_RESOURCE_ID),
+                             {"max_id": 5, "row_count": 5})
+        data_handler = Quarantine(Logger().logger, self.delta_sync.load_dataset(ResourceId.QUARANTINE_RESOURCE_ID))
+        self.assertEqual(data_handler.max_id, 5)
+
+        # nothing new - no records get fetched
+        self.assertListEqual(self.delta_sync.sync(ResourceId.QUARANTINE_RESOURCE_ID, data_handler), [])
+        self.api_client.iter_all_records.assert_called_once()
+
+        # only the new tail gets fetched & appended
+        self.remote_records.extend(self._record(_id) for _id in range(6, 9))
+        new_records = self.delta_sync.sync(ResourceId.QUARANTINE_RESOURCE_ID, data_handler)
+        self.assertListEqual([record["_id"] for record in new_records], [6, 7, 8])
+        self.assertEqual(self.api_client.iter_all_records.call_args.kwargs["offset"], 5)
+        self.assertEqual(self.api_client.iter_all_records.call_args.kwargs["sort"], "_id")
+        self.assertEqual(len(data_handler.df), 8)
+        self.assertEqual(data_handler.max_id, 8)
+        self.assertEqual(len(self.delta_sync.load_dataset(ResourceId.QUARANTINE_RESOURCE_ID)["result"]["records"]), 8)
+
+    def test_sync_of_overlapping_tail(self) -> None:
+        """ Test the offset advances by the read records which aren't new """
+        self.delta_sync.sync(ResourceId.QUARANTINE_RESOURCE_ID)
+        self.remote_records.extend([self._record(3), self._record(6)])
+        self.assertListEqual([record["_id"] for record in self.delta_sync.sync(ResourceId.QUARANTINE_RESOURCE_ID)],
+                             [6])
+        self.assertDictEqual(self.delta_sync.get_state(ResourceId.QUARANTINE_RESOURCE_ID),
+                             {"max_id": 6, "row_count": 7})
+
+        # the old record got read once, so the next sync doesn't fetch it again
+        self.assertListEqual(self.delta_sync.sync(ResourceId.QUARANTINE_RESOURCE_ID), [])
+        self.assertEqual(self.api_client.iter_all_records.call_count, 2)
+        self.assertEqual(len(self.delta_sync.load_dataset(ResourceId.QUARANTINE_RESOURCE_ID)["result"]["records"]), 6)
+
+    def test_sync_of_republished_resource(self) -> None:
+        """ Test full resync of the local dataset and the live data handler when the data resource has fewer
+            records """
+        self.delta_sync.sync(ResourceId.QUARANTINE_RESOURCE_ID)
+        data_handler = Quarantine(Logger().logger, self.delta_sync.load_dataset(ResourceId.QUARANTINE_RESOURCE_ID))
+        self.remote_records = [{**self._record(_id), "isolated_today_contact_with_confirmed": str(_id * 10)}
+                               for _id in range(1, 4)]
+        self.assertEqual(len(self.delta_sync.sync(ResourceId.QUARANTINE_RESOURCE_ID, data_handler)), 3)
+        self.assertDictEqual(self.delta_sync.get_state(ResourceId.QUARANTINE_RESOURCE_ID),
+                             {"max_id": 3, "row_count": 3})
+        self.assertEqual(len(data_handler.df), 3)
+        self.assertEqual(data_handler.max_id, 3)
+        self.assertEqual(data_handler.total_number, 3)
+        self.assertListEqual(data_handler.df["isolated_today_contact_with_confirmed"].tolist(), ["10", "20", "30"])
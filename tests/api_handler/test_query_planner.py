@@ -0,0 +1,117 @@
+import unittest
+import os
+import json
+from unittest import mock
+
+from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.api_handler.query_planner import QueryPlanner
+from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+from covid19_il.testing.stub_ckan_server import StubCkanServer
+import covid19_il.api_handler.consts as api_consts
+
+JSON_FILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "data_handler", "json_files")
+
+
+class TestQueryPlanner(unittest.TestCase):
+    """ Tests for the Query Planner.
+
+    Methods:
+        setUp(self): Announce of starting the class's tests, start the stub server with the filtered handlers'
+            mocked records & hide the factory's instances.
+        tearDown(self): Close the stub server & restore the factory's instances.
+        test_pushdown(self): Tests every filtered method fetches only its date's rows & returns the local result.
+        test_plans(self): Tests the local, full & pushdown plans & the factory's instance of a full plan.
+
+    """
+
+    json_files_names = {ResourceId.LAB_TESTS_RESOURCE_ID: "lab_tests",
+                        ResourceId.TESTED_INDIVIDUALS_RESOURCE_ID: "tested_individuals",
+                        ResourceId.TESTED_INDIVIDUALS_SCORES_RESOURCE_ID: "tested_individuals_scores",
+                        ResourceId.HOSPITALIZED_DATA_RESOURCE_ID: "hospitalized",
+                        ResourceId.AGE_GENDER_DATA_RESOURCE_ID: "age_gender",
+                        ResourceId.MEDICAL_STAFF_MORBIDITY_RESOURCE_ID: "medical_staff_morbidity",
+                        ResourceId.CITIES_POPULATION_RESOURCE_ID: "cities"}
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests, start the stub server with the filtered handlers' mocked records &
+            hide the factory's instances """
+        print("testing QueryPlanner Class...")
+        self.stub_ckan_server = StubCkanServer(page_size=1000)
+        self.json_data = {}
+        for resource_id, json_file_name in self.json_files_names.items():
+            with open(os.path.join(JSON_FILES_DIR, f"{json_file_name}_mocked_data.json"), encoding="utf-8") as \
+                    json_file:
+                self.json_data[resource_id] = json.load(json_file)
+            self.stub_ckan_server.add_resource(resource_id, self.json_data[resource_id])
+        self.stub_ckan_server.start()
+        self.data_resources_patcher = mock.patch.dict(DataHandlerFactory.data_resources, clear=True)
+        self.data_resources_patcher.start()
+
+    def tearDown(self) -> None:
+        """ Close the stub server & restore the factory's instances """
+        self.data_resources_patcher.stop()
+        self.stub_ckan_server.close()
+
+    def test_pushdown(self) -> None:
+        """ Tests every filtered method fetches only its date's rows & returns the local result """
+        with ApiDataIL(Logger().logger, base_url=self.stub_ckan_server.base_url) as api_data_il:
+            query_planner = QueryPlanner(Logger().logger, api_data_il)
+            for resource_id, json_data in self.json_data.items():
+                data_handler_class = DataHandlerFactory.data_handlers_classes[resource_id.value]
+                records = json_data["result"]["records"]
+                date = records[len(records) // 2][data_handler_class.date_column_name][:10]
+                for method_name in data_handler_class.filters_manifest:
+                    with self.subTest(method_name=f"{data_handler_class.__name__}.{method_name}"):
+                        query_plan = query_planner.plan(resource_id, method_name, date)
+                        self.assertEqual(query_plan.source, api_consts.QUERY_PLAN_PUSHDOWN)
+                        self.assertEqual(query_plan.fields, data_handler_class.get_required_fields(method_name))
+                        date_column_name, value = next(iter(query_plan.filters.items()))
+                        self.assertTrue(value.startswith(date))
+
+                        fetched_records = query_planner._fetch_json_data(query_plan)["result"]["records"]
+                        self.assertEqual(len(fetched_records),
+                                         sum(record[date_column_name] == value for record in records))
+                        self.assertEqual(
+                            repr(list(query_planner.execute(resource_id, method_name, date))),
+                            repr(list(getattr(data_handler_class(Logger().logger, json_data), method_name)(date))))
+                        self.assertNotIn(resource_id.value, DataHandlerFactory.data_resources)
+
+            query_plan = query_planner.plan(ResourceId.CITIES_POPULATION_RESOURCE_ID, "cities_by_date", "2020-03-11")
+            self.assertDictEqual(query_plan.filters, {"Date": "2020-03-11"})
+            self.assertLess(len(query_planner._fetch_json_data(query_plan)["result"]["records"]), 10)
+
+    def test_plans(self) -> None:
+        """ Tests the local, full & pushdown plans & the factory's instance of a full plan """
+        resource_id = ResourceId.CITIES_POPULATION_RESOURCE_ID
+        with ApiDataIL(Logger().logger, base_url=self.stub_ckan_server.base_url) as api_data_il:
+            query_planner = QueryPlanner(Logger().logger, api_data_il)
+            self.assertEqual(query_planner.plan(resource_id, "cases_statistics").source, api_consts.QUERY_PLAN_FULL)
+            result = list(query_planner.execute(resource_id, "cases_statistics"))
+            self.assertIsNotNone(DataHandlerFactory.data_resources[resource_id.value])
+
+            requests_count = self.stub_ckan_server.requests_count
+            self.assertEqual(query_planner.plan(resource_id, "cities_by_date", "2020-03-11").source,
+                             api_consts.QUERY_PLAN_LOCAL)
+            self.assertEqual(query_planner.plan(resource_id, "cases_statistics", filters={}).source,
+                             api_consts.QUERY_PLAN_LOCAL)
+            self.assertEqual(repr(list(query_planner.execute(resource_id, "cases_statistics"))), repr(result))
+            self.assertEqual(repr(list(query_planner.execute(resource_id, "cases_statistics", filters={}))),
+                             repr(result))
+            self.assertTrue(list(query_planner.execute(resource_id, "cities_by_date", date="2020-03-11")))
+            self.assertEqual(self.stub_ckan_server.requests_count, requests_count)
+
+            query_plan = query_planner.plan(resource_id, "cities_by_date", "2020-03-11",
+                                            filters={"City_Name": "אבו גוש"})
+            self.assertEqual(query_plan.source, api_consts.QUERY_PLAN_PUSHDOWN)
+            self.assertDictEqual(query_plan.filters, {"Date": "2020-03-11", "City_Name": "אבו גוש"})
+
+            with self.assertRaises(ValueError):
+                query_planner.plan(resource_id, "_get_df_data")
+            with self.assertRaises(TypeError):
+                query_planner.plan(resource_id, "cities_by_date", "2020-03-11", no_such_parameter=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.api_handler.records_stream import RecordsStreamParser, records_to_data_frame
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+
+
+class TestRecordsStream(unittest.TestCase):
+    """ Tests for the Streaming Records Parser.
+
+    Methods:
+        setUp(self): announce of starting the class's tests and initialize a mocked datastore_search body.
+        tearDown(self): announce of finishing the class's tests.
+        test_parse_chunks(self): test parsing a body split into chunks of any size, even inside a character.
+        test_records_to_data_frame(self): test the column buffers' data frame equals the json normalized one.
+        test_stream_data_frame(self): test api client's streaming ingest of a resource.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests and initialize a mocked datastore_search body """
+        print("testing RecordsStreamParser Class...")
+        self.records = [{"_id": _id, "town": "אבו גוש", "date": f"2020-10-{_id:02}", "new_cases": "<15"}
+                        for _id in range(1, 8)]
+        self.json_data = {"help": "https://data.gov.il/api/3/action/help_show?name=datastore_search",
+                          "success": True,
+                          "result": {"fields": [{"id": "_id", "type": "int"}],
+                                     "records": self.records,
+                                     "total": len(self.records)}}
+        self.body = json.dumps(self.json_data, ensure_ascii=False).encode("utf-8")
+
+    def tearDown(self) -> None:
+        """ Announce of finishing the class's tests """
+        print("finished testing RecordsStreamParser Class...")
+
+    def test_parse_chunks(self) -> None:
+        """ Test parsing a body split into chunks of any size, even inside a character """
+        for chunk_size in (1, 5, len(self.body)):
+            parser = RecordsStreamParser()
+            chunks = (self.body[index:index + chunk_size] for index in range(0, len(self.body), chunk_size))
+            self.assertListEqual(list(parser.parse_chunks(chunks)), self.records)
+            self.assertEqual(parser.metadata["result"]["total"], len(self.records))
+            self.assertListEqual(parser.metadata["result"]["records"], [])
+
+        with self.assertRaises(ValueError):
+            list(RecordsStreamParser().parse_chunks([self.body[:-40]]))
+
+    def test_records_to_data_frame(self) -> None:
+        """ Test the column buffers' data frame equals the json normalized one """
+        for rows_per_chunk in (1, 3, 100):
+            assert_frame_equal(records_to_data_frame(iter(self.records), rows_per_chunk),
+                               pd.json_normalize(self.records))
+        df = records_to_data_frame([{"a": 1}, {"a": 2, "b": "x"}], rows_per_chunk=10)
+        self.assertListEqual(df["b"].isna().tolist(), [True, False])
+
+    def test_stream_data_frame(self) -> None:
+        """ Test api client's streaming ingest of a resource """
+        with ApiDataIL(Logger().logger) as api_data_1:
+            with patch.object(api_data_1.session, 'get') as mocked_get:
+                mocked_get.return_value = MagicMock(ok=True, status_code=200)
+                mocked_get.return_value.iter_content.side_effect = \
+                    lambda chunk_size: (self.body[index:index + chunk_size]
+                                        for index in range(0, len(self.body), chunk_size))
+                df, metadata = api_data_1.stream_data_frame(ResourceId.AREA_RESOURCE_ID, chunk_size=16)
+                self.assertTrue(mocked_get.call_args.kwargs["stream"])
+                assert_frame_equal(df, pd.json_normalize(self.records))
+                self.assertEqual(metadata["result"]["total"], len(self.records))
+                mocked_get.return_value.close.assert_called_once()
+
+                mocked_get.return_value.ok = False
+                with self.assertRaises(RuntimeError):
+                    api_data_1.stream_data_frame(ResourceId.AREA_RESOURCE_ID)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.api_handler.response_cache import ResponseCache
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+
+
+class TestResponseCache(unittest.TestCase):
+    """ Tests for the On-Disk Response Cache.
+
+    Methods:
+        setUp(self): announce of starting the class's tests and initialize cache's & api's instances.
+        tearDown(self): announce of finishing the class's tests and remove the cache's directory.
+        test_put_and_load(self): test storing & loading an entry and its freshness by the ttl.
+        test_eviction(self): test least recently used eviction by the cache's size bound & its running total size.
+        test_api_client_cache(self): test api client's fresh hits & conditional revalidation.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests and initialize cache's & api's instances """
+        print("testing ResponseCache Class...")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(Logger().logger, cache_dir=self.temp_dir.name, ttl=60)
+        self.api_data_1 = ApiDataIL(Logger().logger, cache=self.cache)
+
+    def tearDown(self) -> None:
+        """ Announce of finishing the class's tests and remove the cache's directory """
+        print("finished testing ResponseCache Class...")
+        self.api_data_1.close()
+        self.temp_dir.cleanup()
+
+    def test_put_and_load(self) -> None:
+        """ Test storing & loading an entry and its freshness by the ttl """
+        self.assertIsNone(self.cache.get_entry("url"))
+        self.cache.put("url", {"result": {"records": [{"_id": 1}]}}, etag='"v1"')
+        entry = self.cache.get_entry("url")
+        self.assertEqual(entry.etag, '"v1"')
+        self.assertTrue(self.cache.is_fresh(entry))
+        self.assertFalse(self.cache.is_fresh(entry._replace(stored_at=time.time() - 61)))
+        self.assertDictEqual(self.cache.load("url"), {"result": {"records": [{"_id": 1}]}})
+        self.cache.clear()
+        self.assertIsNone(self.cache.get_entry("url"))
+
+    def test_eviction(self) -> None:
+        """ Test least recently used eviction by the cache's size bound & its running total size """
+        cache = self.cache
+        for index in range(3):
+            cache.put(f"url_{index}", {"records": "x" * 100})
+            os.utime(cache._get_paths(f"url_{index}")[0], (index, index))
+        cache.load("url_0")
+        cache._max_size = 250
+        cache.put("url_3", {"records": "x" * 100})
+        self.assertIsNotNone(cache.get_entry("url_0"))
+        self.assertIsNone(cache.get_entry("url_1"))
+        self.assertIsNone(cache.get_entry("url_2"))
+        self.assertIsNotNone(cache.get_entry("url_3"))
+
+        # a put within the bound doesn't scan the cache's directory, & a scan skips a body which got removed meanwhile
+        cache._max_size = 1000
+        listdir = os.listdir
+        with patch("covid19_il.api_handler.response_cache.os.listdir",
+                   side_effect=lambda path: ["removed.json", *listdir(path)]) as mocked_listdir:
+            cache.put("url_4", {"records": "x" * 100})
+            mocked_listdir.assert_not_called()
+            cache._max_size = 250
+            cache.put("url_5", {"records": "x" * 100})
+        self.assertIsNone(cache.get_entry("url_0"))
+        self.assertIsNotNone(cache.get_entry("url_5"))
+
+    def test_api_client_cache(self) -> None:
+        """ Test api client's fresh hits & conditional revalidation """
+        json_data = {"result": {"records": [{"_id": 1}]}}
+        with patch.object(self.api_data_1.session, 'get') as mocked_get:
+            mocked_get.return_value = MagicMock(ok=True, status_code=200, headers={"ETag": '"v1"'})
+            mocked_get.return_value.json.return_value = json_data
+            self.assertDictEqual(self.api_data_1.get_data_by_resource_id(ResourceId.AREA_RESOURCE_ID, limit=5),
+                                 json_data)
+            # Check a fresh hit without any http get request
+            self.assertDictEqual(self.api_data_1.get_data_by_resource_id(ResourceId.AREA_RESOURCE_ID, limit=5),
+                                 json_data)
+            self.assertEqual(mocked_get.call_count, 1)
+
+            # Check a conditional revalidation of a stale entry
+            self.cache._ttl = 0
+            mocked_get.return_value = MagicMock(ok=True, status_code=304, headers={})
+            self.assertDictEqual(self.api_data_1.get_data_by_resource_id(ResourceId.AREA_RESOURCE_ID, limit=5),
+                                 json_data)
+            self.assertEqual(self.api_data_1.request_status, 304)
+            self.assertEqual(mocked_get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
@@ -0,0 +1,160 @@
+import unittest
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+
+from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.api_handler.circuit_breaker import CircuitBreaker
+from covid19_il.api_handler.exceptions import (ApiRequestError, ApiHttpError, ApiThrottledError, ApiConnectionError,
+                                               CircuitOpenError)
+from covid19_il.api_handler.retry_policy import RetryPolicy
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+from covid19_il.testing.stub_ckan_server import StubCkanServer
+
+
+class TestRetry(unittest.TestCase):
+    """ Tests for the API Client's Retries & Circuit Breaker.
+
+    Methods:
+        setUp(self): Announce of starting the class's tests, start a stub server & a client without backoff delays.
+        tearDown(self): Close the client & the stub server.
+        test_retry_policy(self): Tests the backoff's jitter bounds & Retry-After header's parsing.
+        test_circuit_breaker(self): Tests the closed, open & half open states' transitions.
+        test_retries(self): Tests transient failures & throttling get retried until the request succeeds.
+        test_typed_errors(self): Tests exhausted retries raise typed errors & don't leave stale json data.
+        test_circuit_open(self): Tests requests to a failing host get rejected without being sent.
+        test_concurrent_requests(self): Tests requests don't wait for an in flight legacy request's lock.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests, start a stub server & a client without backoff delays """
+        print("testing Retries & Circuit Breaker...")
+        self.records = [{"_id": _id, "value": _id * 10} for _id in range(1, 31)]
+        self.stub_ckan_server = StubCkanServer(page_size=10)
+        self.stub_ckan_server.add_resource(ResourceId.LAB_TESTS_RESOURCE_ID, {"result": {"records": self.records}})
+        self.stub_ckan_server.start()
+        self.api_data_il = ApiDataIL(Logger().logger,
+                                     base_url=self.stub_ckan_server.base_url,
+                                     retry_policy=RetryPolicy(max_retries=2, backoff_factor=0, max_backoff=2),
+                                     circuit_failure_threshold=3,
+                                     circuit_reset_timeout=0.2)
+
+    def tearDown(self) -> None:
+        """ Close the client & the stub server """
+        self.api_data_il.close()
+        self.stub_ckan_server.close()
+
+    def test_retry_policy(self) -> None:
+        """ Tests the backoff's jitter bounds & Retry-After header's parsing """
+        retry_policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, seed=0)
+        for retry in range(6):
+            self.assertTrue(0 <= retry_policy.get_delay(retry) <= min(3, 0.5 * 2 ** retry))
+        self.assertEqual(retry_policy.get_delay(0, retry_after=7), 7)
+        self.assertTrue(retry_policy.is_retryable_status(503))
+        self.assertFalse(retry_policy.is_retryable_status(404))
+
+        self.assertEqual(RetryPolicy.parse_retry_after("2"), 2)
+        self.assertAlmostEqual(RetryPolicy.parse_retry_after(formatdate(time.time() + 60, usegmt=True)), 60, delta=2)
+        self.assertIsNone(RetryPolicy.parse_retry_after("soon"))
+        self.assertIsNone(RetryPolicy.parse_retry_after(None))
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_retries=-1)
+
+    def test_circuit_breaker(self) -> None:
+        """ Tests the closed, open & half open states' transitions """
+        circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.1)
+        circuit_breaker.record_failure()
+        self.assertEqual(circuit_breaker.allow_request(), 0)
+        circuit_breaker.record_failure()
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.OPEN)
+        self.assertGreater(circuit_breaker.allow_request(), 0)
+
+        time.sleep(0.1)
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertEqual(circuit_breaker.allow_request(), 0)
+        self.assertGreater(circuit_breaker.allow_request(), 0)
+        circuit_breaker.record_failure()
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.OPEN)
+
+        time.sleep(0.1)
+        self.assertEqual(circuit_breaker.allow_request(), 0)
+        circuit_breaker.record_success()
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.CLOSED)
+
+    def test_retries(self) -> None:
+        """ Tests transient failures & throttling get retried until the request succeeds """
+        self.stub_ckan_server.fail_next_requests(2, status=503)
+        response = self.api_data_il.fetch(ResourceId.LAB_TESTS_RESOURCE_ID)
+        self.assertEqual(response.status, 200)
+        self.assertListEqual(response.json_data["result"]["records"], self.records[:10])
+        self.assertEqual(self.stub_ckan_server.requests_count, 3)
+
+        self.stub_ckan_server.fail_next_requests(1, status=502)
+        records = [record for page in self.api_data_il.iter_all_records(ResourceId.LAB_TESTS_RESOURCE_ID, 10,
+                                                                         max_workers=2)
+                   for record in page]
+        self.assertListEqual(records, self.records)
+
+        # the stub throttles the second request within a second & asks to retry after a second
+        self.stub_ckan_server.max_requests_per_second = 1
+        start = time.monotonic()
+        self.assertEqual(self.api_data_il.get_total_records(ResourceId.LAB_TESTS_RESOURCE_ID), len(self.records))
+        self.assertEqual(self.api_data_il.get_total_records(ResourceId.LAB_TESTS_RESOURCE_ID), len(self.records))
+        self.assertGreaterEqual(time.monotonic() - start, 0.5)
+
+    def test_typed_errors(self) -> None:
+        """ Tests exhausted retries raise typed errors & don't leave stale json data """
+        self.assertIsNotNone(self.api_data_il.get_data_by_resource_id(ResourceId.LAB_TESTS_RESOURCE_ID))
+        self.stub_ckan_server.fail_next_requests(3, status=500)
+        with self.assertRaises(ApiHttpError) as error_context:
+            self.api_data_il.get_data_by_resource_id(ResourceId.LAB_TESTS_RESOURCE_ID)
+        self.assertEqual(error_context.exception.status_code, 500)
+        self.assertIsNone(self.api_data_il.json_data)
+        self.assertEqual(self.api_data_il.request_status, 500)
+
+        # the exhausted retries opened the circuit breaker, its trial request after the reset timeout closes it
+        time.sleep(0.2)
+        with self.assertRaises(ApiHttpError) as error_context:
+            next(self.api_data_il.iter_all_records(ResourceId.AREA_RESOURCE_ID))
+        self.assertEqual(error_context.exception.status_code, 404)
+
+        self.stub_ckan_server.fail_next_requests(3, status=429)
+        with self.assertRaises(ApiThrottledError):
+            self.api_data_il.stream_data_frame(ResourceId.LAB_TESTS_RESOURCE_ID)
+        time.sleep(0.2)
+        self.assertEqual(self.api_data_il.fetch(ResourceId.LAB_TESTS_RESOURCE_ID).status, 200)
+
+        with ApiDataIL(Logger().logger, base_url="http://127.0.0.1:1",
+                       retry_policy=RetryPolicy(max_retries=1, backoff_factor=0)) as api_data_il:
+            with self.assertRaises(ApiConnectionError):
+                api_data_il.get_total_records(ResourceId.LAB_TESTS_RESOURCE_ID)
+            response = api_data_il.fetch(ResourceId.LAB_TESTS_RESOURCE_ID)
+            self.assertIsNone(response.json_data)
+            self.assertIsNone(response.status)
+
+    def test_circuit_open(self) -> None:
+        """ Tests requests to a failing host get rejected without being sent """
+        self.stub_ckan_server.fail_next_requests(3, status=503)
+        with self.assertRaises(ApiHttpError):
+            self.api_data_il.get_total_records(ResourceId.LAB_TESTS_RESOURCE_ID)
+
+        with self.assertRaises(CircuitOpenError) as error_context:
+            self.api_data_il.get_total_records(ResourceId.LAB_TESTS_RESOURCE_ID)
+        self.assertIsInstance(error_context.exception, ApiRequestError)
+        self.assertEqual(self.stub_ckan_server.requests_count, 3)
+
+        time.sleep(0.2)
+        self.assertEqual(self.api_data_il.get_total_records(ResourceId.LAB_TESTS_RESOURCE_ID), len(self.records))
+        self.assertEqual(self.stub_ckan_server.requests_count, 4)
+
+    def test_concurrent_requests(self) -> None:
+        """ Tests requests don't wait for an in flight legacy request's lock """
+        with ThreadPoolExecutor(max_workers=1) as executor, self.api_data_il._lock:
+            response = executor.submit(self.api_data_il.fetch, ResourceId.LAB_TESTS_RESOURCE_ID).result(timeout=5)
+        self.assertEqual(response.status, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+import os
+import json
+
+import requests
+
+from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.api_handler.exceptions import ApiHttpError
+from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+from covid19_il.testing.stub_ckan_server import StubCkanServer
+import covid19_il.api_handler.consts as api_consts
+
+JSON_FILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "data_handler", "json_files")
+JSON_FILE_PATH = os.path.join(JSON_FILES_DIR, "lab_tests_mocked_data.json")
+
+
+class TestStubCkanServer(unittest.TestCase):
+    """ Tests for the Stub CKAN Server.
+
+    Methods:
+        setUp(self): Announce of starting the class's tests, start the stub server with lab tests' mocked records.
+        tearDown(self): Close the stub server.
+        test_api_client(self): Tests ApiDataIL's requests of the stub server by its base url.
+        test_error_injection(self): Tests deterministic & random injected errors.
+        test_throttling(self): Tests requests which exceed the rate get 429 with a Retry-After header.
+        test_query_parameters(self): Tests the fields, filters, sort & distinct parameters & the fields manifest's
+            compact payload.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests, start the stub server with lab tests' mocked records """
+        print("testing StubCkanServer Class...")
+        self.stub_ckan_server = StubCkanServer(page_size=10, seed=0)
+        self.stub_ckan_server.add_json_file(ResourceId.LAB_TESTS_RESOURCE_ID, JSON_FILE_PATH)
+        self.stub_ckan_server.start()
+        with open(JSON_FILE_PATH, encoding="utf-8") as json_file:
+            self.records = json.load(json_file)["result"]["records"]
+
+    def tearDown(self) -> None:
+        """ Close the stub server """
+        self.stub_ckan_server.close()
+
+    def test_api_client(self) -> None:
+        """ Tests ApiDataIL's requests of the stub server by its base url """
+        with ApiDataIL(Logger().logger, base_url=self.stub_ckan_server.base_url + "/") as api_data_il:
+            self.assertTrue(api_data_il)
+            self.assertEqual(api_data_il.base_url, self.stub_ckan_server.base_url)
+
+            response = api_data_il.fetch(ResourceId.LAB_TESTS_RESOURCE_ID)
+            self.assertEqual(response.status, 200)
+            self.assertListEqual(response.json_data["result"]["records"], self.records[:10])
+            self.assertEqual(api_data_il.get_total_records(ResourceId.LAB_TESTS_RESOURCE_ID), len(self.records))
+
+            records = [record for page in api_data_il.iter_all_records(ResourceId.LAB_TESTS_RESOURCE_ID, 100,
+                                                                        max_workers=3)
+                       for record in page]
+            self.assertListEqual(records, self.records)
+
+            response = api_data_il.fetch(ResourceId.AREA_RESOURCE_ID)
+            self.assertEqual(response.status, 404)
+            self.assertIsNone(response.json_data)
+
+    def test_error_injection(self) -> None:
+        """ Tests deterministic & random injected errors """
+        url = f"{self.stub_ckan_server.base_url}/api/3/action/datastore_search?" \
+              f"resource_id={api_consts.db[ResourceId.LAB_TESTS_RESOURCE_ID.name]}"
+        self.stub_ckan_server.fail_next_requests(2, status=502)
+        self.assertListEqual([requests.get(url).status_code for _ in range(3)], [502, 502, 200])
+
+        self.stub_ckan_server.error_rate = 1
+        self.assertEqual(requests.get(url).status_code, 500)
+        self.stub_ckan_server.error_rate = 0.5
+        statuses = [requests.get(url).status_code for _ in range(20)]
+        self.assertTrue(0 < statuses.count(500) < 20)
+        self.assertEqual(self.stub_ckan_server.requests_count, 24)
+
+        self.stub_ckan_server.error_rate = 0
+        response = requests.get(url)
+        self.assertEqual(requests.get(url, headers={"If-None-Match": response.headers["ETag"]}).status_code, 304)
+
+    def test_throttling(self) -> None:
+        """ Tests requests which exceed the rate get 429 with a Retry-After header """
+        self.stub_ckan_server.max_requests_per_second = 3
+        url = f"{self.stub_ckan_server.base_url}/api/3/action/resource_show?" \
+              f"id={api_consts.db[ResourceId.LAB_TESTS_RESOURCE_ID.name]}"
+        responses = [requests.get(url) for _ in range(5)]
+        self.assertListEqual([response.status_code for response in responses], [200, 200, 200, 429, 429])
+        self.assertIn("metadata_modified", responses[0].json()["result"])
+        self.assertEqual(responses[-1].headers["Retry-After"], "1")
+
+    def test_query_parameters(self) -> None:
+        """ Tests the fields, filters, sort & distinct parameters & the fields manifest's compact payload """
+        self.stub_ckan_server.page_size = 1000
+        self.stub_ckan_server.add_json_file(ResourceId.AREA_RESOURCE_ID,
+                                            os.path.join(JSON_FILES_DIR, "area_mocked_data.json"))
+        with ApiDataIL(Logger().logger, base_url=self.stub_ckan_server.base_url) as api_data_il:
+            full_response = api_data_il.fetch(ResourceId.AREA_RESOURCE_ID)
+            fields = DataHandlerFactory.get_required_fields(ResourceId.AREA_RESOURCE_ID, "get_hospitalized_amount")
+            response = api_data_il.fetch(ResourceId.AREA_RESOURCE_ID, fields=fields)
+            self.assertIn("&fields=_id,town,accumulated_hospitalized", response.url_query)
+            records = response.json_data["result"]["records"]
+            self.assertListEqual(records, [{field: record[field] for field in fields}
+                                           for record in full_response.json_data["result"]["records"]])
+            self.assertListEqual([field["id"] for field in response.json_data["result"]["fields"]], list(fields))
+            self.assertLess(response.size * 3, full_response.size)
+
+            town = records[0]["town"]
+            json_data = api_data_il.get_data_by_resource_id(ResourceId.AREA_RESOURCE_ID, include_total=True,
+                                                            fields=("town", "date"), filters={"town": [town]},
+                                                            sort="date desc")
+            self.assertEqual(json_data["result"]["total"], [record["town"] for record in records].count(town))
+            dates = [record["date"] for record in json_data["result"]["records"]]
+            self.assertListEqual(dates, sorted(dates, reverse=True))
+            self.assertEqual(api_data_il.get_total_records(ResourceId.AREA_RESOURCE_ID, filters={"town": town}),
+                             json_data["result"]["total"])
+
+            towns = api_data_il.fetch(ResourceId.AREA_RESOURCE_ID, fields=["town"], distinct=True, sort="town")
+            self.assertListEqual([record["town"] for record in towns.json_data["result"]["records"]],
+                                 sorted({record["town"] for record in records}))
+
+            with self.assertRaises(ApiHttpError) as error_context:
+                api_data_il.stream_data_frame(ResourceId.AREA_RESOURCE_ID, fields=["no_such_column"])
+            self.assertEqual(error_context.exception.status_code, 409)
+            with self.assertRaises(TypeError):
+                api_data_il.fetch(ResourceId.AREA_RESOURCE_ID, filters=[("town", town)])
+
+
+if __name__ == '__main__':
+    unittest.main()
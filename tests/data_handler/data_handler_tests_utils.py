@@ -25,9 +25,9 @@ class DataHandlerTestsUtils(unittest.TestCase):
         """ General base test for all methods """
         # Check instance creation
         self.assertIsInstance(data_handler, class_type)
-        # Check unequally of different memory addresses of copied df
-        data_dict = data_handler._get_clean_copy_df_data()
-        self.assertNotEqual(id(data_dict), id(data_handler.df))
+        # Check the _id column got dropped once at load & the read path doesn't copy the df
+        self.assertNotIn('_id', data_handler.df)
+        self.assertIs(data_handler._get_df_data(), data_handler.df)
 
     def _test_one_level_depth_dictionary(self,
                                               data: DefaultDict[str, Any] or
@@ -38,14 +38,14 @@ class DataHandlerTestsUtils(unittest.TestCase):
         """ Tests Dictionary with normal 1 level depth """
         # Check yield type as a generator
         self.assertIsInstance(data, type(_ for _ in range(0)))
+        data = dict(data)
 
-        for key, value in data:
+        for key, value in data.items():
             self.assertIsInstance(key, str)
             self.assertIsInstance(value, (int, float, str))
 
         # Check for values equality
-        for data_value, result_value in zip(data, results.values()):
-            self.assertDictEqual(data_value, result_value)
+        self.assertDictEqual(data, dict(results))
 
     def _test_two_level_depth_nested_dictionaries(self,
                   data: Generator[DefaultDict[str, DefaultDict[str, int]], None, None] or
@@ -0,0 +1,43 @@
+import unittest
+
+from benchmarks.suite import run, find_regressions, get_public_methods
+from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """ Tests for the Benchmark Suite.
+
+    Methods:
+        setUp(self): Announce of starting the class's tests.
+        test_run(self): Tests a single measurement of every data handler's construction & public methods & the api
+            client's requests against the stub server.
+        test_find_regressions(self): Tests only significant slowdowns from the previous run are regressions.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests """
+        print("testing Benchmark Suite...")
+
+    def test_run(self) -> None:
+        """ Tests a single measurement of every data handler's construction & public methods & the api client's
+        requests against the stub server """
+        results = run(scales=[1], repeat=1)
+        for data_handler_class in DataHandlerFactory.data_handlers_classes.values():
+            self.assertIsNotNone(results[f"1x/{data_handler_class.__name__}.__init__"])
+            for method_name in get_public_methods(data_handler_class):
+                if method_name != "get_data_by_date_range" or data_handler_class.date_column_name is not None:
+                    self.assertIn(f"1x/{data_handler_class.__name__}.{method_name}", results)
+
+        for method_name in ("fetch", "stream_data_frame", "iter_all_records"):
+            self.assertIsNotNone(results[f"1x/ApiDataIL.{method_name}"])
+
+    def test_find_regressions(self) -> None:
+        """ Tests only significant slowdowns from the previous run are regressions """
+        previous_results = {"a": 10.0, "b": 10.0, "c": 0.1, "d": None, "e": 10.0}
+        results = {"a": 10.5, "b": 20.0, "c": 0.5, "d": 50.0, "e": None, "f": 50.0}
+        self.assertDictEqual(find_regressions(results, previous_results, threshold=1.25), {"b": (10.0, 20.0)})
+
+
+if __name__ == '__main__':
+    unittest.main()
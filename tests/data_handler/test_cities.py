@@ -1,8 +1,13 @@
 from collections import defaultdict
 
+import pandas as pd
+
+from pandas.api.types import is_datetime64_any_dtype, is_integer_dtype
+
 from tests.data_handler.data_handler_tests_utils import DataHandlerTestsUtils
 from covid19_il.data_handler.data_handlers.cities import Cities
 from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.data_handler.enums.censoring_policy import CensoringPolicy
 
 
 class TestCities(DataHandlerTestsUtils):
@@ -13,6 +18,9 @@ class TestCities(DataHandlerTestsUtils):
         _check_base_step_of_all_methods(self): General base test for all methods.
         test_cities_by_date(self): Tests results of tests cities by specific date and its results as city's tuples.
         test_cases_statistics(self): Tests the test cases statistics data & type.
+        test_schema(self): Tests the schema's columns types which get converted once at load time.
+        test_censoring_policy(self): Tests the replacement of censored values by each censoring policy.
+        test_distinct_rows(self): Tests the distinct rows equal the keys of a group by over all of the columns.
 
     """
 
@@ -63,3 +71,48 @@ class TestCities(DataHandlerTestsUtils):
         data = self.data_handler_1.cases_statistics()
         # Data Validation
         self._test_two_level_depth_nested_dictionaries(data, results)
+        # a missing column yields "No Data" rather than the statistics of the columns before it
+        self.assertListEqual(list(self.data_handler_1._get_statistics_by_columns_names(
+            ('Cumulative_verified_cases', 'No_Such_Column'))), [("No Data", "")])
+
+    def test_schema(self) -> None:
+        """ Tests the schema's columns types which get converted once at load time """
+        typed_df = self.data_handler_1._typed_df
+        self.assertListEqual(list(typed_df.columns), list(Cities.schema.keys()))
+        self.assertTrue(is_datetime64_any_dtype(typed_df['Date']))
+        self.assertEqual(typed_df["City_Name"].dtype.name, "category")
+        for column_name in Cities.fields[3:]:
+            self.assertTrue(is_integer_dtype(typed_df[column_name]))
+
+    def test_censoring_policy(self) -> None:
+        """ Tests the replacement of censored values by each censoring policy """
+        data_handler = Cities(self.data_handler_1.logger, self.data_handler_1.main_data)
+        column = pd.Series(['<15', '12.0', 'NULL', '7', None, 'N'])
+        self.assertListEqual(data_handler._convert_column_to_int(column).tolist(), [14, 12, 14, 7, 14, 14])
+
+        data_handler.set_censoring_policy(CensoringPolicy.MIDPOINT)
+        self.assertListEqual(data_handler._convert_column_to_int(column).tolist(), [8, 12, 8, 7, 8, 8])
+
+        data_handler.set_censoring_policy(CensoringPolicy.SEEDED_FILL, censoring_seed=1)
+        seeded_fill = data_handler._convert_column_to_int(column)
+        self.assertListEqual(seeded_fill.tolist(), data_handler._convert_column_to_int(column).tolist())
+        self.assertTrue(seeded_fill[[0, 2, 4, 5]].between(*Cities.censoring_range).all())
+
+        data_handler.set_censoring_policy(CensoringPolicy.FIXED, censoring_value=0)
+        censored = data_handler.df['Cumulative_verified_cases'] == '<15'
+        self.assertTrue((data_handler._typed_df.loc[censored, 'Cumulative_verified_cases'] == 0).all())
+        with self.assertRaises(TypeError):
+            data_handler.set_censoring_policy(0)
+
+    def test_distinct_rows(self) -> None:
+        """ Tests the distinct rows equal the keys of a group by over all of the columns """
+        df = pd.concat([self.data_handler_1.df, self.data_handler_1.df.iloc[::-1]], ignore_index=True)
+        df.loc[3, "City_code"] = None
+        self.assertListEqual(self.data_handler_1._get_distinct_rows(df),
+                             list(df.groupby([*df.columns])["Date"].unique().keys()))
+        self.assertListEqual(self.data_handler_1._get_distinct_rows(df.iloc[:0]), [])
+
+        data_dict = self.data_handler_1._distinct_rows_to_dict(df[["City_Name", "Date", "Cumulated_deaths"]], (0, 1),
+                                                               lambda row: int(row[2]))
+        self.assertEqual(data_dict["אבו גוש"]["2020-10-03"], 0)
+        self.assertEqual(len(data_dict["אבו גוש"]), len(df[df["City_Name"] == "אבו גוש"]["Date"].unique()))
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
 from covid19_il.data_handler.data_handlers.area import Area
@@ -13,6 +14,7 @@ class TestDataHandlerFactory(unittest.TestCase):
         def tearDown(self): announce of finishing the class's tests
         def get_instance(cls, required_resource_id: ResourceId, json_data: dict = None): test data handlers class
             instance creation and memoization dictionary's behaviour as "singleton".
+        def test_refresh(self): test swapping in a refreshed instance while a pinned version stays readable.
 
     """
 
@@ -36,3 +38,22 @@ class TestDataHandlerFactory(unittest.TestCase):
         self.assertIsInstance(self.data_handler_3, Area)
         # Checks that the dictionary works and returns the same object - memoization
         self.assertEqual(id(self.data_handler_1), id(self.data_handler_2), id(self.data_handler_3))
+
+    def test_refresh(self) -> None:
+        """ Test swapping in a refreshed instance while a pinned version stays readable """
+        refreshed_json_data = {"result": {"records": [{"_id": 1, "town": "a"}], "total": 1}}
+        with patch.dict(DataHandlerFactory.data_resources, {ResourceId.AREA_RESOURCE_ID.value: self.data_handler_1}):
+            version = DataHandlerFactory.get_version(ResourceId.AREA_RESOURCE_ID)
+            with DataHandlerFactory.pinned_instance(ResourceId.AREA_RESOURCE_ID) as pinned_data_handler:
+                self.assertEqual(DataHandlerFactory.refresh(ResourceId.AREA_RESOURCE_ID, refreshed_json_data)
+                                 .result(), version + 1)
+                # pinned readers keep the former version, new readers get the refreshed one
+                self.assertIs(pinned_data_handler, self.data_handler_1)
+                self.assertIn((ResourceId.AREA_RESOURCE_ID.value, version), DataHandlerFactory._pinned_versions)
+                data_handler = DataHandlerFactory.get_instance(ResourceId.AREA_RESOURCE_ID)
+                self.assertIsInstance(data_handler, Area)
+                self.assertEqual(data_handler.max_id, 1)
+            self.assertNotIn((ResourceId.AREA_RESOURCE_ID.value, version), DataHandlerFactory._pinned_versions)
+            with self.assertRaises(ValueError):
+                DataHandlerFactory.refresh(ResourceId.AREA_RESOURCE_ID, {"result": None}).result()
+            self.assertEqual(DataHandlerFactory.get_version(ResourceId.AREA_RESOURCE_ID), version + 1)
@@ -0,0 +1,66 @@
+import unittest
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from tests.data_handler.data_handler_tests_utils import DataHandlerTestsUtils
+from covid19_il.data_handler.date_index import DateIndex
+from covid19_il.data_handler.enums.resource_id import ResourceId
+
+
+class TestDateIndex(DataHandlerTestsUtils):
+    """ Tests for the Data Handlers' Sorted Date Index.
+
+    Methods:
+        setUp(self): Announce of starting the class's tests, initialize cities data handler's instance.
+        test_positions(self): Tests the positions of a date & of a dates range equal a full scan's positions.
+        test_data_by_date_range(self): Tests the handler's rows of a dates range & its invalidation on data changes.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests, initialize cities data handler's instance """
+        print("testing DateIndex Class...")
+        self.data_handler_1 = self._init_mocked_data_handler(json_file_path="json_files/cities_mocked_data.json",
+                                                             resource_id_enum=ResourceId.CITIES_POPULATION_RESOURCE_ID)
+
+    def test_positions(self) -> None:
+        """ Tests the positions of a date & of a dates range equal a full scan's positions """
+        dates = pd.to_datetime(pd.Series(["2020-10-03", None, "2020-10-01", "2020-10-03", "2020-10-02"]))
+        date_index = DateIndex(dates)
+        self.assertEqual(len(date_index), 4)
+        self.assertListEqual(date_index.get_positions("2020-10-03").tolist(), [0, 3])
+        self.assertListEqual(date_index.get_positions("2020-09-30").tolist(), [])
+        self.assertListEqual(date_index.get_range_positions("2020-10-02", "2020-10-03").tolist(), [0, 3, 4])
+        self.assertListEqual(date_index.get_range_positions(end_date="2020-10-01").tolist(), [2])
+        self.assertListEqual(date_index.get_range_positions().tolist(), [0, 2, 3, 4])
+        self.assertListEqual(date_index.unindexed_positions.tolist(), [1])
+
+        with self.assertRaises(ValueError):
+            date_index.get_positions("2020-13-45")
+
+    def test_data_by_date_range(self) -> None:
+        """ Tests the handler's rows of a dates range & its invalidation on data changes """
+        df = self.data_handler_1.df
+        assert_frame_equal(self.data_handler_1.get_data_by_date_range("2020-05-15", "2020-05-16"),
+                           df[df["Date"].between("2020-05-15", "2020-05-16")])
+        assert_frame_equal(self.data_handler_1.get_data_by_date_range(start_date="2020-10-19"),
+                           df[df["Date"] >= "2020-10-19"])
+        self.assertTrue(self.data_handler_1.get_data_by_date_range("2021-01-01").empty)
+        self.assertEqual(len(self.data_handler_1._get_df_data_by_date("Date", "2020-3-11")), 0)
+
+        with self.assertRaises(ValueError):
+            self.data_handler_1.get_data_by_date_range("2020-13-45")
+        with self.assertRaises(KeyError):
+            self.data_handler_1.get_data_by_date_range(column_name="date")
+
+        ids = self.data_handler_1.ids
+        self.data_handler_1.df = df[df["Date"] != "2020-10-20"]
+        try:
+            self.assertTrue(self.data_handler_1.get_data_by_date_range(start_date="2020-10-20").empty)
+        finally:
+            self.data_handler_1.df = df if ids is None else df.assign(_id=ids)
+
+
+if __name__ == '__main__':
+    unittest.main()
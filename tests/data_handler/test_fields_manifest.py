@@ -0,0 +1,83 @@
+import unittest
+import copy
+import json
+from typing import Any
+
+from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
+from covid19_il.data_handler.data_handlers.area import Area
+from covid19_il.data_handler.data_handlers.hospitalized import Hospitalized
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+
+
+def _to_plain(item: Any) -> Any:
+    """ Converts a handler's result item to comparable builtins, e.g. defaultdicts to dicts """
+    if isinstance(item, dict):
+        return {key: _to_plain(value) for key, value in item.items()}
+    if isinstance(item, (list, tuple)):
+        return [_to_plain(value) for value in item]
+    return item
+
+
+class TestFieldsManifest(unittest.TestCase):
+    """ Tests for the Data Handlers' Fields Manifests.
+
+    Methods:
+        setUp(self): Announce of starting the class's tests.
+        test_required_fields(self): Tests the union of the methods' columns & the methods which read every column.
+        test_projected_data(self): Tests every listed method's result on the manifest's columns only equals its
+            result on every column.
+
+    """
+
+    json_files_names = {ResourceId.AREA_RESOURCE_ID: "area",
+                        ResourceId.QUARANTINE_RESOURCE_ID: "quarantine",
+                        ResourceId.LAB_TESTS_RESOURCE_ID: "lab_tests",
+                        ResourceId.TESTED_INDIVIDUALS_RESOURCE_ID: "tested_individuals",
+                        ResourceId.RECOVERED_RESOURCE_ID: "recovered",
+                        ResourceId.AGE_GENDER_DATA_RESOURCE_ID: "age_gender",
+                        ResourceId.MEDICAL_STAFF_MORBIDITY_RESOURCE_ID: "medical_staff_morbidity",
+                        ResourceId.DEATHS_DATA_RESOURCE_ID: "deaths",
+                        ResourceId.YOUNG_POPULATION_RESOURCE_ID: "young_population",
+                        ResourceId.CITIES_POPULATION_RESOURCE_ID: "cities"}
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests """
+        print("testing Fields Manifests...")
+
+    def test_required_fields(self) -> None:
+        """ Tests the union of the methods' columns & the methods which read every column """
+        self.assertTupleEqual(Area.get_required_fields("get_hospitalized_amount", "get_accumulated_tested_by_town"),
+                              ('_id', 'town', 'accumulated_hospitalized', 'accumulated_tested'))
+        self.assertTupleEqual(DataHandlerFactory.get_required_fields(ResourceId.AREA_RESOURCE_ID,
+                                                                     "get_hospitalized_amount"),
+                              ('_id', 'town', 'accumulated_hospitalized'))
+        self.assertIsNone(Area.get_required_fields("get_hospitalized_amount", "get_data_by_event_type"))
+        self.assertIsNone(Hospitalized.get_required_fields("hospitalized_total_stats"))
+        for method_name in ("_get_data_by_column", "no_such_method", "schema"):
+            with self.assertRaises(ValueError):
+                Area.get_required_fields(method_name)
+
+    def test_projected_data(self) -> None:
+        """ Tests every listed method's result on the manifest's columns only equals its result on every column """
+        for resource_id, json_file_name in self.json_files_names.items():
+            with open(f"json_files/{json_file_name}_mocked_data.json") as json_file:
+                json_data = json.load(json_file)
+            data_handler_class = DataHandlerFactory.data_handlers_classes[resource_id.value]
+            date = json_data["result"]["records"][0].get(data_handler_class.date_column_name)
+            for method_name in data_handler_class.fields_manifest:
+                fields = data_handler_class.get_required_fields(method_name)
+                projected_json_data = copy.deepcopy(json_data)
+                projected_json_data["result"]["records"] = [{field: record.get(field) for field in fields}
+                                                            for record in json_data["result"]["records"]]
+                args = (date[:10],) if method_name.endswith("by_date") else ()
+                with self.subTest(method_name=f"{data_handler_class.__name__}.{method_name}"):
+                    result = list(getattr(data_handler_class(Logger().logger, json_data), method_name)(*args))
+                    projected_result = list(getattr(data_handler_class(Logger().logger, projected_json_data),
+                                                    method_name)(*args))
+                    self.assertEqual(repr(_to_plain(projected_result)), repr(_to_plain(result)))
+                    self.assertNotIn("No Data", repr(result[:1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -41,7 +41,7 @@ class TestRecovered(DataHandlerTestsUtils):
         """ Tests results data & type of test days from pos to recovery stats """
         # Get Data
         data = self.data_handler_1.days_from_pos_to_recovery_stats()
-        results = {'min': 1, 'max': 9, 'mean': 2.29}
+        results = {'min': 2, 'max': 27, 'mean': 10.76}
         # Data Validation
         self._test_one_level_depth_dictionary(data, results)
 
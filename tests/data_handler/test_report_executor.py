@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import patch
+
+from tests.data_handler.data_handler_tests_utils import DataHandlerTestsUtils
+from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.data_handler.report_executor import ReportExecutor, pa, _to_plain
+from covid19_il.logger.logger import Logger
+
+
+@unittest.skipIf(pa is None, "ReportExecutor requires the optional pyarrow dependency")
+class TestReportExecutor(DataHandlerTestsUtils):
+    """ Tests for the Parallel Report Executor.
+
+    Methods:
+        setUp(self): Announce of starting the class's tests, initialize cities' & deaths' data handlers' instances.
+        test_run(self): Tests the parallel results equal the in-process results by the tasks' order.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests, initialize cities' & deaths' data handlers' instances """
+        print("testing ReportExecutor Class...")
+        self.data_handler_1 = self._init_mocked_data_handler(json_file_path="json_files/cities_mocked_data.json",
+                                                             resource_id_enum=ResourceId.CITIES_POPULATION_RESOURCE_ID)
+        self.data_handler_2 = self._init_mocked_data_handler(json_file_path="json_files/deaths_mocked_data.json",
+                                                             resource_id_enum=ResourceId.DEATHS_DATA_RESOURCE_ID)
+
+    def test_run(self) -> None:
+        """ Tests the parallel results equal the in-process results by the tasks' order """
+        tasks = [ReportExecutor.task(ResourceId.CITIES_POPULATION_RESOURCE_ID, "top_cases_in_cities"),
+                 ReportExecutor.task(ResourceId.DEATHS_DATA_RESOURCE_ID, "amount_of_deaths"),
+                 ReportExecutor.task(ResourceId.CITIES_POPULATION_RESOURCE_ID, "cities_by_date", ("2020-10-03",))]
+        data_handlers = {ResourceId.CITIES_POPULATION_RESOURCE_ID: self.data_handler_1,
+                         ResourceId.DEATHS_DATA_RESOURCE_ID: self.data_handler_2}
+        results = ReportExecutor(Logger().logger, max_workers=2).run(tasks)
+        for task, result in zip(tasks, results):
+            data_handler = data_handlers[task.resource_id]
+            expected_result = [_to_plain(item) for item in getattr(data_handler, task.method_name)(*task.args)]
+            self.assertListEqual(result, expected_result)
+
+        with patch.dict(DataHandlerFactory.data_resources, clear=True):
+            with self.assertRaises(ValueError):
+                ReportExecutor(Logger().logger, max_workers=1).run(tasks)
+            self.assertListEqual(ReportExecutor(Logger().logger, max_workers=1).run(tasks[:1], data_handlers),
+                                 results[:1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+from tests.data_handler.data_handler_tests_utils import DataHandlerTestsUtils
+from covid19_il.data_handler.data_handlers.cities import Cities
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.data_handler.result_cache import ResultCache
+
+
+class TestResultCache(DataHandlerTestsUtils):
+    """ Tests for the Data Handlers' Result Cache.
+
+    Methods:
+        setUp(self): Announce of starting the class's tests, initialize cities data handler's instance.
+        test_fresh_generator_per_call(self): Tests a cached method yields the full result on every call.
+        test_invalidation(self): Tests the cached results get dropped when the handler's data changes.
+        test_bounds(self): Tests the size & ttl bounds of the cache.
+        test_stale_put(self): Tests a result which got computed before a clear doesn't get cached.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests, initialize cities data handler's instance """
+        print("testing ResultCache Class...")
+        self.data_handler_1 = self._init_mocked_data_handler(json_file_path="json_files/cities_mocked_data.json",
+                                                             resource_id_enum=ResourceId.CITIES_POPULATION_RESOURCE_ID)
+        self.data_handler_1.result_cache.clear()
+
+    def test_fresh_generator_per_call(self) -> None:
+        """ Tests a cached method yields the full result on every call """
+        first = list(self.data_handler_1.top_cases_in_cities())
+        self.assertEqual(len(self.data_handler_1.result_cache), 1)
+        second = self.data_handler_1.top_cases_in_cities()
+        self.assertIsInstance(second, type(_ for _ in range(0)))
+        second = list(second)
+        self.assertListEqual(second, first)
+        # the cached result's items get yielded as they are & can't be changed
+        self.assertIs(next(self.data_handler_1.top_cases_in_cities()), second[0])
+        with self.assertRaises(TypeError):
+            second[0][1].clear()
+        self.assertListEqual(list(self.data_handler_1.top_cases_in_cities()), first)
+
+    def test_invalidation(self) -> None:
+        """ Tests the cached results get dropped when the handler's data changes """
+        list(self.data_handler_1.cases_statistics())
+        self.assertEqual(len(self.data_handler_1.result_cache), 1)
+        self.data_handler_1.df = self.data_handler_1.df
+        self.assertEqual(len(self.data_handler_1.result_cache), 0)
+
+    def test_bounds(self) -> None:
+        """ Tests the size & ttl bounds of the cache """
+        result_cache = ResultCache(max_size=2, ttl=60)
+        result_cache.put("a", (1,))
+        result_cache.put("b", (2,))
+        self.assertTupleEqual(result_cache.get("a"), (1,))
+        result_cache.put("c", (3,))
+        self.assertIsNone(result_cache.get("b"))
+        self.assertTupleEqual(result_cache.get("a"), (1,))
+        with patch("covid19_il.data_handler.result_cache.time.monotonic", return_value=float("inf")):
+            self.assertIsNone(result_cache.get("a"))
+        self.assertEqual(len(result_cache), 1)
+        self.assertIsInstance(self.data_handler_1, Cities)
+
+    def test_stale_put(self) -> None:
+        """ Tests a result which got computed before a clear doesn't get cached """
+        result_cache = ResultCache()
+        generation = result_cache.generation
+        result_cache.clear()
+        result_cache.put("a", (1,), generation)
+        self.assertIsNone(result_cache.get("a"))
+        result_cache.put("a", (1,), result_cache.generation)
+        self.assertTupleEqual(result_cache.get("a"), (1,))
+
+
+if __name__ == '__main__':
+    unittest.main()
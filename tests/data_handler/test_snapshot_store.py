@@ -0,0 +1,64 @@
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pandas.testing import assert_frame_equal
+
+from tests.data_handler.data_handler_tests_utils import DataHandlerTestsUtils
+from covid19_il.data_handler.data_handlers.cities import Cities
+from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.data_handler.snapshot_store import SnapshotStore, feather
+from covid19_il.logger.logger import Logger
+
+
+@unittest.skipIf(feather is None, "SnapshotStore requires the optional pyarrow dependency")
+class TestSnapshotStore(DataHandlerTestsUtils):
+    """ Tests for the Columnar Snapshot Store.
+
+    Methods:
+        setUp(self): Announce of starting the class's tests, initialize snapshot store's & cities data handler's
+            instances.
+        test_save_and_load(self): Tests storing & memory-mapped or full loading of a data frame.
+        test_factory_snapshot(self): Tests the factory's instance creation from a stored snapshot.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests, initialize snapshot store's & cities data handler's instances """
+        print("testing SnapshotStore Class...")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.snapshot_store = SnapshotStore(Logger().logger, store_dir=self.temp_dir.name)
+        self.data_handler_1 = self._init_mocked_data_handler(json_file_path="json_files/cities_mocked_data.json",
+                                                             resource_id_enum=ResourceId.CITIES_POPULATION_RESOURCE_ID)
+
+    def test_save_and_load(self) -> None:
+        """ Tests storing & memory-mapped or full loading of a data frame """
+        self.assertIsNone(self.snapshot_store.load(ResourceId.CITIES_POPULATION_RESOURCE_ID))
+        self.snapshot_store.save(ResourceId.CITIES_POPULATION_RESOURCE_ID, self.data_handler_1.df)
+        self.assertListEqual(self.snapshot_store.stored_resources(), [ResourceId.CITIES_POPULATION_RESOURCE_ID])
+        assert_frame_equal(self.snapshot_store.load(ResourceId.CITIES_POPULATION_RESOURCE_ID),
+                           self.data_handler_1.df)
+        assert_frame_equal(self.snapshot_store.load(ResourceId.CITIES_POPULATION_RESOURCE_ID, memory_map=False),
+                           self.data_handler_1.df)
+        with self.assertRaises(TypeError):
+            self.snapshot_store.save(ResourceId.CITIES_POPULATION_RESOURCE_ID, {})
+        self.snapshot_store.remove(ResourceId.CITIES_POPULATION_RESOURCE_ID)
+        self.assertFalse(self.snapshot_store.exists(ResourceId.CITIES_POPULATION_RESOURCE_ID))
+
+    def test_factory_snapshot(self) -> None:
+        """ Tests the factory's instance creation from a stored snapshot """
+        self.assertTrue(DataHandlerFactory.save_snapshot(ResourceId.CITIES_POPULATION_RESOURCE_ID,
+                                                         self.snapshot_store))
+        with patch.dict(DataHandlerFactory.data_resources, clear=True):
+            self.assertIsNone(DataHandlerFactory.get_instance_from_snapshot(ResourceId.AREA_RESOURCE_ID,
+                                                                            self.snapshot_store))
+            data_handler = DataHandlerFactory.get_instance_from_snapshot(ResourceId.CITIES_POPULATION_RESOURCE_ID,
+                                                                         self.snapshot_store)
+            self.assertIsInstance(data_handler, Cities)
+            self.assertIsNot(data_handler, self.data_handler_1)
+            assert_frame_equal(data_handler.df, self.data_handler_1.df)
+            self.assertEqual(data_handler.max_id, self.data_handler_1.max_id)
+            self.assertListEqual(list(data_handler._get_statistics_by_columns_names(Cities.fields[3:])),
+                                 list(self.data_handler_1._get_statistics_by_columns_names(Cities.fields[3:])))
@@ -0,0 +1,109 @@
+import unittest
+import logging
+import os
+import queue
+import tempfile
+
+from covid19_il.logger.logger import Logger, _LazyQueueHandler
+
+
+class _Payload:
+    """ Logged argument which counts its formattings """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.formattings = 0
+
+    def __str__(self) -> str:
+        self.formattings += 1
+        return "x" * self.size
+
+
+class TestLogger(unittest.TestCase):
+    """ Tests for the Universal Logger.
+
+    Methods:
+        setUp(self): Announce of starting the class's tests, configure the logger to a temporary log file.
+        tearDown(self): Restore the logger's default configuration.
+        test_singleton(self): Tests constructing the logger again neither replaces nor duplicates its handlers.
+        test_lazy_queue_handler(self): Tests records get enqueued without formatting their messages.
+        test_queued_logging(self): Tests the queued records get truncated & written by the listener thread.
+        test_rotation_and_levels(self): Tests the log file's rollover & the handlers' levels.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests, configure the logger to a temporary log file """
+        print("testing Logger Class...")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_file_path = os.path.join(self.temp_dir.name, "test.log")
+        self.logger = Logger()
+        self.logger.configure(logging.DEBUG, log_file_path=self.log_file_path, max_message_length=100)
+
+    def tearDown(self) -> None:
+        """ Restore the logger's default configuration """
+        self.logger.configure()
+        self.temp_dir.cleanup()
+
+    def _read_log_file(self) -> str:
+        """ Returns the log file's content after writing the queued records """
+        self.logger.flush()
+        with open(self.log_file_path, encoding="utf-8") as log_file:
+            return log_file.read()
+
+    def test_singleton(self) -> None:
+        """ Tests constructing the logger again neither replaces nor duplicates its handlers """
+        handlers = list(self.logger.logger.handlers)
+        self.assertIs(Logger(logging.INFO), self.logger)
+        self.assertListEqual(self.logger.logger.handlers, handlers)
+        self.assertEqual(self.logger.logger.level, logging.DEBUG)
+        self.assertTrue(self.logger.queued)
+
+    def test_lazy_queue_handler(self) -> None:
+        """ Tests records get enqueued without formatting their messages """
+        records_queue = queue.SimpleQueue()
+        payload = _Payload(10)
+        record = logging.LogRecord("root", logging.DEBUG, __file__, 0, "json data is : %s", (payload,), None)
+        _LazyQueueHandler(records_queue).handle(record)
+        self.assertIs(records_queue.get_nowait(), record)
+        self.assertEqual(payload.formattings, 0)
+        self.assertEqual(record.getMessage(), "json data is : xxxxxxxxxx")
+
+    def test_queued_logging(self) -> None:
+        """ Tests the queued records get truncated & written by the listener thread """
+        self.logger.logger.debug("json data is : %s", _Payload(500))
+        self.logger.logger.info("short message")
+        log_lines = self._read_log_file().splitlines()
+        self.assertIn(f"json data is : {'x' * 85}... [truncated 415 characters]", log_lines[0])
+        self.assertTrue(log_lines[1].endswith("INFO root: short message"))
+
+        self.logger.set_level(logging.INFO)
+        payload = _Payload(10)
+        self.logger.logger.debug("json data is : %s", payload)
+        self.assertEqual(payload.formattings, 0)
+        self.assertEqual(len(self._read_log_file().splitlines()), 2)
+
+        self.logger.configure(queued=False, log_file_path=self.log_file_path)
+        self.assertFalse(self.logger.queued)
+        self.logger.logger.warning("synchronous message")
+        self.assertIn("synchronous message", self._read_log_file())
+
+    def test_rotation_and_levels(self) -> None:
+        """ Tests the log file's rollover & the handlers' levels """
+        self.logger.configure(log_file_path=self.log_file_path, max_bytes=200, backup_count=2,
+                              file_level=logging.WARNING)
+        self.assertEqual(self.logger.logger.level, logging.INFO)
+        for number in range(10):
+            self.logger.logger.warning("message number %d", number)
+        self.logger.logger.info("info message")
+        self.assertIn("message number 9", self._read_log_file())
+        self.assertNotIn("info message", self._read_log_file())
+        self.assertListEqual(sorted(os.listdir(self.temp_dir.name)), ["test.log", "test.log.1", "test.log.2"])
+
+        self.logger.set_level(logging.DEBUG, file_level=logging.DEBUG)
+        self.logger.logger.info("info message")
+        self.assertIn("info message", self._read_log_file())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+import json
+import os
+
+from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+from covid19_il.metrics.metrics import Metrics, Histogram
+from covid19_il.testing.stub_ckan_server import StubCkanServer
+
+
+class TestMetrics(unittest.TestCase):
+    """ Tests for the package's Metrics.
+
+    Methods:
+        setUp(self): Announce of starting the class's tests, enable & reset the metrics.
+        tearDown(self): Disable & reset the metrics.
+        test_histogram(self): Tests the cumulative buckets, sum & count of a histogram.
+        test_export(self): Tests the Prometheus' text & json exports, including the labels' escaping.
+        test_disabled(self): Tests nothing gets recorded while the metrics are disabled.
+        test_data_handler_methods(self): Tests the handlers' methods latency, items & result cache's hits.
+        test_api_requests(self): Tests the api client's requests latency, sizes & response cache's results.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests, enable & reset the metrics """
+        print("testing Metrics Class...")
+        self.metrics = Metrics()
+        self.metrics.reset()
+        self.metrics.enable()
+
+    def tearDown(self) -> None:
+        """ Disable & reset the metrics """
+        self.metrics.disable()
+        self.metrics.reset()
+
+    def test_histogram(self) -> None:
+        """ Tests the cumulative buckets, sum & count of a histogram """
+        histogram = Histogram((10, 1, 100))
+        for value in (0.5, 1, 5, 50, 500):
+            histogram.observe(value)
+        self.assertDictEqual(histogram.to_dict(), {"buckets": {"1": 2, "10": 3, "100": 4, "+Inf": 5},
+                                                   "sum": 556.5, "count": 5})
+        self.assertIs(Metrics(), self.metrics)
+
+    def test_export(self) -> None:
+        """ Tests the Prometheus' text & json exports, including the labels' escaping """
+        self.metrics.observe("api_request_seconds", 0.02, (0.01, 0.1), action="datastore_search", status=200)
+        self.metrics.increment("api_cache_total", result='"hit"\n')
+        self.metrics.increment("api_cache_total", 2, result='"hit"\n')
+        self.assertEqual(self.metrics.get_counter("api_cache_total", result='"hit"\n'), 3)
+        self.assertEqual(self.metrics.get_histogram("api_request_seconds", status=200,
+                                                    action="datastore_search").count, 1)
+
+        self.assertListEqual(self.metrics.to_prometheus().splitlines(), [
+            "# TYPE covid19_il_api_request_seconds histogram",
+            'covid19_il_api_request_seconds_bucket{action="datastore_search",status="200",le="0.01"} 0',
+            'covid19_il_api_request_seconds_bucket{action="datastore_search",status="200",le="0.1"} 1',
+            'covid19_il_api_request_seconds_bucket{action="datastore_search",status="200",le="+Inf"} 1',
+            'covid19_il_api_request_seconds_sum{action="datastore_search",status="200"} 0.02',
+            'covid19_il_api_request_seconds_count{action="datastore_search",status="200"} 1',
+            "# TYPE covid19_il_api_cache_total counter",
+            'covid19_il_api_cache_total{result="\\"hit\\"\\n"} 3'])
+
+        metrics = json.loads(self.metrics.to_json())
+        self.assertListEqual(metrics["counters"]["covid19_il_api_cache_total"],
+                             [{"labels": {"result": '"hit"\n'}, "value": 3}])
+        self.assertEqual(metrics["histograms"]["covid19_il_api_request_seconds"][0]["sum"], 0.02)
+
+    def test_disabled(self) -> None:
+        """ Tests nothing gets recorded while the metrics are disabled """
+        self.metrics.disable()
+        self.metrics.increment("api_cache_total", result="hit")
+        with self.metrics.timer("api_stream_parse_seconds"):
+            pass
+        self.assertEqual(self.metrics.to_prometheus(), "")
+        self.assertIsNone(self.metrics.get_histogram("api_stream_parse_seconds"))
+
+    def test_data_handler_methods(self) -> None:
+        """ Tests the handlers' methods latency, items & result cache's hits """
+        json_file_path = os.path.join(os.path.dirname(__file__), "..", "data_handler", "json_files",
+                                      "cities_mocked_data.json")
+        with open(json_file_path) as json_file:
+            cities = DataHandlerFactory.get_instance(ResourceId.CITIES_POPULATION_RESOURCE_ID, json.load(json_file))
+        cities.result_cache.clear()
+        self.assertEqual(self.metrics.get_histogram("handler_json_normalize_seconds", handler="Cities").count, 1)
+
+        items = list(cities.top_cases_in_cities())
+        list(cities.top_cases_in_cities())
+        histogram = self.metrics.get_histogram("handler_method_items", handler="Cities",
+                                               method="top_cases_in_cities")
+        self.assertEqual(histogram.count, 2)
+        self.assertEqual(histogram.sum, 2 * len(items))
+        self.assertEqual(self.metrics.get_histogram("handler_method_seconds", handler="Cities",
+                                                    method="top_cases_in_cities").count, 2)
+        for result in ("miss", "hit"):
+            self.assertEqual(self.metrics.get_counter("handler_result_cache_total", handler="Cities",
+                                                      method="top_cases_in_cities", result=result), 1)
+
+        # a generator's observation is recorded once it's exhausted
+        generator = cities.cases_statistics()
+        self.assertIsNone(self.metrics.get_histogram("handler_method_seconds", handler="Cities",
+                                                     method="cases_statistics"))
+        list(generator)
+        self.assertIsNotNone(self.metrics.get_histogram("handler_method_seconds", handler="Cities",
+                                                        method="cases_statistics"))
+
+    def test_api_requests(self) -> None:
+        """ Tests the api client's requests latency, sizes & response cache's results """
+        records = [{"_id": _id, "value": _id} for _id in range(1, 11)]
+        with StubCkanServer() as stub_ckan_server:
+            stub_ckan_server.add_resource(ResourceId.LAB_TESTS_RESOURCE_ID, {"result": {"records": records}})
+            stub_ckan_server.fail_next_requests(1, status=503)
+            with ApiDataIL(Logger().logger, base_url=stub_ckan_server.base_url) as api_data_il:
+                self.assertEqual(api_data_il.fetch(ResourceId.LAB_TESTS_RESOURCE_ID).status, 200)
+                df, _ = api_data_il.stream_data_frame(ResourceId.LAB_TESTS_RESOURCE_ID)
+
+        for status in (200, 503):
+            self.assertGreaterEqual(self.metrics.get_histogram("api_request_seconds", action="datastore_search",
+                                                               status=status).count, 1)
+        self.assertEqual(self.metrics.get_counter("api_retries_total", action="datastore_search"), 1)
+        self.assertGreater(self.metrics.get_histogram("api_response_bytes", action="datastore_search").sum, 0)
+        self.assertEqual(self.metrics.get_histogram("api_stream_rows").sum, len(df))
+        self.assertEqual(self.metrics.get_histogram("api_stream_parse_seconds").count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+import json
+import os
+import tempfile
+
+from covid19_il.api_handler.api.api_data_il import ApiDataIL
+from covid19_il.data_handler.data_handlers_factory.data_handler_factory import DataHandlerFactory
+from covid19_il.data_handler.enums.resource_id import ResourceId
+from covid19_il.logger.logger import Logger
+from covid19_il.profiling.profiler import Profiler
+from covid19_il.testing.stub_ckan_server import StubCkanServer
+
+
+class TestProfiler(unittest.TestCase):
+    """ Tests for the package's Profiler.
+
+    Methods:
+        setUp(self): Announce of starting the class's tests, initialize cities data handler's instance.
+        tearDown(self): Disable the profiler & remove the reports' directory.
+        test_targets(self): Tests only the targets' calls get profiled, a nested call within the outer call's report.
+        test_generator(self): Tests a generator's report gets written once it's exhausted or closed.
+        test_report(self): Tests the report's sections & the .prof stats file.
+        test_api_request(self): Tests the api client's get request gets profiled.
+
+    """
+
+    def setUp(self) -> None:
+        """ Announce of starting the class's tests, initialize cities data handler's instance """
+        print("testing Profiler Class...")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        json_file_path = os.path.join(os.path.dirname(__file__), "..", "data_handler", "json_files",
+                                      "cities_mocked_data.json")
+        with open(json_file_path) as json_file:
+            self.cities = DataHandlerFactory.get_instance(ResourceId.CITIES_POPULATION_RESOURCE_ID,
+                                                          json.load(json_file))
+        self.cities.result_cache.clear()
+        self.profiler = Profiler()
+
+    def tearDown(self) -> None:
+        """ Disable the profiler & remove the reports' directory """
+        self.profiler.disable()
+        self.temp_dir.cleanup()
+
+    def _get_reports(self) -> list:
+        """ Returns the text reports' contents by their order """
+        reports = []
+        for file_name in sorted(os.listdir(self.temp_dir.name)):
+            if file_name.endswith(".txt"):
+                with open(os.path.join(self.temp_dir.name, file_name), encoding="utf-8") as report_file:
+                    reports.append(report_file.read())
+        return reports
+
+    def test_targets(self) -> None:
+        """ Tests only the targets' calls get profiled, a nested call within the outer call's report """
+        self.assertIs(Profiler(), self.profiler)
+        self.profiler.enable(self.temp_dir.name, ["Cities.get_data_by_*", "Cities.set_censoring_policy"])
+        self.assertTrue(self.profiler.is_target("Cities.get_data_by_date_range"))
+        self.assertFalse(self.profiler.is_target("Deaths.get_data_by_date_range"))
+
+        self.cities.get_data_by_date_range("2020-01-01", "2021-01-01")
+        list(self.cities.top_cases_in_cities())
+        reports = self._get_reports()
+        self.assertEqual(len(reports), 1)
+        self.assertTrue(reports[0].startswith("profile of Cities.get_data_by_date_range: returned after "))
+
+        self.profiler.disable()
+        self.cities.get_data_by_date_range("2020-01-01", "2021-01-01")
+        self.assertEqual(len(self._get_reports()), 1)
+
+        with self.assertRaises(ValueError):
+            self.profiler.enable(self.temp_dir.name, top_n=0)
+
+    def test_generator(self) -> None:
+        """ Tests a generator's report gets written once it's exhausted or closed """
+        self.profiler.enable(self.temp_dir.name, ["Cities.top_cases_in_cities"])
+        generator = self.cities.top_cases_in_cities()
+        first_item = next(generator)
+        self.assertListEqual(self._get_reports(), [])
+        items = [first_item, *generator]
+        self.assertTrue(self._get_reports()[0].startswith(
+            f"profile of Cities.top_cases_in_cities: exhausted with {len(items)} items after "))
+
+        generator = self.cities.top_cases_in_cities()
+        next(generator)
+        generator.close()
+        self.assertTrue(self._get_reports()[1].startswith("profile of Cities.top_cases_in_cities: closed with 1 items"))
+
+    def test_report(self) -> None:
+        """ Tests the report's sections & the .prof stats file """
+        self.profiler.enable(self.temp_dir.name, top_n=5)
+        self.cities.get_data_by_date_range("2020-01-01", "2021-01-01")
+        report = self._get_reports()[0]
+        for section in ("peak traced memory: ", "top 5 functions by cumulative time:",
+                        "top 5 allocations' lines by retained size:", "pandas' copies:"):
+            self.assertIn(section, report)
+        self.assertIn("get_data_by_date_range", report)
+        self.assertEqual(len([file_name for file_name in os.listdir(self.temp_dir.name)
+                              if file_name.endswith(".prof")]), 1)
+
+    def test_api_request(self) -> None:
+        """ Tests the api client's get request gets profiled """
+        self.profiler.enable(self.temp_dir.name, ["ApiDataIL.*"])
+        records = [{"_id": _id, "value": _id} for _id in range(1, 11)]
+        with StubCkanServer() as stub_ckan_server:
+            stub_ckan_server.add_resource(ResourceId.LAB_TESTS_RESOURCE_ID, {"result": {"records": records}})
+            with ApiDataIL(Logger().logger, base_url=stub_ckan_server.base_url) as api_data_il:
+                json_data = api_data_il.get_data_by_resource_id(ResourceId.LAB_TESTS_RESOURCE_ID)
+        self.assertListEqual(json_data["result"]["records"], records)
+        reports = self._get_reports()
+        self.assertEqual(len(reports), 1)
+        self.assertTrue(reports[0].startswith("profile of ApiDataIL.get_data_by_resource_id: returned after "))
+
+
+if __name__ == '__main__':
+    unittest.main()